@@ -59,6 +59,9 @@ def _default_config() -> dict[str, Any]:
             'current_app_version': '1.0.0',
             'last_check_time': '',
             'skip_version': '',
+            'last_etag': '',
+            'last_etag_version': '',
+            'last_etag_skip': '',
         },
         'data_source': {
             'mode': 'manual',           # 'manual' | 'lan' | 'gdrive'
@@ -227,14 +227,14 @@ class ObjectType(IntEnum):
     IMAGE = 7
 
 
-@dataclass
+@dataclass(slots=True)
 class Point:
     """座標点 (PaperLayout.unit_mm 単位)。"""
     x: int
     y: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Rect:
     """矩形 (PaperLayout.unit_mm 単位)。"""
     left: int
@@ -251,7 +251,7 @@ class Rect:
         return self.bottom - self.top
 
 
-@dataclass
+@dataclass(slots=True)
 class FontInfo:
     """フォント情報。"""
     name: str = ''
@@ -263,7 +263,7 @@ class FontInfo:
     strikethrough: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class RawTag:
     """TLV のタグ経路と生ペイロードを保持する。"""
     path: list[int] = field(default_factory=list)
@@ -271,7 +271,7 @@ class RawTag:
     payload_len: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class TableColumn:
     """テーブルオブジェクトのカラム定義。"""
     field_id: int = 0
@@ -280,7 +280,7 @@ class TableColumn:
     header: str = ''     # カラムヘッダー文字列
 
 
-@dataclass
+@dataclass(slots=True)
 class MeiboArea:
     """名簿（繰り返しエリア）: 別レイアウトを指定位置に繰り返し配置する。"""
     origin_x: int = 0
@@ -293,7 +293,7 @@ class MeiboArea:
     direction: int = 0      # 0=縦並び, 1=横並び
 
 
-@dataclass
+@dataclass(slots=True)
 class EmbeddedImage:
     """埋め込み画像オブジェクト。"""
     rect: tuple[int, int, int, int] = (0, 0, 0, 0)
@@ -314,7 +314,7 @@ _PAPER_SIZES: dict[str, tuple[int, int]] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperLayout:
     """用紙配置情報（.lay のジオメトリタグから自動計算）。
 
@@ -396,7 +396,7 @@ def _detect_paper(p: PaperLayout) -> None:
         p.orientation = best_orient
 
 
-@dataclass
+@dataclass(slots=True)
 class LayoutObject:
     """1つのレイアウト要素。"""
     obj_type: ObjectType
@@ -423,7 +423,7 @@ class LayoutObject:
     raw_tags: list[RawTag] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class LayFile:
     """パース済み .lay ファイル。"""
     title: str = ''
@@ -6,19 +6,32 @@ LayFile オブジェクトを PIL (Pillow) で統一的に描画する。
 使用方法:
     from core.lay_renderer import PILBackend, LayRenderer, render_layout_to_image
     img = render_layout_to_image(lay, dpi=150)
+
+画像の縮小拡大 (LANCZOS) は Pillow-SIMD に差し替えると約 2 倍速くなる
+（API 互換: pip uninstall pillow && pip install pillow-simd）。
 """
 
 from __future__ import annotations
 
+import functools
+import logging
 import os
+import re
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import replace
 from io import BytesIO
+from itertools import accumulate
 
 from core.lay_parser import (
     EmbeddedImage,
     FontInfo,
     LayFile,
     LayoutObject,
+    MeiboArea,
     ObjectType,
     PaperLayout,
     Point,
@@ -27,13 +40,24 @@ from core.lay_parser import (
     resolve_field_display,
     resolve_field_name,
 )
+from utils.address import build_address, build_guardian_address
+from utils.date_fmt import DATE_KEYS, format_date
+from utils.wareki import to_wareki
 
 try:
+    import PIL
     from PIL import Image, ImageDraw, ImageFont
     HAS_PIL = True
 except ImportError:
     HAS_PIL = False
 
+logger = logging.getLogger(__name__)
+
+# Pillow-SIMD は '9.5.0.post1' のように .postN 付きのバージョンを名乗る
+HAS_PILLOW_SIMD = HAS_PIL and '.post' in PIL.__version__
+if HAS_PIL and not HAS_PILLOW_SIMD:
+    logger.debug('Pillow-SIMD 未導入のため通常の Pillow で画像リサイズします')
+
 # ── 定数 ─────────────────────────────────────────────────────────────────────
 
 # ページ背景・グリッド
@@ -77,6 +101,166 @@ _FALLBACK_FONT_PATHS = [
 ]
 
 
+# ピクセル座標 (x1, y1, x2, y2) — 矩形の左上・右下、または線分の両端
+PxCoords = tuple[float, float, float, float]
+
+
+# ── フォントキャッシュ ───────────────────────────────────────────────────────
+
+
+# 実在するフォントパスはモジュール読込時に 1 度だけ確認する
+_RESOLVED_FONT_MAP: dict[str, str] = {
+    name: path for name, path in _FONT_NAME_MAP.items() if os.path.exists(path)
+}
+_RESOLVED_FALLBACKS: list[str] = [
+    path for path in _FALLBACK_FONT_PATHS if os.path.exists(path)
+]
+if not _RESOLVED_FALLBACKS:
+    logger.warning('日本語フォントが見つかりません。PIL 組込みフォントで描画します')
+
+
+def _font_candidates(font_name: str) -> list[str]:
+    """フォント名に対応する実在フォントファイルの候補を優先順に返す。
+
+    font_name のマッピング先 → フォールバック候補の順。
+    """
+    named = _RESOLVED_FONT_MAP.get(font_name)
+    if not named:
+        return list(_RESOLVED_FALLBACKS)
+    return [named, *(p for p in _RESOLVED_FALLBACKS if p != named)]
+
+
+def _resolve_font_path(font_name: str) -> str | None:
+    """フォント名に対応する実在フォントファイルのパスを返す。
+
+    font_name のマッピング先 → フォールバック候補の順に探す。
+    どれも見つからなければ None。
+    """
+    candidates = _font_candidates(font_name)
+    return candidates[0] if candidates else None
+
+
+@functools.lru_cache(maxsize=128)
+def _truetype_cached(path: str, size_px: int) -> ImageFont.FreeTypeFont:
+    """(path, size_px) ごとに FreeType フォントを 1 度だけ開く。"""
+    return ImageFont.truetype(path, size=size_px)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_font() -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """PIL 組込みフォント（全候補が見つからない場合の最終手段）。"""
+    return ImageFont.load_default()
+
+
+def _load_font_cached(
+    font_name: str, size_px: int,
+) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """フォント名・ピクセルサイズからフォントを取得する（キャッシュ経由）。
+
+    候補フォントが壊れていて開けない場合は次の候補を試し、
+    すべて失敗したときだけ PIL 組込みフォント（日本語グリフなし）を使う。
+    """
+    for path in _font_candidates(font_name):
+        try:
+            return _truetype_cached(path, size_px)
+        except (OSError, IndexError):
+            continue
+    return _default_font()
+
+
+@functools.lru_cache(maxsize=1)
+def _measure_draw() -> ImageDraw.ImageDraw:
+    """テキスト計測専用の ImageDraw（描画先に依存しない計測に使う）。"""
+    return ImageDraw.Draw(Image.new('L', (1, 1)))
+
+
+@functools.lru_cache(maxsize=4096)
+def _text_bbox(
+    font: ImageFont.FreeTypeFont | ImageFont.ImageFont, text: str,
+) -> tuple[float, float, float, float]:
+    """(font, text) ごとのテキスト外接矩形を返す（原点 (0, 0) 基準）。"""
+    return _measure_draw().textbbox((0, 0), text, font=font)
+
+
+@functools.lru_cache(maxsize=4096)
+def _char_advance(
+    font: ImageFont.FreeTypeFont | ImageFont.ImageFont, ch: str,
+) -> float:
+    """1 文字の送り幅を返す（折り返し計算用）。"""
+    return font.getlength(ch)
+
+
+# グリフマスクのサブピクセル位置は FreeType の 26.6 固定小数点（1/64 px）に丸める
+_GLYPH_SUBPIXEL = 64
+# マスクキャッシュの上限（画素数 = バイト数）。300dpi のページ幅の文字列でも
+# 数百本は載り、それを超えたら古いものから捨てる
+_GLYPH_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# (font, text, qx, qy) → (L マスク画像, 描画位置からマスク左上までのずれ)
+_glyph_masks: OrderedDict[tuple, tuple[Image.Image, tuple[int, int]]] = OrderedDict()
+_glyph_mask_bytes = 0
+# render_layouts_to_images のスレッドから同時に触られる
+_glyph_lock = threading.Lock()
+
+
+def _glyph_mask(
+    font: ImageFont.FreeTypeFont, text: str, qx: int, qy: int,
+) -> tuple[Image.Image, tuple[int, int]]:
+    """(font, text, サブピクセル位置) ごとのラスタライズ済みマスクとずれを返す。
+
+    マスクは公開 API の ImageDraw.text で L 画像に描いて作る。
+    色はマスクに含まれないため、同じ文字列を別の色で描く場合も共有できる。
+    """
+    global _glyph_mask_bytes
+    key = (font, text, qx, qy)
+    with _glyph_lock:
+        hit = _glyph_masks.get(key)
+        if hit is not None:
+            _glyph_masks.move_to_end(key)
+            return hit
+
+    left, top, right, bottom = font.getbbox(text)
+    # はみ出すグリフ（負のベアリング）とサブピクセル分の余白を取る
+    pad_x, pad_y = max(0, -left) + 1, max(0, -top) + 1
+    mask = Image.new('L', (max(1, right + pad_x + 2), max(1, bottom + pad_y + 2)))
+    ImageDraw.Draw(mask).text(
+        (pad_x + qx / _GLYPH_SUBPIXEL, pad_y + qy / _GLYPH_SUBPIXEL),
+        text, fill=255, font=font,
+    )
+    entry = (mask, (-pad_x, -pad_y))
+
+    size = mask.width * mask.height
+    if size > _GLYPH_CACHE_MAX_BYTES:
+        return entry
+    with _glyph_lock:
+        if key not in _glyph_masks:
+            _glyph_masks[key] = entry
+            _glyph_mask_bytes += size
+            while _glyph_mask_bytes > _GLYPH_CACHE_MAX_BYTES:
+                old, _ = _glyph_masks.popitem(last=False)[1]
+                _glyph_mask_bytes -= old.width * old.height
+    return entry
+
+
+def _clear_glyph_masks() -> None:
+    """グリフマスクキャッシュを空にする。"""
+    global _glyph_mask_bytes
+    with _glyph_lock:
+        _glyph_masks.clear()
+        _glyph_mask_bytes = 0
+
+
+@functools.lru_cache(maxsize=16)
+def _decode_image(image_data: bytes) -> Image.Image:
+    """埋め込み画像のバイト列をデコードする（ページ・サイズをまたいで再利用）。
+
+    透過画像（パレット/LA 等も含む）は RGBA に統一して合成に使う。
+    返り値はキャッシュ共有のため変更しないこと。
+    """
+    img = Image.open(BytesIO(image_data))
+    return img.convert('RGBA')
+
+
 # ── 座標変換 ─────────────────────────────────────────────────────────────────
 
 
@@ -96,6 +280,21 @@ def canvas_to_model(
     return round((cx - offset_x) / scale), round((cy - offset_y) / scale)
 
 
+def _px_per_unit(unit_mm: float, dpi: float) -> float:
+    """モデル座標 1 単位あたりのピクセル数。"""
+    return unit_mm * dpi / 25.4
+
+
+def _page_size_px(lay: LayFile, dpi: int) -> tuple[int, int]:
+    """レイアウトを dpi で描画したときの画像サイズ (幅, 高さ) ピクセル。"""
+    unit_mm = lay.paper.unit_mm if lay.paper else 0.25
+    scale = _px_per_unit(unit_mm, max(1, dpi))
+    return (
+        max(1, int(lay.page_width * scale)),
+        max(1, int(lay.page_height * scale)),
+    )
+
+
 def model_to_printer(x: int, dpi: int, unit_mm: float = 0.25) -> int:
     """モデル座標 → プリンタドット。"""
     return round(x * unit_mm * dpi / 25.4)
@@ -134,16 +333,60 @@ class PILBackend:
     def __init__(
         self, image: Image.Image, dpi: int = 150,
         unit_mm: float = 0.25,
+        high_quality: bool = True,
     ) -> None:
         self._img = image
         self._draw = ImageDraw.Draw(image)
         self._dpi = dpi
         self._unit_mm = unit_mm
-        self._scale = unit_mm * dpi / 25.4  # model unit → pixels
+        self._scale = _px_per_unit(unit_mm, dpi)  # model unit → pixels
+        # False の場合、画像リサイズを BILINEAR で行う（画質より速度優先）
+        self._high_quality = high_quality
+        # (画像バイト列, 幅, 高さ) → デコード・リサイズ済み RGBA 画像
+        self._img_cache: dict[tuple[bytes, int, int], Image.Image] = {}
+
+    @classmethod
+    def for_layout(
+        cls, lay: LayFile, dpi: int = 150, *, high_quality: bool = True,
+    ) -> PILBackend:
+        """レイアウトのページサイズに合わせた白紙画像を持つバックエンドを作る。"""
+        img = Image.new('RGB', _page_size_px(lay, dpi), (255, 255, 255))
+        unit_mm = lay.paper.unit_mm if lay.paper else 0.25
+        return cls(img, dpi, unit_mm=unit_mm, high_quality=high_quality)
+
+    def matches(self, lay: LayFile, dpi: int) -> bool:
+        """同じ dpi・ページサイズでレイアウトを描画できるなら True（再利用判定用）。"""
+        unit_mm = lay.paper.unit_mm if lay.paper else 0.25
+        return (
+            self._dpi == dpi and self._unit_mm == unit_mm
+            and self._img.size == _page_size_px(lay, dpi)
+        )
+
+    def clear(self) -> None:
+        """描画先画像を白で塗りつぶす。フォント・画像のキャッシュは保持する。"""
+        self._img.paste((255, 255, 255), (0, 0, *self._img.size))
+
+    @property
+    def image(self) -> Image.Image:
+        """描画先画像。"""
+        return self._img
 
-    def _to_px(self, x: int, y: int) -> tuple[float, float]:
-        """モデル座標を画像ピクセルに変換する。"""
-        return x * self._scale, y * self._scale
+    @property
+    def scale(self) -> float:
+        """モデル座標 1 単位あたりのピクセル数。"""
+        return self._scale
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """描画先画像のサイズ (幅, 高さ) ピクセル。"""
+        return self._img.size
+
+    def rect_to_px(
+        self, left: float, top: float, right: float, bottom: float,
+    ) -> PxCoords:
+        """モデル座標の矩形（または線分の両端）を画像ピクセルに変換する。"""
+        s = self._scale
+        return left * s, top * s, right * s, bottom * s
 
     def draw_rect(
         self, left: float, top: float, right: float, bottom: float,
@@ -166,6 +409,16 @@ class PILBackend:
             [(x1, y1), (x2, y2)], fill=color, width=max(1, width),
         )
 
+    def draw_lines(
+        self, segments: list[PxCoords],
+        color: str = '#000000', width: int = 1,
+    ) -> None:
+        """同じ色・太さの線分 (x1, y1, x2, y2) をまとめて描画する（罫線用）。"""
+        line = self._draw.line
+        width = max(1, width)
+        for x1, y1, x2, y2 in segments:
+            line([(x1, y1), (x2, y2)], fill=color, width=width)
+
     def draw_text(
         self, x: float, y: float, w: float, h: float,
         text: str, font_name: str, font_size: float,
@@ -200,6 +453,55 @@ class PILBackend:
                 strikethrough=strikethrough,
             )
 
+    def draw_text_repeated(
+        self, x: float, ys: list[float], w: float, h: float,
+        text: str, font_name: str, font_size: float,
+        h_align: int = 0, v_align: int = 0,
+        color: str = '#000000',
+    ) -> None:
+        """同じサイズのセルを縦に並べ、同じテキストを描画する（テーブル列用）。
+
+        1 行テキストはフォント取得・計測・横位置計算を 1 回で済ませる。
+        縦書き・複数行になる場合は draw_text にフォールバックする。
+        """
+        if not text or not ys:
+            return
+        text = _normalize_text(text)
+        if '\n' in text or _should_render_vertical_text(text, w, h, self._scale):
+            for y in ys:
+                self.draw_text(
+                    x, y, w, h, text, font_name, font_size,
+                    h_align, v_align, color,
+                )
+            return
+
+        font = self._load_font(font_size, font_name)
+        tw, th = self._measure(font, text)
+        tx = self._align_x(x, w, tw, h_align)
+        dy = self._align_y(0.0, h, th, v_align)
+        for y in ys:
+            self._blit_text(tx, y + dy, text, font, color)
+
+    def _blit_text(
+        self, x: float, y: float, text: str,
+        font: ImageFont.FreeTypeFont | ImageFont.ImageFont, color: str,
+    ) -> None:
+        """1 行テキストを描画する。FreeType フォントはグリフマスクをキャッシュして再利用する。
+
+        ImageDraw.text と同じく整数部を描画位置、小数部をラスタライズ開始位置とする。
+        """
+        # 負の座標は ImageDraw.text が小数部を負のまま使うため、マスクを共有できない
+        # （ページ外にはみ出す文字なので直接描いてよい）
+        if not isinstance(font, ImageFont.FreeTypeFont) or x < 0 or y < 0:
+            self._draw.text((x, y), text, fill=color, font=font)
+            return
+        ix, iy = int(x), int(y)
+        mask, (ox, oy) = _glyph_mask(
+            font, text,
+            round((x - ix) * _GLYPH_SUBPIXEL), round((y - iy) * _GLYPH_SUBPIXEL),
+        )
+        self._draw.bitmap((ix + ox, iy + oy), mask, fill=color)
+
     def _load_font(
         self, size_pt: float, font_name: str = '',
     ) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
@@ -209,24 +511,15 @@ class PILBackend:
         見つからない場合はフォールバックリストから順に試す。
         """
         size_px = max(8, int(size_pt * self._dpi / 72))
+        return _load_font_cached(font_name, size_px)
 
-        # 指定フォント名でマッチするパスを優先
-        if font_name:
-            path = _FONT_NAME_MAP.get(font_name)
-            if path and os.path.exists(path):
-                try:
-                    return ImageFont.truetype(path, size=size_px)
-                except (OSError, IndexError):
-                    pass
-
-        # フォールバック
-        for path in _FALLBACK_FONT_PATHS:
-            if os.path.exists(path):
-                try:
-                    return ImageFont.truetype(path, size=size_px)
-                except (OSError, IndexError):
-                    continue
-        return ImageFont.load_default()
+    @staticmethod
+    def _measure(
+        font: ImageFont.FreeTypeFont | ImageFont.ImageFont, text: str,
+    ) -> tuple[float, float]:
+        """テキストの描画幅・高さを返す（キャッシュ経由）。"""
+        bbox = _text_bbox(font, text)
+        return bbox[2] - bbox[0], bbox[3] - bbox[1]
 
     @staticmethod
     def _align_x(
@@ -263,22 +556,17 @@ class PILBackend:
         avail_w = max(1.0, w - 4.0)
 
         # auto_wrap: テキストが幅を超え、高さに余裕があれば複数行に折り返す
-        bbox = self._draw.textbbox((0, 0), text, font=font)
-        tw = bbox[2] - bbox[0]
-        if auto_wrap and tw > avail_w * 1.05 and h >= (bbox[3] - bbox[1]) * 1.8:
+        tw, th = self._measure(font, text)
+        if auto_wrap and tw > avail_w * 1.05 and h >= th * 1.8:
             self._draw_multiline(
                 x, y, w, h, text, font_size, h_align, v_align, color, font_name,
             )
             return
 
-        bbox = self._draw.textbbox((0, 0), text, font=font)
-        tw = bbox[2] - bbox[0]
-        th = bbox[3] - bbox[1]
-
         tx = self._align_x(x, w, tw, h_align)
         ty = self._align_y(y, h, th, v_align)
 
-        self._draw.text((tx, ty), text, fill=color, font=font)
+        self._blit_text(tx, ty, text, font, color)
 
         # 下線
         if underline:
@@ -295,10 +583,10 @@ class PILBackend:
         h_align: int, v_align: int, color: str,
         font_name: str = '',
     ) -> None:
-        chars = list(text)
-        n = len(chars)
-        if n == 0:
+        # 空白のみのテキストはインクがないため、フォント取得・計測を省く
+        if not text or text.isspace():
             return
+        n = len(text)
 
         box_h = max(h - 4.0, 1.0)
         char_h = box_h / n
@@ -306,14 +594,16 @@ class PILBackend:
         font = self._load_font(char_size, font_name)
         total_h = char_h * n
         start_y = self._align_y(y, h, total_h, v_align)
+        # 各文字セルの縦中央（i 文字目は cell_mid + i * char_h）
+        cell_mid = start_y + char_h / 2
 
-        for i, ch in enumerate(chars):
-            bbox = self._draw.textbbox((0, 0), ch, font=font)
-            cw = bbox[2] - bbox[0]
-            ch_h = bbox[3] - bbox[1]
+        for i, ch in enumerate(text):
+            if ch.isspace():
+                continue
+            cw, ch_h = self._measure(font, ch)
             tx = self._align_x(x, w, cw, h_align)
-            ty = start_y + i * char_h + (char_h - ch_h) / 2
-            self._draw.text((tx, ty), ch, fill=color, font=font)
+            ty = cell_mid + i * char_h - ch_h / 2
+            self._blit_text(tx, ty, ch, font, color)
 
     def _draw_multiline(
         self, x: float, y: float, w: float, h: float,
@@ -321,36 +611,34 @@ class PILBackend:
         h_align: int, v_align: int, color: str,
         font_name: str = '',
     ) -> None:
-        lines = text.split('\n')
+        # 空白・改行のみのテキストは描画するものがない
+        if not text or text.isspace():
+            return
         font = self._load_font(font_size, font_name)
         max_w = max(1.0, w - 4.0)
 
-        wrapped_lines: list[str] = []
-        for line in lines:
-            wrapped_lines.extend(self._wrap_line(line, font, max_w))
-        lines = wrapped_lines or ['']
+        lines: list[str] = []
+        for line in text.split('\n'):
+            lines.extend(self._wrap_line(line, font, max_w))
 
-        if not lines:
-            return
-        line_bbox = self._draw.textbbox((0, 0), 'Ag', font=font)
-        natural_line_h = max(1.0, float(line_bbox[3] - line_bbox[1]))
+        natural_line_h = max(1.0, float(self._measure(font, 'Ag')[1]))
         line_h = natural_line_h
         box_h = max(h - 4.0, 1.0)
         if line_h * len(lines) > box_h:
             line_h = box_h / len(lines)
         total_h = line_h * len(lines)
         start_y = self._align_y(y, h, total_h, v_align)
+        # 各行の縦中央（i 行目は line_mid + i * line_h）
+        line_mid = start_y + line_h / 2
 
         for i, line in enumerate(lines):
-            if not line:
+            if not line or line.isspace():
                 continue
-            bbox = self._draw.textbbox((0, 0), line, font=font)
-            tw = bbox[2] - bbox[0]
-            th = bbox[3] - bbox[1]
+            tw, th = self._measure(font, line)
 
             tx = self._align_x(x, w, tw, h_align)
-            ty = start_y + i * line_h + (line_h - th) / 2
-            self._draw.text((tx, ty), line, fill=color, font=font)
+            ty = line_mid + i * line_h - th / 2
+            self._blit_text(tx, ty, line, font, color)
 
     def _wrap_line(
         self,
@@ -358,48 +646,83 @@ class PILBackend:
         font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
         max_w: float,
     ) -> list[str]:
-        """1行テキストを描画幅で折り返す（空白の有無に依存しない）。"""
+        """1行テキストを描画幅で折り返す（空白の有無に依存しない）。
+
+        文字ごとの送り幅の累積和を 1 度だけ作り、各行の折り返し位置を
+        二分探索で求める。
+        """
         if not line:
             return ['']
+        if self._measure(font, line)[0] <= max_w:
+            return [line]
 
+        cum_w = list(accumulate(_char_advance(font, ch) for ch in line))
+        n = len(line)
         wrapped: list[str] = []
-        current = ''
-        for ch in line:
-            candidate = current + ch
-            bbox = self._draw.textbbox((0, 0), candidate, font=font)
-            cand_w = bbox[2] - bbox[0]
-            if current and cand_w > max_w:
-                wrapped.append(current)
-                current = ch
-            else:
-                current = candidate
-        if current:
-            wrapped.append(current)
+        start = 0
+        base_w = 0.0
+        while start < n:
+            # 行幅が max_w を超えない最長の end（最低 1 文字は入れる）
+            end = max(bisect_right(cum_w, base_w + max_w, lo=start), start + 1)
+            wrapped.append(line[start:end])
+            base_w = cum_w[end - 1]
+            start = end
         return wrapped or ['']
 
     def draw_image(
         self, left: float, top: float, right: float, bottom: float,
         image_data: bytes,
     ) -> None:
-        """埋め込み画像を PIL 画像に描画する。"""
+        """埋め込み画像を PIL 画像に描画する。
+
+        同じ画像・同じサイズの描画（MEIBO の繰り返し行など）は
+        リサイズ結果を再利用する。デコード結果はバックエンド間でも共有する。
+        """
         try:
-            img = Image.open(BytesIO(image_data))
             w = max(1, int(right - left))
             h = max(1, int(bottom - top))
-            # 透過画像（パレット/LA 等も含む）を RGBA に統一して合成
-            img = img.convert('RGBA')
-            img = img.resize((w, h), Image.Resampling.LANCZOS)
+            key = (image_data, w, h)
+            img = self._img_cache.get(key)
+            if img is None:
+                img = _decode_image(image_data)
+                if img.size != (w, h):
+                    resample = (
+                        Image.Resampling.LANCZOS if self._high_quality
+                        else Image.Resampling.BILINEAR
+                    )
+                    img = img.resize((w, h), resample)
+                self._img_cache[key] = img
             self._img.paste(img, (int(left), int(top)), img)
         except Exception:
             pass
 
 
+def _line_width(obj: LayoutObject) -> int:
+    """LINE の線幅 (px) を返す。
+
+    style_1001: 正の値 → その値を線幅として使用、-1/0/None → デフォルト(1)
+    """
+    if obj.style_1001 is not None and obj.style_1001 > 0:
+        return obj.style_1001
+    return 1
+
+
 # ── レンダラー ───────────────────────────────────────────────────────────────
 
 
 class LayRenderer:
     """LayFile を指定バックエンドに描画するレンダラー。"""
 
+    # MEIBO 以外の種類別描画メソッド名（_render_shape の振り分け表）
+    _SHAPE_RENDERERS: dict[ObjectType, str] = {
+        ObjectType.LABEL: '_render_label',
+        ObjectType.FIELD: '_render_field',
+        ObjectType.GROUP: '_render_group',
+        ObjectType.LINE: '_render_line',
+        ObjectType.TABLE: '_render_table',
+        ObjectType.IMAGE: '_render_image',
+    }
+
     def __init__(
         self, lay: LayFile, backend: PILBackend,
         layout_registry: dict[str, LayFile] | None = None,
@@ -409,6 +732,10 @@ class LayRenderer:
         self._b = backend
         self._registry = layout_registry or {}
         self._editor_mode = editor_mode
+        # 描画先画像のサイズ（はみ出しオブジェクトの描画省略に使う）
+        self._clip_size: tuple[int, int] = backend.size
+        # モデル座標 → ピクセルの倍率（座標変換をインライン計算するため保持）
+        self._scale = backend.scale
 
     def render_all(self, *, skip_page_outline: bool = False) -> None:
         """ページ外枠 + 全オブジェクトを描画する。
@@ -420,30 +747,72 @@ class LayRenderer:
         """
         if not skip_page_outline:
             self._render_page_outline()
-        # TABLE を最背面に描画
-        for i, obj in enumerate(self._lay.objects):
-            if obj.obj_type == ObjectType.TABLE:
-                self.render_object(obj, index=i)
-        # MEIBO を描画（参照先レイアウトを展開）
-        for i, obj in enumerate(self._lay.objects):
-            if obj.obj_type == ObjectType.MEIBO:
-                self.render_object(obj, index=i)
-        # LABEL / FIELD / IMAGE を描画
-        for i, obj in enumerate(self._lay.objects):
-            if obj.obj_type not in (
-                ObjectType.LINE, ObjectType.TABLE, ObjectType.MEIBO,
-            ):
-                self.render_object(obj, index=i)
-        # LINE を最前面に描画
+
+        # オブジェクト一覧を 1 パスで描画レイヤーごとに振り分け、
+        # 同時にピクセル座標も一括で求めておく（レイヤー内の順序は元の並び順を維持）
+        tables: list[tuple[int, LayoutObject, PxCoords | None]] = []
+        meibos: list[tuple[int, LayoutObject, PxCoords | None]] = []
+        others: list[tuple[int, LayoutObject, PxCoords | None]] = []
+        lines: list[tuple[int, LayoutObject, PxCoords | None]] = []
+        px_coords = self._px_coords
         for i, obj in enumerate(self._lay.objects):
-            if obj.obj_type == ObjectType.LINE:
-                self.render_object(obj, index=i)
+            t = obj.obj_type
+            if t == ObjectType.LINE:
+                lines.append((i, obj, px_coords(obj)))
+            elif t == ObjectType.TABLE:
+                tables.append((i, obj, px_coords(obj)))
+            elif t == ObjectType.MEIBO:
+                meibos.append((i, obj, None))
+            else:
+                others.append((i, obj, px_coords(obj)))
+
+        # TABLE（最背面）→ MEIBO（参照先レイアウトを展開）
+        # → LABEL / FIELD / IMAGE → LINE（最前面）
+        for layer in (tables, meibos, others):
+            for i, obj, px in layer:
+                if obj.obj_type == ObjectType.MEIBO:
+                    self.render_object(obj, index=i)
+                elif px is not None:
+                    self.render_object(obj, index=i, px=px)
+        self._render_lines(lines)
+
+    def _render_lines(
+        self, lines: list[tuple[int, LayoutObject, PxCoords | None]],
+    ) -> None:
+        """LINE レイヤーを線幅ごとにまとめて draw_lines で描画する。
+
+        LINE はすべて同じ色なので、線幅ごとに描く順序を入れ替えても
+        重なった画素の色は変わらない。
+        """
+        by_width: dict[int, list[PxCoords]] = {}
+        for _i, obj, px in lines:
+            if px is None or not self._is_visible(obj, px):
+                continue
+            by_width.setdefault(_line_width(obj), []).append(px)
+        for width, segments in by_width.items():
+            self._b.draw_lines(segments, color=_LINE_COLOR, width=width)
+
+    def _px_coords(self, obj: LayoutObject) -> PxCoords | None:
+        """オブジェクトの描画座標（ピクセル）を返す。
+
+        LINE は (x1, y1, x2, y2)、それ以外は rect の (left, top, right, bottom)。
+        座標を持たないオブジェクトは None。
+        """
+        s = self._scale
+        if obj.obj_type == ObjectType.LINE:
+            p1, p2 = obj.line_start, obj.line_end
+            if p1 is None or p2 is None:
+                return None
+            return p1.x * s, p1.y * s, p2.x * s, p2.y * s
+        r = obj.rect
+        if r is None:
+            return None
+        return r.left * s, r.top * s, r.right * s, r.bottom * s
 
     def _render_page_outline(self) -> None:
         """ページ背景と外枠を描画する。"""
-        px1, py1 = self._b._to_px(0, 0)
-        px2, py2 = self._b._to_px(
-            self._lay.page_width, self._lay.page_height,
+        px1, py1, px2, py2 = self._b.rect_to_px(
+            0, 0, self._lay.page_width, self._lay.page_height,
         )
         self._b.draw_rect(
             px1, py1, px2, py2,
@@ -452,30 +821,54 @@ class LayRenderer:
 
     def render_object(
         self, obj: LayoutObject, index: int = 0,
+        px: PxCoords | None = None,
     ) -> None:
-        """1つのオブジェクトを描画する。"""
-        if obj.obj_type == ObjectType.LABEL:
-            self._render_label(obj)
-        elif obj.obj_type == ObjectType.FIELD:
-            self._render_field(obj)
-        elif obj.obj_type == ObjectType.GROUP:
-            self._render_group(obj)
-        elif obj.obj_type == ObjectType.LINE:
-            self._render_line(obj)
-        elif obj.obj_type == ObjectType.TABLE:
-            self._render_table(obj)
-        elif obj.obj_type == ObjectType.MEIBO:
+        """1つのオブジェクトを描画する。
+
+        Args:
+            px: 計算済みのピクセル座標（省略時はここで計算する）。
+        """
+        if obj.obj_type == ObjectType.MEIBO:
             self._render_meibo(obj)
-        elif obj.obj_type == ObjectType.IMAGE:
-            self._render_image(obj)
+            return
+        if px is None:
+            px = self._px_coords(obj)
+            if px is None:
+                return
+        self._render_shape(obj, px)
 
-    def _render_group(self, obj: LayoutObject) -> None:
-        """GROUP オブジェクトを外枠として描画する。"""
-        if obj.rect is None:
+    def _render_shape(self, obj: LayoutObject, px: PxCoords) -> None:
+        """MEIBO 以外のオブジェクトを種類ごとの描画メソッドに振り分ける。
+
+        描画先画像の外に完全にはみ出すオブジェクトは描画しない。
+        """
+        name = self._SHAPE_RENDERERS.get(obj.obj_type)
+        if name is None or not self._is_visible(obj, px):
             return
-        r = obj.rect
-        px1, py1 = self._b._to_px(r.left, r.top)
-        px2, py2 = self._b._to_px(r.right, r.bottom)
+        getattr(self, name)(obj, px)
+
+    def _is_visible(self, obj: LayoutObject, px: PxCoords) -> bool:
+        """ピクセル座標が描画先画像と重なるか判定する。
+
+        LINE は線幅の分だけ判定範囲を広げる。
+        """
+        x1, y1, x2, y2 = px
+        if x1 > x2:
+            x1, x2 = x2, x1
+        if y1 > y2:
+            y1, y2 = y2, y1
+        margin = 1
+        if obj.obj_type == ObjectType.LINE and obj.style_1001 and obj.style_1001 > 0:
+            margin = obj.style_1001
+        width, height = self._clip_size
+        return (
+            x2 >= -margin and y2 >= -margin
+            and x1 <= width + margin and y1 <= height + margin
+        )
+
+    def _render_group(self, obj: LayoutObject, px: PxCoords) -> None:
+        """GROUP オブジェクトを外枠として描画する。"""
+        px1, py1, px2, py2 = px
 
         # style_1002: 8 → 太枠(2px)、2 → 標準枠(1px)、その他 → 1px
         group_w = 2 if obj.style_1002 == 8 else 1
@@ -485,13 +878,9 @@ class LayRenderer:
             fill='', outline=_LINE_COLOR, width=group_w,
         )
 
-    def _render_label(self, obj: LayoutObject) -> None:
+    def _render_label(self, obj: LayoutObject, px: PxCoords) -> None:
         """LABEL オブジェクトを描画する（透明背景）。"""
-        if obj.rect is None:
-            return
-        r = obj.rect
-        px1, py1 = self._b._to_px(r.left, r.top)
-        px2, py2 = self._b._to_px(r.right, r.bottom)
+        px1, py1, px2, py2 = px
 
         # 一部レイアウトでは LABEL の style_1002=10 が枠付きテキストボックスを表す。
         label_outline = _LINE_COLOR if obj.style_1002 == 10 else ''
@@ -516,17 +905,13 @@ class LayRenderer:
                 strikethrough=obj.font.strikethrough,
             )
 
-    def _render_field(self, obj: LayoutObject) -> None:
+    def _render_field(self, obj: LayoutObject, px: PxCoords) -> None:
         """FIELD オブジェクトを描画する。
 
         editor_mode=True: 薄い背景 + 点線枠 + フィールド名表示
         editor_mode=False: 背景なし + ○ 表示（プレビュー/印刷用）
         """
-        if obj.rect is None:
-            return
-        r = obj.rect
-        px1, py1 = self._b._to_px(r.left, r.top)
-        px2, py2 = self._b._to_px(r.right, r.bottom)
+        px1, py1, px2, py2 = px
 
         if self._editor_mode:
             # エディター: 薄い背景 + 点線枠 + フィールド名
@@ -552,35 +937,24 @@ class LayRenderer:
             strikethrough=obj.font.strikethrough,
         )
 
-    def _render_line(self, obj: LayoutObject) -> None:
+    def _render_line(self, obj: LayoutObject, px: PxCoords) -> None:
         """LINE オブジェクトを描画する。"""
-        if obj.line_start is None or obj.line_end is None:
-            return
-        px1, py1 = self._b._to_px(obj.line_start.x, obj.line_start.y)
-        px2, py2 = self._b._to_px(obj.line_end.x, obj.line_end.y)
-
-        # style_1001: 正の値 → その値を線幅として使用、-1/0/None → デフォルト(1)
-        line_w = 1
-        if obj.style_1001 is not None and obj.style_1001 > 0:
-            line_w = obj.style_1001
-
+        px1, py1, px2, py2 = px
         self._b.draw_line(
             px1, py1, px2, py2,
-            color=_LINE_COLOR, width=line_w,
+            color=_LINE_COLOR, width=_line_width(obj),
         )
 
-    def _render_table(self, obj: LayoutObject) -> None:
+    def _render_table(self, obj: LayoutObject, px: PxCoords) -> None:
         """TABLE オブジェクトを描画する。
 
         テーブル rect 内をカラム幅の比率で分割し、
         ヘッダー行（灰色背景）+ データ行（ピンク背景）を描画する。
         """
-        if obj.rect is None or not obj.table_columns:
+        if not obj.table_columns:
             return
 
-        r = obj.rect
-        px1, py1 = self._b._to_px(r.left, r.top)
-        px2, py2 = self._b._to_px(r.right, r.bottom)
+        px1, py1, px2, py2 = px
         table_w = px2 - px1
         table_h = py2 - py1
 
@@ -604,17 +978,23 @@ class LayRenderer:
             data_row_h = header_h
             n_data_rows = max(1, int((table_h - header_h) / data_row_h))
 
+        # テーブル下端に収まるデータ行数はループ前に 1 度だけ求める
+        # （浮動小数点誤差で最終行が落ちないよう僅かな余裕を持たせる）
+        visible_rows = max(0, min(
+            n_data_rows, int((table_h - header_h + 1e-6) / data_row_h),
+        )) if data_row_h > 0 else 0
+        # 描画対象のデータ行の上端 y 座標
+        data_top = py1 + header_h
+        row_ys = [data_top + row_i * data_row_h for row_i in range(visible_rows)]
+
         # 全データ行に薄いピンク背景を描画（エディターモードのみ）
-        if self._editor_mode:
-            for row_i in range(n_data_rows):
-                data_y = py1 + header_h + row_i * data_row_h
-                if data_y + data_row_h > py2:
-                    break
-                self._b.draw_rect(
-                    px1, data_y, px2,
-                    min(data_y + data_row_h, py2),
-                    fill=_TABLE_DATA_BG, outline='', width=0,
-                )
+        # 行は隙間なく連続するため、1 つの矩形でまとめて塗る
+        if self._editor_mode and row_ys:
+            self._b.draw_rect(
+                px1, row_ys[0], px2,
+                min(row_ys[-1] + data_row_h, py2),
+                fill=_TABLE_DATA_BG, outline='', width=0,
+            )
 
         # 外枠
         self._b.draw_rect(
@@ -628,6 +1008,13 @@ class LayRenderer:
             fill=_TABLE_HEADER_BG, outline=_TABLE_BORDER, width=1,
         )
 
+        # データ行プレースホルダーの色・サイズは全カラム共通
+        data_color = _TABLE_DATA_TEXT if self._editor_mode else _TEXT_COLOR
+        data_font_size = font_size * 0.9
+
+        # 罫線の線分 (x1, y1, x2, y2)
+        grid: list[PxCoords] = []
+
         # カラムの描画
         col_x = px1
         for col in cols:
@@ -642,82 +1029,64 @@ class LayRenderer:
                     color=_TABLE_HEADER_TEXT,
                 )
 
-            # 縦罫線
+            # 縦罫線（描画は横罫線とまとめて最後に行う）
             if col_x > px1:
-                self._b.draw_line(
-                    col_x, py1, col_x, py2,
-                    color=_TABLE_BORDER, width=1,
-                )
+                grid.append((col_x, py1, col_x, py2))
 
             # 全データ行にプレースホルダーを表示
-            if self._editor_mode:
-                display_name = resolve_field_display(col.field_id)
-                data_color = _TABLE_DATA_TEXT
-            else:
-                display_name = '○○○'
-                data_color = _TEXT_COLOR
-            for row_i in range(n_data_rows):
-                data_y = py1 + header_h + row_i * data_row_h
-                if data_y + data_row_h > py2:
-                    break
-                self._b.draw_text(
-                    col_x, data_y, col_w, data_row_h,
-                    display_name,
-                    '', font_size * 0.9,
-                    h_align=col.h_align, v_align=1,
-                    color=data_color,
-                )
+            display_name = (
+                resolve_field_display(col.field_id) if self._editor_mode
+                else '○○○'
+            )
+            self._b.draw_text_repeated(
+                col_x, row_ys, col_w, data_row_h,
+                display_name,
+                '', data_font_size,
+                h_align=col.h_align, v_align=1,
+                color=data_color,
+            )
 
             col_x += col_w
 
         # データ行の横罫線
         for i in range(n_data_rows + 1):
-            line_y = py1 + header_h + i * data_row_h
+            line_y = data_top + i * data_row_h
             if line_y <= py2:
-                self._b.draw_line(
-                    px1, line_y, px2, line_y,
-                    color=_TABLE_BORDER, width=1,
-                )
+                grid.append((px1, line_y, px2, line_y))
+
+        self._b.draw_lines(grid, color=_TABLE_BORDER, width=1)
 
     def _render_meibo(self, obj: LayoutObject) -> None:
-        """MEIBO オブジェクトを描画する（参照先レイアウトを繰り返し配置）。"""
+        """MEIBO オブジェクトを描画する（参照先レイアウトを繰り返し配置）。
+
+        参照先オブジェクトはコピーせず、ピクセル座標だけを行ごとにずらして描画する。
+        """
         if obj.meibo is None or not self._registry:
             return
         meibo = obj.meibo
         ref_lay = self._registry.get(meibo.ref_name)
         if ref_lay is None:
             return
-        for i in range(meibo.row_count):
-            if meibo.direction == 0:  # 縦並び (vertical)
-                dx = meibo.origin_x
-                dy = meibo.origin_y + i * meibo.cell_height
-            else:  # 横並び (horizontal)
-                dx = meibo.origin_x + i * meibo.cell_width
-                dy = meibo.origin_y
-            for ref_obj in ref_lay.objects:
-                offset_obj = _offset_object(ref_obj, dx, dy)
-                if offset_obj.obj_type == ObjectType.LABEL:
-                    self._render_label(offset_obj)
-                elif offset_obj.obj_type == ObjectType.FIELD:
-                    self._render_field(offset_obj)
-                elif offset_obj.obj_type == ObjectType.GROUP:
-                    self._render_group(offset_obj)
-                elif offset_obj.obj_type == ObjectType.LINE:
-                    self._render_line(offset_obj)
-                elif offset_obj.obj_type == ObjectType.TABLE:
-                    self._render_table(offset_obj)
-                elif offset_obj.obj_type == ObjectType.IMAGE:
-                    self._render_image(offset_obj)
-
-    def _render_image(self, obj: LayoutObject) -> None:
+
+        # 参照先オブジェクトの原点基準ピクセル座標は 1 度だけ求める
+        ref_items: list[tuple[LayoutObject, PxCoords]] = []
+        for ref_obj in ref_lay.objects:
+            if ref_obj.obj_type == ObjectType.MEIBO:
+                continue
+            px = self._px_coords(ref_obj)
+            if px is not None:
+                ref_items.append((ref_obj, px))
+
+        for dx, dy in _meibo_cell_offsets(meibo):
+            ox, oy = dx * self._scale, dy * self._scale
+            for ref_obj, (x1, y1, x2, y2) in ref_items:
+                self._render_shape(ref_obj, (x1 + ox, y1 + oy, x2 + ox, y2 + oy))
+
+    def _render_image(self, obj: LayoutObject, px: PxCoords) -> None:
         """IMAGE オブジェクトを描画する（埋め込み PNG 画像）。"""
         if obj.image is None or not obj.image.image_data:
             return
-        if obj.rect is None:
-            return
-        r = obj.rect
-        px1, py1 = self._b._to_px(r.left, r.top)
-        px2, py2 = self._b._to_px(r.right, r.bottom)
+        px1, py1, px2, py2 = px
         self._b.draw_image(
             px1, py1, px2, py2,
             obj.image.image_data,
@@ -731,6 +1100,7 @@ def render_layout_to_image(
     lay: LayFile, dpi: int = 150, *, for_print: bool = False,
     layout_registry: dict[str, LayFile] | None = None,
     editor_mode: bool = False,
+    backend: PILBackend | None = None,
 ) -> Image.Image:
     """LayFile を PIL 画像にレンダリングする。
 
@@ -740,26 +1110,61 @@ def render_layout_to_image(
     Args:
         lay: レンダリング対象のレイアウト
         dpi: 画像解像度 (default 150)
-        for_print: True の場合、ページ外枠を描画しない（印刷用）。
+        for_print: True の場合、ページ外枠を描画せず、画像を LANCZOS で
+            リサイズする（印刷用）。False の場合は BILINEAR で速度を優先する。
         layout_registry: MEIBO 参照解決用の {名前: LayFile} dict。
         editor_mode: True の場合、フィールドに背景色 + 名前表示（エディター用）。
             False の場合、背景なし + ○ 表示（プレビュー/印刷用）。
+        backend: 再利用する PILBackend（PILBackend.for_layout で作成し、
+            matches(lay, dpi) を満たすもの）。白紙に戻してから描画するため、
+            画像の確保を省き、フォント・画像キャッシュを描画間で引き継げる。
+            返り値はこの backend の画像そのものになる。
 
     Returns:
         PIL.Image.Image (RGB)
     """
-    unit_mm = lay.paper.unit_mm if lay.paper else 0.25
-    scale = unit_mm * max(1, dpi) / 25.4
-    w = max(1, int(lay.page_width * scale))
-    h = max(1, int(lay.page_height * scale))
-    img = Image.new('RGB', (w, h), (255, 255, 255))
-    backend = PILBackend(img, dpi, unit_mm=unit_mm)
+    if backend is None:
+        backend = PILBackend.for_layout(lay, dpi, high_quality=for_print)
+    else:
+        backend.clear()
     renderer = LayRenderer(
         lay, backend, layout_registry=layout_registry,
         editor_mode=editor_mode,
     )
     renderer.render_all(skip_page_outline=for_print)
-    return img
+    return backend.image
+
+
+def render_layouts_to_images(
+    layouts: list[LayFile], dpi: int = 150, *, for_print: bool = False,
+    layout_registry: dict[str, LayFile] | None = None,
+    editor_mode: bool = False,
+    max_workers: int | None = None,
+) -> list[Image.Image]:
+    """複数ページをスレッドプールで描画する（印刷プレビューの全ページ描画用）。
+
+    ページ同士は状態を共有しないため同時に描画できる。ただし文字の
+    ラスタライズ (FreeType getmask2) や ImageDraw の図形描画は GIL を
+    保持したままなので、文字・罫線だけのページはほとんど速くならない。
+    GIL を解放する画像のデコード・リサイズ・貼り付けが多いページ
+    （写真入り名簿など）でのみ効果がある。
+    返り値の順序は layouts と同じ。
+
+    Args:
+        max_workers: ワーカー数上限（None で CPU 数、最大 4）
+    """
+    def render(lay: LayFile) -> Image.Image:
+        return render_layout_to_image(
+            lay, dpi, for_print=for_print,
+            layout_registry=layout_registry, editor_mode=editor_mode,
+        )
+
+    # GIL の取り合いになるだけなので既定ではスレッドを増やしすぎない
+    max_workers = min(len(layouts), max_workers or min(4, os.cpu_count() or 1))
+    if max_workers <= 1:
+        return [render(lay) for lay in layouts]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(render, layouts))
 
 
 # ── タイル配置 ───────────────────────────────────────────────────────────────
@@ -850,40 +1255,23 @@ _TILE_PAPER_MM: dict[str, tuple[int, int]] = {
 }
 
 
-def tile_layouts(
-    layouts: list[LayFile],
+def _tile_geometry(
+    first: LayFile,
     cols: int,
     rows: int,
-    paper_width: int = A4_WIDTH,
-    paper_height: int = A4_HEIGHT,
-    scale: float = 1.0,
-    paper: PaperLayout | None = None,
-) -> list[LayFile]:
-    """複数のレイアウトを1ページにタイル配置した LayFile のリストを返す。
-
-    各レイアウトを用紙上のグリッドに配置し、中央揃えする。
-    既に per_page == 1 かつ scale == 1.0 の場合は元のリストをそのまま返す。
-
-    PaperLayout が指定された場合、用紙サイズ・余白・間隔を PaperLayout から取得する。
-
-    Args:
-        layouts: 差込済みの個別レイアウト
-        cols: 列数
-        rows: 行数
-        paper_width: 用紙幅（モデル座標単位、paper 未指定時のフォールバック）
-        paper_height: 用紙高さ（モデル座標単位、paper 未指定時のフォールバック）
-        scale: 縮小率（1.0 = 等倍）
-        paper: PaperLayout（ラベルモードの場合、余白・間隔を使用）
+    paper_width: int,
+    paper_height: int,
+    scale: float,
+    paper: PaperLayout | None,
+) -> tuple[int, int, PaperLayout | None, list[tuple[int, int]]]:
+    """タイル配置のページ寸法・ページ用 PaperLayout・各セルの原点を求める。
 
     Returns:
-        タイル配置された page LayFile のリスト
+        (paper_width, paper_height, page_paper, cell_origins) タプル。
+        cell_origins はページ内の並び順 (行優先) のモデル座標。
     """
-    per_page = cols * rows
-    if (per_page <= 1 and scale >= 1.0) or not layouts:
-        return layouts
-
-    cell_w = int(layouts[0].page_width * scale)
-    cell_h = int(layouts[0].page_height * scale)
+    cell_w = int(first.page_width * scale)
+    cell_h = int(first.page_height * scale)
 
     # PaperLayout からラベル配置情報を取得
     if paper is not None and paper.mode == 1:
@@ -924,6 +1312,52 @@ def tile_layouts(
             orientation=paper.orientation,
         )
 
+    origins = [
+        (
+            margin_x + (i % cols) * (cell_w + gutter_x),
+            margin_y + (i // cols) * (cell_h + gutter_y),
+        )
+        for i in range(cols * rows)
+    ]
+    return paper_width, paper_height, page_paper, origins
+
+
+def tile_layouts(
+    layouts: list[LayFile],
+    cols: int,
+    rows: int,
+    paper_width: int = A4_WIDTH,
+    paper_height: int = A4_HEIGHT,
+    scale: float = 1.0,
+    paper: PaperLayout | None = None,
+) -> list[LayFile]:
+    """複数のレイアウトを1ページにタイル配置した LayFile のリストを返す。
+
+    各レイアウトを用紙上のグリッドに配置し、中央揃えする。
+    既に per_page == 1 かつ scale == 1.0 の場合は元のリストをそのまま返す。
+
+    PaperLayout が指定された場合、用紙サイズ・余白・間隔を PaperLayout から取得する。
+
+    Args:
+        layouts: 差込済みの個別レイアウト
+        cols: 列数
+        rows: 行数
+        paper_width: 用紙幅（モデル座標単位、paper 未指定時のフォールバック）
+        paper_height: 用紙高さ（モデル座標単位、paper 未指定時のフォールバック）
+        scale: 縮小率（1.0 = 等倍）
+        paper: PaperLayout（ラベルモードの場合、余白・間隔を使用）
+
+    Returns:
+        タイル配置された page LayFile のリスト
+    """
+    per_page = cols * rows
+    if (per_page <= 1 and scale >= 1.0) or not layouts:
+        return layouts
+
+    paper_width, paper_height, page_paper, origins = _tile_geometry(
+        layouts[0], cols, rows, paper_width, paper_height, scale, paper,
+    )
+
     pages: list[LayFile] = []
     for page_start in range(0, len(layouts), per_page):
         page_items = layouts[page_start:page_start + per_page]
@@ -937,11 +1371,7 @@ def tile_layouts(
         )
 
         for i, lay in enumerate(page_items):
-            col = i % cols
-            row = i // cols
-            ox = margin_x + col * (cell_w + gutter_x)
-            oy = margin_y + row * (cell_h + gutter_y)
-
+            ox, oy = origins[i]
             for obj in lay.objects:
                 new_obj = _scale_and_offset_object(obj, scale, ox, oy)
                 page.objects.append(new_obj)
@@ -951,28 +1381,106 @@ def tile_layouts(
     return pages
 
 
-def _clone_layout_object(obj: LayoutObject, **changes) -> LayoutObject:
-    """LayoutObject のコピーを作り、必要な項目だけ差し替える。"""
-    base = replace(
-        obj,
-        table_columns=list(obj.table_columns),
-        raw_tags=list(obj.raw_tags),
+def render_tiled_layout_to_image(
+    lay: LayFile,
+    cols: int,
+    rows: int,
+    dpi: int = 150,
+    *,
+    paper_width: int = A4_WIDTH,
+    paper_height: int = A4_HEIGHT,
+    scale: float = 1.0,
+    paper: PaperLayout | None = None,
+    layout_registry: dict[str, LayFile] | None = None,
+    editor_mode: bool = False,
+) -> Image.Image:
+    """同じレイアウトを cols×rows 枚並べた 1 ページ分の画像を返す。
+
+    tile_layouts([lay] * (cols * rows), ...) を描画した結果に相当するが、
+    レイアウトは 1 度だけ描画し、その画像を各セルに貼り付ける。
+    データ未読込時のラベル用紙プレビュー等、全セルが同一内容の場合に使う。
+    縮小配置 (scale != 1.0) では画像の縮小だと文字・罫線がぼやけて印刷と
+    一致しないため、tile_layouts で縮小したページをそのまま描画する。
+
+    Args:
+        lay: 各セルに配置するレイアウト
+        cols: 列数
+        rows: 行数
+        dpi: 画像解像度
+        paper_width: 用紙幅（モデル座標単位、paper 未指定時のフォールバック）
+        paper_height: 用紙高さ（モデル座標単位、paper 未指定時のフォールバック）
+        scale: 縮小率（1.0 = 等倍）
+        paper: PaperLayout（ラベルモードの場合、余白・間隔を使用）
+        layout_registry: MEIBO 参照解決用の {名前: LayFile} dict。
+        editor_mode: render_layout_to_image と同じ。
+
+    Returns:
+        PIL.Image.Image (RGB)
+    """
+    if scale != 1.0:
+        pages = tile_layouts(
+            [lay] * (cols * rows), cols, rows, paper_width, paper_height,
+            scale=scale, paper=paper,
+        )
+        return render_layout_to_image(
+            pages[0], dpi, layout_registry=layout_registry, editor_mode=editor_mode,
+        )
+
+    paper_width, paper_height, page_paper, origins = _tile_geometry(
+        lay, cols, rows, paper_width, paper_height, scale, paper,
+    )
+    page = LayFile(
+        title='印刷ページ',
+        page_width=paper_width,
+        page_height=paper_height,
+        objects=[],
+        paper=page_paper,
+    )
+    page_img = render_layout_to_image(page, dpi)
+
+    # セル画像は 1 枚だけ描画して各セルに貼り付ける
+    page_unit = page_paper.unit_mm if page_paper else 0.25
+    card_unit = lay.paper.unit_mm if lay.paper else 0.25
+    px_scale = page_unit * max(1, dpi) / 25.4
+    card_img = render_layout_to_image(
+        lay, max(1, round(dpi * page_unit / card_unit)), for_print=True,
+        layout_registry=layout_registry, editor_mode=editor_mode,
     )
-    for key, val in changes.items():
-        setattr(base, key, val)
-    return base
 
+    for ox, oy in origins:
+        page_img.paste(card_img, (round(ox * px_scale), round(oy * px_scale)))
+    return page_img
 
-def _clone_layfile(lay: LayFile, **changes) -> LayFile:
-    """LayFile のコピーを作り、必要な項目だけ差し替える。"""
-    base = replace(
-        lay,
-        objects=list(lay.objects),
-        raw_tags=list(lay.raw_tags),
+
+@functools.lru_cache(maxsize=4096)
+def _make_fontinfo(
+    name: str, size_pt: float, bold: bool, italic: bool, vertical: bool,
+) -> FontInfo:
+    """縮小・外字差替え用の FontInfo を返す（同じ値なら同じインスタンス）。
+
+    差込・タイル配置の結果と同じく読み取り専用として扱う。
+    """
+    return FontInfo(
+        name=name, size_pt=size_pt, bold=bold, italic=italic, vertical=vertical,
     )
-    for key, val in changes.items():
-        setattr(base, key, val)
-    return base
+
+
+def _clone_layout_object(obj: LayoutObject, **changes) -> LayoutObject:
+    """LayoutObject のコピーを作り、必要な項目だけ差し替える。
+
+    差し替えないリスト (table_columns / raw_tags) は元オブジェクトと共有する。
+    差込・タイル配置の結果は読み取り専用として扱い、リストを変えるときは
+    新しいリストを changes で渡す。
+    """
+    return replace(obj, **changes)
+
+
+def _clone_layfile(lay: LayFile, **changes) -> LayFile:
+    """LayFile のコピーを作り、必要な項目だけ差し替える。
+
+    objects は呼び出し側が新しいリストを渡す。raw_tags は元と共有する。
+    """
+    return replace(lay, **changes)
 
 
 def _scale_and_offset_object(
@@ -1003,12 +1511,9 @@ def _scale_and_offset_object(
                         int(obj.line_end.y * s) + dy)
 
     # フォントサイズも縮小
-    new_font = FontInfo(
-        name=obj.font.name,
-        size_pt=obj.font.size_pt * s,
-        bold=obj.font.bold,
-        italic=obj.font.italic,
-        vertical=obj.font.vertical,
+    new_font = _make_fontinfo(
+        obj.font.name, obj.font.size_pt * s,
+        obj.font.bold, obj.font.italic, obj.font.vertical,
     )
 
     return _clone_layout_object(
@@ -1050,26 +1555,55 @@ def _offset_object(obj: LayoutObject, dx: int, dy: int) -> LayoutObject:
 # ── 外字検出 ─────────────────────────────────────────────────────────────────
 
 
+# IVS 異体字セレクタ (U+E0100〜U+E01EF) は CJK統合漢字拡張B〜I (U+20000〜)
+# 以降の範囲に含まれるため、U+20000 以上の 1 文字クラスで両方を判定できる
+_GAIJI_RE = re.compile('[\U00020000-\U0010FFFF]')
+
+
 def _contains_gaiji(text: str) -> bool:
     """テキストに外字（IVS 異体字・CJK拡張漢字）が含まれるか判定する。
 
     IVS (Ideographic Variation Sequence) の異体字セレクタ (U+E0100〜U+E01EF) や
     CJK統合漢字拡張B以降 (U+20000〜) の文字は IPAmj明朝 でないと正しく表示できない。
     """
-    for ch in text:
-        cp = ord(ch)
-        # IVS 異体字セレクタ (Variation Selectors Supplement)
-        if 0xE0100 <= cp <= 0xE01EF:
-            return True
-        # CJK統合漢字拡張B〜I (U+20000〜U+3134F)
-        if cp >= 0x20000:
-            return True
-    return False
+    # ASCII のみ（英数字の番号・日付など）は走査不要
+    if text.isascii():
+        return False
+    return _GAIJI_RE.search(text) is not None
+
+
+@functools.lru_cache(maxsize=256)
+def _affix_contains_gaiji(prefix: str, suffix: str) -> bool:
+    """FIELD の prefix/suffix に外字が含まれるか（レイアウト固定値のためキャッシュ）。"""
+    return _contains_gaiji(prefix) or _contains_gaiji(suffix)
 
 
 # ── データ差込 ───────────────────────────────────────────────────────────────
 
 
+def _resolve_fiscal_year_wareki(data_row: dict, options: dict) -> str:
+    """'年度和暦' — 例: 令和7年度"""
+    fy = options.get('fiscal_year', 2025)
+    return to_wareki(fy, 4, 1).replace('年', '年度')
+
+
+# 特殊キー → (data_row, options) から値を求める関数
+_SPECIAL_RESOLVERS: dict[str, Callable[[dict, dict], str]] = {
+    '年度': lambda row, opts: str(opts.get('fiscal_year', '')),
+    '年度和暦': _resolve_fiscal_year_wareki,
+    '学校名': lambda row, opts: opts.get('school_name', ''),
+    '担任名': lambda row, opts: opts.get('teacher_name', ''),
+    '住所': lambda row, opts: build_address(row),
+    '保護者住所': lambda row, opts: build_guardian_address(row),
+    'ページ番号': lambda row, opts: str(opts.get('page_number', '')),
+    '人数合計': lambda row, opts: str(opts.get('total_count', '')),
+}
+
+_NAME_KANA_KEYS = frozenset({'氏名かな', '正式氏名かな'})
+_NAME_KANJI_KEYS = frozenset({'氏名', '正式氏名'})
+_KANJI_TO_KANA = {'氏名': '氏名かな', '正式氏名': '正式氏名かな'}
+
+
 def _resolve_field_value(
     key: str, data_row: dict, options: dict,
 ) -> str:
@@ -1077,36 +1611,14 @@ def _resolve_field_value(
 
     fill_layout / fill_meibo_layout 共通のデータ解決ロジック。
     """
-    from utils.address import build_address, build_guardian_address
-    from utils.date_fmt import DATE_KEYS, format_date
-    from utils.wareki import to_wareki
+    # 特殊キー
+    resolver = _SPECIAL_RESOLVERS.get(key)
+    if resolver is not None:
+        return resolver(data_row, options)
 
     original_key = key
     mode = options.get('name_display', 'furigana')
 
-    _NAME_KANA_KEYS = frozenset({'氏名かな', '正式氏名かな'})
-    _NAME_KANJI_KEYS = frozenset({'氏名', '正式氏名'})
-    _KANJI_TO_KANA = {'氏名': '氏名かな', '正式氏名': '正式氏名かな'}
-
-    # 特殊キー
-    if key == '年度':
-        return str(options.get('fiscal_year', ''))
-    if key == '年度和暦':
-        fy = options.get('fiscal_year', 2025)
-        return to_wareki(fy, 4, 1).replace('年', '年度')
-    if key == '学校名':
-        return options.get('school_name', '')
-    if key == '担任名':
-        return options.get('teacher_name', '')
-    if key == '住所':
-        return build_address(data_row)
-    if key == '保護者住所':
-        return build_guardian_address(data_row)
-    if key == 'ページ番号':
-        return str(options.get('page_number', ''))
-    if key == '人数合計':
-        return str(options.get('total_count', ''))
-
     # name_display モード
     if mode == 'kanji' and key in _NAME_KANA_KEYS:
         return ''
@@ -1130,6 +1642,49 @@ def _resolve_field_value(
 _PHOTO_FIELD_ID = 400
 
 
+def _photo_target_rect(obj: LayoutObject) -> tuple[int, int] | None:
+    """写真フィールドの rect からクロップ用の (幅, 高さ) を返す。"""
+    if obj.rect is None:
+        return None
+    w = abs(obj.rect.right - obj.rect.left)
+    h = abs(obj.rect.bottom - obj.rect.top)
+    if w > 0 and h > 0:
+        return (w, h)
+    return None
+
+
+def _prefetch_meibo_photos(
+    meibo_plans: dict[int, list[list[LayoutObject]]],
+    data_rows: list[dict],
+    options: dict,
+) -> None:
+    """MEIBO セル内の写真をスレッドでまとめて読み込み、キャッシュを温める。
+
+    セルはオフセットが違うだけで写真枠の大きさは同じなので、
+    先頭セルの写真フィールドから target_rect を求める。
+    """
+    photo_map = options.get('_photo_map')
+    if not photo_map or not data_rows:
+        return
+    rects = {
+        _photo_target_rect(obj)
+        for cells in meibo_plans.values() if cells
+        for obj in cells[0]
+        if obj.obj_type == ObjectType.FIELD and obj.field_id == _PHOTO_FIELD_ID
+    }
+    if not rects:
+        return
+
+    from core.photo_manager import load_photos_batch, match_photo_to_student
+
+    paths = [
+        path for row in data_rows
+        if (path := match_photo_to_student(row, photo_map)) is not None
+    ]
+    for rect in rects:
+        load_photos_batch(paths, target_rect=rect, fmt='JPEG')
+
+
 def _fill_photo_field(
     obj: LayoutObject, data_row: dict, options: dict,
 ) -> LayoutObject:
@@ -1145,21 +1700,16 @@ def _fill_photo_field(
     if not photo_map:
         return empty_label
 
-    from core.photo_manager import load_photo_bytes, match_photo_to_student
+    from core.photo_manager import load_photo_bytes_cached, match_photo_to_student
 
     photo_path = match_photo_to_student(data_row, photo_map)
     if photo_path is None:
         return empty_label
 
-    # フィールドの rect からアスペクト比を計算
-    target_rect = None
-    if obj.rect is not None:
-        w = abs(obj.rect.right - obj.rect.left)
-        h = abs(obj.rect.bottom - obj.rect.top)
-        if w > 0 and h > 0:
-            target_rect = (w, h)
-
-    image_data = load_photo_bytes(photo_path, target_rect=target_rect)
+    # 描画側は Pillow でデコードするだけなので、エンコードが速く小さい JPEG で持つ
+    image_data = load_photo_bytes_cached(
+        photo_path, target_rect=_photo_target_rect(obj), fmt='JPEG',
+    )
     if image_data is None:
         return empty_label
 
@@ -1188,13 +1738,11 @@ def _fill_field_object(
     logical_name = resolve_field_name(obj.field_id)
     value = _resolve_field_value(logical_name, data_row, options)
     text = obj.prefix + value + obj.suffix
-    if _contains_gaiji(text):
-        filled_font = FontInfo(
-            name='IPAmj明朝',
-            size_pt=obj.font.size_pt,
-            bold=obj.font.bold,
-            italic=obj.font.italic,
-            vertical=obj.font.vertical,
+    # prefix/suffix はレイアウト固定のため判定結果を使い回し、差込値だけを走査する
+    if _contains_gaiji(value) or _affix_contains_gaiji(obj.prefix, obj.suffix):
+        filled_font = _make_fontinfo(
+            'IPAmj明朝', obj.font.size_pt,
+            obj.font.bold, obj.font.italic, obj.font.vertical,
         )
     else:
         filled_font = obj.font
@@ -1265,6 +1813,22 @@ def _meibo_page_capacity(lay: LayFile) -> int:
     return cap
 
 
+def _meibo_cell_offsets(meibo: MeiboArea) -> list[tuple[int, int]]:
+    """MEIBO の各セルの原点オフセット (dx, dy) を並び順に返す。"""
+    if meibo.direction == 0:  # 縦並び (vertical)
+        dx = meibo.origin_x
+        return [
+            (dx, meibo.origin_y + i * meibo.cell_height)
+            for i in range(meibo.row_count)
+        ]
+    # 横並び (horizontal)
+    dy = meibo.origin_y
+    return [
+        (meibo.origin_x + i * meibo.cell_width, dy)
+        for i in range(meibo.row_count)
+    ]
+
+
 def has_meibo(lay: LayFile) -> bool:
     """レイアウトに MEIBO オブジェクトが含まれるか判定する。"""
     return any(o.obj_type == ObjectType.MEIBO and o.meibo for o in lay.objects)
@@ -1275,6 +1839,9 @@ def fill_meibo_layout(
     data_rows: list[dict],
     options: dict | None = None,
     layout_registry: dict[str, LayFile] | None = None,
+    *,
+    parallel: bool = False,
+    max_workers: int | None = None,
 ) -> list[LayFile]:
     """MEIBO 付きレイアウトに複数名分のデータを差し込む。
 
@@ -1287,13 +1854,14 @@ def fill_meibo_layout(
         data_rows: 全生徒データ dict のリスト
         options: fill_layout と同じオプション
         layout_registry: MEIBO ref_name 解決用レジストリ
+        parallel: True のとき複数ページをプロセスプールで並列に差し込む。
+            プロセス起動とレイアウトの受け渡しに時間がかかるため、
+            学年全体など数十ページ以上を一括生成する場合のみ有効にする。
+        max_workers: parallel 時のワーカー数上限（None で CPU 数）
 
     Returns:
-        ページごとの差込済み LayFile リスト
+        ページごとの差込済み LayFile リスト（ページ順）
     """
-    import logging
-
-    logger = logging.getLogger(__name__)
     opts = options or {}
     registry = layout_registry or {}
 
@@ -1304,76 +1872,133 @@ def fill_meibo_layout(
             return [fill_layout(lay, data_rows[0], opts)]
         return []
 
-    pages: list[LayFile] = []
+    # セル配置はページによらないため、MEIBO ごとに各セルへオフセット済みの
+    # 参照先オブジェクトを先に作り、全ページで使い回す
+    # {lay.objects 内の位置: セルごとのオフセット済みオブジェクト}
+    meibo_plans: dict[int, list[list[LayoutObject]]] = {}
+    for idx, obj in enumerate(lay.objects):
+        if obj.obj_type != ObjectType.MEIBO or not obj.meibo:
+            continue
+        ref_lay = registry.get(obj.meibo.ref_name)
+        if ref_lay is None:
+            logger.warning('MEIBO ref_name 未解決: %s', obj.meibo.ref_name)
+            continue
+        meibo_plans[idx] = [
+            [_offset_object(ref_obj, dx, dy) for ref_obj in ref_lay.objects]
+            for dx, dy in _meibo_cell_offsets(obj.meibo)
+        ]
+
     total = len(data_rows)
+    # (ページ内の生徒データ, ページ番号)
+    pages = [
+        (data_rows[page_start:page_start + capacity], (page_start // capacity) + 1)
+        for page_start in range(0, max(total, 1), capacity)
+    ]
+
+    if parallel and len(pages) > 1:
+        workers = min(len(pages), max_workers or os.cpu_count() or 1)
+        # lay・meibo_plans・options は initializer で子プロセスごとに 1 回だけ送り、
+        # ページごとには生徒データとページ番号だけを渡す
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_meibo_worker,
+            initargs=(lay, meibo_plans, opts),
+        ) as ex:
+            return list(ex.map(_fill_meibo_page_in_worker, pages))
+    # 同一プロセスで差し込む場合は写真のデコードだけ先に並列化しておく
+    _prefetch_meibo_photos(meibo_plans, data_rows, opts)
+    return [
+        _fill_meibo_page(lay, meibo_plans, page_data, {**opts, 'page_number': page_number})
+        for page_data, page_number in pages
+    ]
+
+
+# 生徒のいない MEIBO セルにも配置する枠用のオブジェクト種別
+_MEIBO_FRAME_TYPES = frozenset({ObjectType.LINE, ObjectType.LABEL, ObjectType.GROUP})
+
+
+# parallel 差込用子プロセスの共有状態（_init_meibo_worker がプール起動時に 1 回だけ設定）
+_worker_lay: LayFile | None = None
+_worker_meibo_plans: dict[int, list[list[LayoutObject]]] = {}
+_worker_options: dict = {}
+
+
+def _init_meibo_worker(
+    lay: LayFile,
+    meibo_plans: dict[int, list[list[LayoutObject]]],
+    options: dict,
+) -> None:
+    """プロセスプールの initializer。全ページ共通の引数を子プロセスに 1 回だけ渡す。"""
+    global _worker_lay, _worker_meibo_plans, _worker_options
+    _worker_lay = lay
+    _worker_meibo_plans = meibo_plans
+    _worker_options = options
+
+
+def _fill_meibo_page_in_worker(args: tuple[list[dict], int]) -> LayFile:
+    """子プロセスで 1 ページ分を差し込む。
+
+    ProcessPoolExecutor から呼べるようにモジュールレベルに置き、
+    引数は (ページ内の生徒データ, ページ番号) の 1 タプルで受け取る。
+    写真キャッシュはプロセスごとなので、ページ内の写真をここで先読みする。
+    """
+    page_data, page_number = args
+    _prefetch_meibo_photos(_worker_meibo_plans, page_data, _worker_options)
+    return _fill_meibo_page(
+        _worker_lay, _worker_meibo_plans, page_data,
+        {**_worker_options, 'page_number': page_number},
+    )
 
-    for page_start in range(0, max(total, 1), capacity):
-        page_data = data_rows[page_start:page_start + capacity]
-        # 共通データ（年度、学校名等）は先頭行から取得
-        common_row = page_data[0] if page_data else {}
-        page_opts = {**opts, 'page_number': (page_start // capacity) + 1}
 
-        filled_objects: list[LayoutObject] = []
+def _fill_meibo_page(
+    lay: LayFile,
+    meibo_plans: dict[int, list[list[LayoutObject]]],
+    page_data: list[dict],
+    page_opts: dict,
+) -> LayFile:
+    """fill_meibo_layout の 1 ページ分を差し込む。"""
+    n_students = len(page_data)
+    # 共通データ（年度、学校名等）は先頭行から取得
+    common_row = page_data[0] if page_data else {}
 
-        for obj in lay.objects:
-            if obj.obj_type == ObjectType.FIELD:
-                filled_objects.append(
-                    _fill_field_object(obj, common_row, page_opts),
-                )
-            elif obj.obj_type == ObjectType.TABLE:
-                filled_objects.append(
-                    _fill_table_object(obj, common_row, page_opts),
-                )
-            elif obj.obj_type == ObjectType.MEIBO and obj.meibo:
-                meibo = obj.meibo
-                ref_lay = registry.get(meibo.ref_name)
-                if ref_lay is None:
-                    logger.warning(
-                        'MEIBO ref_name 未解決: %s', meibo.ref_name,
+    filled_objects: list[LayoutObject] = []
+
+    for idx, obj in enumerate(lay.objects):
+        if obj.obj_type == ObjectType.FIELD:
+            filled_objects.append(
+                _fill_field_object(obj, common_row, page_opts),
+            )
+        elif obj.obj_type == ObjectType.TABLE:
+            filled_objects.append(
+                _fill_table_object(obj, common_row, page_opts),
+            )
+        elif obj.obj_type == ObjectType.MEIBO and obj.meibo:
+            cells = meibo_plans.get(idx)
+            if cells is None:
+                continue
+            first_idx = obj.meibo.data_start_index
+
+            # MEIBO セルを展開
+            for i, cell_objs in enumerate(cells):
+                student_idx = first_idx + i
+                if student_idx >= n_students:
+                    # 生徒データなし — 罫線やラベル（枠線）のみ配置
+                    filled_objects.extend(
+                        o for o in cell_objs if o.obj_type in _MEIBO_FRAME_TYPES
                     )
                     continue
+                student_row = page_data[student_idx]
+                # パーツレイアウトの各オブジェクトをデータ差込
+                for cell_obj in cell_objs:
+                    if cell_obj.obj_type == ObjectType.FIELD:
+                        cell_obj = _fill_field_object(
+                            cell_obj, student_row, page_opts,
+                        )
+                    elif cell_obj.obj_type == ObjectType.TABLE:
+                        cell_obj = _fill_table_object(
+                            cell_obj, student_row, page_opts,
+                        )
+                    filled_objects.append(cell_obj)
+        else:
+            filled_objects.append(obj)
 
-                # MEIBO セルを展開
-                for i in range(meibo.row_count):
-                    student_idx = meibo.data_start_index + i
-                    if meibo.direction == 0:  # 縦並び (vertical)
-                        dx = meibo.origin_x
-                        dy = meibo.origin_y + i * meibo.cell_height
-                    else:  # 横並び (horizontal)
-                        dx = meibo.origin_x + i * meibo.cell_width
-                        dy = meibo.origin_y
-
-                    if student_idx < len(page_data):
-                        student_row = page_data[student_idx]
-                        # パーツレイアウトの各オブジェクトをデータ差込
-                        for ref_obj in ref_lay.objects:
-                            offset_obj = _offset_object(ref_obj, dx, dy)
-                            if offset_obj.obj_type == ObjectType.FIELD:
-                                filled_objects.append(
-                                    _fill_field_object(
-                                        offset_obj, student_row, page_opts,
-                                    ),
-                                )
-                            elif offset_obj.obj_type == ObjectType.TABLE:
-                                filled_objects.append(
-                                    _fill_table_object(
-                                        offset_obj, student_row, page_opts,
-                                    ),
-                                )
-                            else:
-                                filled_objects.append(offset_obj)
-                    else:
-                        # 生徒データなし — 罫線やラベル（枠線）のみ配置
-                        for ref_obj in ref_lay.objects:
-                            if ref_obj.obj_type in (
-                                ObjectType.LINE, ObjectType.LABEL, ObjectType.GROUP,
-                            ):
-                                filled_objects.append(
-                                    _offset_object(ref_obj, dx, dy),
-                                )
-            else:
-                filled_objects.append(obj)
-
-        pages.append(_clone_layfile(lay, objects=filled_objects))
-
-    return pages
+    return _clone_layfile(lay, objects=filled_objects)
@@ -11,10 +11,18 @@ LayFile オブジェクトを人間可読な JSON 形式で保存・読込する
 
 from __future__ import annotations
 
-import base64
+import binascii
 import json
 import tempfile
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from core.lay_parser import (
     EmbeddedImage,
@@ -40,6 +48,20 @@ _SUPPORTED_FORMATS = {_FORMAT_V1, _FORMAT_V2}
 # ── シリアライズ ─────────────────────────────────────────────────────────────
 
 
+def _b64encode(data: bytes) -> str:
+    """バイト列を base64 文字列にする（埋め込み画像・生タグ用）。"""
+    return binascii.b2a_base64(data, newline=False).decode('ascii')
+
+
+def _b64decode(text: str) -> bytes:
+    """base64 文字列をバイト列に戻す。
+
+    binascii は ASCII の str を直接受け取るため、base64.b64decode のような
+    bytes への中間コピーが発生しない。
+    """
+    return binascii.a2b_base64(text) if text else b''
+
+
 def _rect_to_list(r: Rect) -> list[int]:
     return [r.left, r.top, r.right, r.bottom]
 
@@ -75,7 +97,7 @@ def _table_column_to_dict(col: TableColumn) -> dict:
 def _raw_tag_to_dict(tag: RawTag) -> dict:
     d: dict = {'path': tag.path, 'payload_len': tag.payload_len}
     if tag.payload:
-        d['payload'] = base64.b64encode(tag.payload).decode('ascii')
+        d['payload'] = _b64encode(tag.payload)
     return d
 
 
@@ -89,14 +111,21 @@ def _object_to_dict(obj: LayoutObject) -> dict:
         d['line_start'] = _point_to_list(obj.line_start)
     if obj.line_end is not None:
         d['line_end'] = _point_to_list(obj.line_end)
-    for k in ('text', 'prefix', 'suffix'):
-        v = getattr(obj, k)
-        if v:
-            d[k] = v
-    for k in ('field_id', 'h_align', 'v_align', 'table_row_count'):
-        v = getattr(obj, k)
-        if v:
-            d[k] = v
+    # 既定値（空文字・0）の項目は出力しない。キー順は JSON の出力順になる
+    if obj.text:
+        d['text'] = obj.text
+    if obj.prefix:
+        d['prefix'] = obj.prefix
+    if obj.suffix:
+        d['suffix'] = obj.suffix
+    if obj.field_id:
+        d['field_id'] = obj.field_id
+    if obj.h_align:
+        d['h_align'] = obj.h_align
+    if obj.v_align:
+        d['v_align'] = obj.v_align
+    if obj.table_row_count:
+        d['table_row_count'] = obj.table_row_count
     if obj.font.name or obj.font.size_pt != 10.0:
         d['font'] = _font_to_dict(obj.font)
     if obj.table_columns:
@@ -117,13 +146,15 @@ def _object_to_dict(obj: LayoutObject) -> dict:
         img = obj.image
         d['image'] = {
             'rect': list(img.rect),
-            'image_data': base64.b64encode(img.image_data).decode('ascii'),
+            'image_data': _b64encode(img.image_data),
             'original_path': img.original_path,
         }
-    for k in ('style_1001', 'style_1002', 'style_1003'):
-        v = getattr(obj, k)
-        if v is not None:
-            d[k] = v
+    if obj.style_1001 is not None:
+        d['style_1001'] = obj.style_1001
+    if obj.style_1002 is not None:
+        d['style_1002'] = obj.style_1002
+    if obj.style_1003 is not None:
+        d['style_1003'] = obj.style_1003
     if obj.raw_tags:
         d['raw_tags'] = [_raw_tag_to_dict(t) for t in obj.raw_tags]
 
@@ -226,7 +257,7 @@ def _dict_to_paper(d: dict) -> PaperLayout:
 
 
 def _dict_to_raw_tag(d: dict) -> RawTag:
-    payload = base64.b64decode(d.get('payload', '')) if d.get('payload') else b''
+    payload = _b64decode(d.get('payload', ''))
     return RawTag(
         path=list(d.get('path', [])),
         payload=payload,
@@ -237,54 +268,67 @@ def _dict_to_raw_tag(d: dict) -> RawTag:
 _TYPE_MAP = {t.name: t for t in ObjectType}
 
 
+def _dict_to_meibo(m: dict) -> MeiboArea:
+    return MeiboArea(
+        origin_x=m.get('origin_x', 0),
+        origin_y=m.get('origin_y', 0),
+        cell_width=m.get('cell_width', 0),
+        cell_height=m.get('cell_height', 0),
+        row_count=m.get('row_count', 0),
+        data_start_index=m.get('data_start_index', 0),
+        ref_name=m.get('ref_name', ''),
+        direction=m.get('direction', 0),
+    )
+
+
+def _dict_to_image(img: dict) -> EmbeddedImage:
+    return EmbeddedImage(
+        rect=tuple(img.get('rect', [0, 0, 0, 0])),
+        image_data=_b64decode(img.get('image_data', '')),
+        original_path=img.get('original_path', ''),
+    )
+
+
+def _as_is(v):
+    return v
+
+
+# JSON キー → LayoutObject フィールド値への変換（キー名とフィールド名は同じ）
+_OBJECT_FIELD_DECODERS: dict[str, Callable[[Any], Any]] = {
+    'rect': _list_to_rect,
+    'line_start': _list_to_point,
+    'line_end': _list_to_point,
+    'text': _as_is,
+    'field_id': _as_is,
+    'h_align': _as_is,
+    'v_align': _as_is,
+    'prefix': _as_is,
+    'suffix': _as_is,
+    'table_row_count': _as_is,
+    'font': _dict_to_font,
+    'table_columns': lambda cols: [_dict_to_table_column(c) for c in cols],
+    'meibo': _dict_to_meibo,
+    'image': _dict_to_image,
+    'style_1001': _as_is,
+    'style_1002': _as_is,
+    'style_1003': _as_is,
+    'raw_tags': lambda tags: [_dict_to_raw_tag(t) for t in tags],
+}
+
+
 def _dict_to_object(d: dict) -> LayoutObject:
-    """dict から LayoutObject を復元する。"""
-    type_name = d.get('type', 'LABEL')
-    obj_type = _TYPE_MAP.get(type_name, ObjectType.LABEL)
-
-    obj = LayoutObject(obj_type=obj_type)
-
-    if 'rect' in d:
-        obj.rect = _list_to_rect(d['rect'])
-    if 'line_start' in d:
-        obj.line_start = _list_to_point(d['line_start'])
-    if 'line_end' in d:
-        obj.line_end = _list_to_point(d['line_end'])
-    for k in ('text', 'field_id', 'h_align', 'v_align', 'prefix', 'suffix', 'table_row_count'):
-        if k in d:
-            setattr(obj, k, d[k])
-    if 'font' in d:
-        obj.font = _dict_to_font(d['font'])
-    if 'table_columns' in d:
-        obj.table_columns = [
-            _dict_to_table_column(c) for c in d['table_columns']
-        ]
-    if 'meibo' in d:
-        m = d['meibo']
-        obj.meibo = MeiboArea(
-            origin_x=m.get('origin_x', 0),
-            origin_y=m.get('origin_y', 0),
-            cell_width=m.get('cell_width', 0),
-            cell_height=m.get('cell_height', 0),
-            row_count=m.get('row_count', 0),
-            data_start_index=m.get('data_start_index', 0),
-            ref_name=m.get('ref_name', ''),
-            direction=m.get('direction', 0),
-        )
-    if 'image' in d:
-        img = d['image']
-        obj.image = EmbeddedImage(
-            rect=tuple(img.get('rect', [0, 0, 0, 0])),
-            image_data=base64.b64decode(img.get('image_data', '')),
-            original_path=img.get('original_path', ''),
-        )
-    for k in ('style_1001', 'style_1002', 'style_1003'):
-        if k in d:
-            setattr(obj, k, d[k])
-    if 'raw_tags' in d:
-        obj.raw_tags = [_dict_to_raw_tag(t) for t in d['raw_tags']]
+    """dict から LayoutObject を復元する。
 
-    return obj
+    存在するキーだけを変換し、コンストラクタを 1 回呼んで組み立てる。
+    未知のキーは無視する。
+    """
+    kwargs: dict[str, Any] = {}
+    for key, value in d.items():
+        decode = _OBJECT_FIELD_DECODERS.get(key)
+        if decode is not None:
+            kwargs[key] = decode(value)
+    obj_type = _TYPE_MAP.get(d.get('type', 'LABEL'), ObjectType.LABEL)
+    return LayoutObject(obj_type=obj_type, **kwargs)
 
 
 def dict_to_layfile(data: dict) -> LayFile:
@@ -310,6 +354,28 @@ def dict_to_layfile(data: dict) -> LayFile:
     )
 
 
+# ── JSON エンコード ─────────────────────────────────────────────────────────
+
+
+def _encode_json(data: dict) -> bytes:
+    """dict を UTF-8・インデント 2 の JSON バイト列にする。
+
+    orjson があればそれを使う（埋め込み画像の base64 文字列が大きいレイアウトで速い）。
+    出力形式は標準 json の ensure_ascii=False, indent=2 と同じ。
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _decode_json(raw: bytes) -> dict:
+    """JSON バイト列を dict に戻す。不正な JSON は json.JSONDecodeError。"""
+    if HAS_ORJSON:
+        # orjson.JSONDecodeError は json.JSONDecodeError のサブクラス
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 # ── 公開 API ─────────────────────────────────────────────────────────────────
 
 
@@ -329,8 +395,8 @@ def save_layout(lay: LayFile, path: str) -> None:
         dir=str(out_dir), suffix='.tmp', prefix='.layout_',
     )
     try:
-        with open(fd, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with open(fd, 'wb') as f:
+            f.write(_encode_json(data))
         # Windows では既存ファイルへの rename が失敗するため replace を使う
         Path(tmp_path).replace(path)
     except BaseException:
@@ -340,6 +406,4 @@ def save_layout(lay: LayFile, path: str) -> None:
 
 def load_layout(path: str) -> LayFile:
     """JSON ファイルから LayFile を読み込む。"""
-    with open(path, encoding='utf-8') as f:
-        data = json.load(f)
-    return dict_to_layfile(data)
+    return dict_to_layfile(_decode_json(Path(path).read_bytes()))
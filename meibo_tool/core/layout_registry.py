@@ -7,17 +7,92 @@
 from __future__ import annotations
 
 import json
+import logging
 import os
 import shutil
 import sys
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from core.lay_parser import LayFile, parse_lay, parse_lay_multi
 from core.lay_serializer import load_layout, save_layout
 
+logger = logging.getLogger(__name__)
+
 _DEFAULT_LAY_NAME = 'default_layouts.lay'
 
+# scan_layout_dir が一覧に含める JSON の format 値
+_ACCEPTED_FORMATS = frozenset({'meibo_layout_v1', 'meibo_layout_v2'})
+
+# ── 読込キャッシュ ─────────────────────────────────────────────────────────────
+
+# (パス, 更新日時 ns, サイズ) → 解析結果。ファイルが書き換わればキーが変わる
+_CacheKey = tuple[str, int, int]
+_META_CACHE: dict[_CacheKey, dict[str, Any] | None] = {}
+_LAY_CACHE: dict[_CacheKey, LayFile] = {}
+
+# scan_layout_dir で未キャッシュのファイルを並行して読むスレッド数の上限
+_SCAN_MAX_WORKERS = 8
+
+
+def _cache_key(path: str) -> _CacheKey:
+    st = os.stat(path)
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+def _list_layout_files(layout_dir: str) -> list[tuple[str, _CacheKey]]:
+    """layout_dir 直下の .json ファイルを (ファイル名, キャッシュキー) で名前順に返す。
+
+    os.scandir の DirEntry が持つ stat 情報を使い、ファイルごとの stat を省く。
+    """
+    files: list[tuple[str, _CacheKey]] = []
+    with os.scandir(layout_dir) as it:
+        for entry in it:
+            if not entry.name.lower().endswith('.json'):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            files.append((entry.name, (entry.path, st.st_mtime_ns, st.st_size)))
+    files.sort()
+    return files
+
+
+def _evict_stale(
+    cache: dict[_CacheKey, Any], layout_dir: str, current: set[_CacheKey],
+) -> None:
+    """layout_dir 配下で、削除済み・更新前のファイルのキャッシュを捨てる。"""
+    layout_dir = os.path.normpath(layout_dir)
+    for key in list(cache):
+        if key not in current and os.path.normpath(os.path.dirname(key[0])) == layout_dir:
+            del cache[key]
+
+
+def _load_layout_cached(path: str, key: _CacheKey | None = None) -> LayFile:
+    """load_layout の結果をファイルの更新日時・サイズ単位でキャッシュする。
+
+    返す LayFile は MEIBO 参照解決用に共有されるため、読み取り専用として扱う。
+    """
+    if key is None:
+        key = _cache_key(path)
+    lay = _LAY_CACHE.get(key)
+    if lay is None:
+        lay = load_layout(path)
+        _LAY_CACHE[key] = lay
+    return lay
+
 # ── MEIBO ref_name エイリアス ──────────────────────────────────────────────────
 
 _SUZUKI_REF_ALIASES: dict[str, str] = {
@@ -31,52 +106,70 @@ _SUZUKI_REF_ALIASES: dict[str, str] = {
 }
 
 
-def build_layout_registry(layout_dir: str) -> dict[str, LayFile]:
-    """layout_dir 内の全レイアウトを ref_name 解決用 dict に読み込む。
+def _build_registry_full(
+    layout_dir: str,
+) -> tuple[dict[str, LayFile], dict[int, set[str]], dict[int, LayFile]]:
+    """build_layout_registry の本体。
 
-    キー: lay.title とファイル名 stem の両方で登録。
-    エイリアス: gakkyu → takara_simei 等のスズキ校務参照名を解決。
+    Returns:
+        (registry, {id(lay): その LayFile を指すキー集合}, {id(lay): LayFile})
+        後の 2 つは registry に残っている LayFile だけを含む。
     """
-    import logging
-
-    logger = logging.getLogger(__name__)
     registry: dict[str, LayFile] = {}
+    keys_by_layout_id: dict[int, set[str]] = {}
+    unique_layouts: dict[int, LayFile] = {}
     if not layout_dir or not os.path.isdir(layout_dir):
-        return registry
-    for fname in os.listdir(layout_dir):
-        if not fname.lower().endswith('.json'):
-            continue
+        return registry, keys_by_layout_id, unique_layouts
+
+    def register(key: str, lay: LayFile) -> None:
+        prev = registry.get(key)
+        if prev is not None:
+            # 同名キーの上書き: 前の LayFile からキーを外す
+            prev_keys = keys_by_layout_id[id(prev)]
+            prev_keys.discard(key)
+            if not prev_keys:
+                del keys_by_layout_id[id(prev)]
+                del unique_layouts[id(prev)]
+        registry[key] = lay
+        keys_by_layout_id.setdefault(id(lay), set()).add(key)
+        unique_layouts[id(lay)] = lay
+
+    files = _list_layout_files(layout_dir)
+    _evict_stale(_LAY_CACHE, layout_dir, {key for _, key in files})
+    for fname, key in files:
         stem = Path(fname).stem
         try:
-            lay = load_layout(os.path.join(layout_dir, fname))
+            lay = _load_layout_cached(key[0], key)
             if lay.title:
-                registry[lay.title] = lay
+                register(lay.title, lay)
             if stem and stem != lay.title:
-                registry[stem] = lay
+                register(stem, lay)
         except Exception:
             pass
     # エイリアス解決
     for alias, target in _SUZUKI_REF_ALIASES.items():
         if alias not in registry and target in registry:
-            registry[alias] = registry[target]
+            register(alias, registry[target])
         elif alias not in registry:
             logger.debug('ref_name エイリアス未解決: %s → %s', alias, target)
-    return registry
+    return registry, keys_by_layout_id, unique_layouts
+
+
+def build_layout_registry(layout_dir: str) -> dict[str, LayFile]:
+    """layout_dir 内の全レイアウトを ref_name 解決用 dict に読み込む。
+
+    キー: lay.title とファイル名 stem の両方で登録。
+    エイリアス: gakkyu → takara_simei 等のスズキ校務参照名を解決。
+    """
+    return _build_registry_full(layout_dir)[0]
 
 
 def collect_part_layout_keys(layout_dir: str) -> set[str]:
     """他レイアウトから MEIBO 参照されるパーツレイアウトの識別キーを返す。"""
-    registry = build_layout_registry(layout_dir)
+    registry, keys_by_layout_id, unique_layouts = _build_registry_full(layout_dir)
     if not registry:
         return set()
 
-    keys_by_layout_id: dict[int, set[str]] = {}
-    unique_layouts: dict[int, LayFile] = {}
-    for key, lay in registry.items():
-        layout_id = id(lay)
-        unique_layouts[layout_id] = lay
-        keys_by_layout_id.setdefault(layout_id, set()).add(key)
-
     part_keys: set[str] = set()
     for source_lay in unique_layouts.values():
         for obj in source_lay.objects:
@@ -101,38 +194,82 @@ def scan_layout_dir(layout_dir: str) -> list[dict[str, Any]]:
         [{name, file, path, title, page_width, page_height,
           page_size_mm, object_count, field_count, label_count, line_count}, ...]
     """
-    results: list[dict[str, Any]] = []
     if not os.path.isdir(layout_dir):
-        return results
+        return []
+
+    files = _list_layout_files_for_scan(layout_dir)
+    # 未キャッシュのファイルはスレッドプールで読込・解析を重ねる
+    missing = [key for _, key in files if key not in _META_CACHE]
+    if len(missing) > 1:
+        workers = min(_SCAN_MAX_WORKERS, len(missing), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            parsed = ex.map(_parse_layout_meta, [key[0] for key in missing])
+            for key, meta in zip(missing, parsed, strict=True):
+                _META_CACHE[key] = meta
+
+    return list(_iter_metas(files))
+
+
+def iter_layout_dir(layout_dir: str) -> Iterator[dict[str, Any]]:
+    """scan_layout_dir と同じメタデータを 1 件ずつ読みながら返す。
+
+    先頭の数件だけ必要な場合（itertools.islice 等）に残りのファイルを読まずに済む。
+    """
+    if not os.path.isdir(layout_dir):
+        return
+    yield from _iter_metas(_list_layout_files_for_scan(layout_dir))
 
-    for fname in sorted(os.listdir(layout_dir)):
-        if not fname.lower().endswith('.json'):
-            continue
-        path = os.path.join(layout_dir, fname)
-        meta = _read_layout_meta(path)
+
+def _list_layout_files_for_scan(layout_dir: str) -> list[tuple[str, _CacheKey]]:
+    """_list_layout_files の結果を返し、消えた・更新されたファイルのメタデータを捨てる。"""
+    files = _list_layout_files(layout_dir)
+    _evict_stale(_META_CACHE, layout_dir, {key for _, key in files})
+    return files
+
+
+def _iter_metas(files: list[tuple[str, _CacheKey]]) -> Iterator[dict[str, Any]]:
+    for fname, key in files:
+        path = key[0]
+        meta = _read_layout_meta(path, key)
         if meta is not None:
             meta['file'] = fname
             meta['path'] = path
-            results.append(meta)
+            yield meta
 
-    return results
+
+def _read_layout_meta(
+    path: str, key: _CacheKey | None = None,
+) -> dict[str, Any] | None:
+    """JSON レイアウトファイルからメタデータを読み取る。
+
+    ファイルの更新日時・サイズが変わらない限り、前回の解析結果のコピーを返す。
+    key はスキャン時に取得済みのキャッシュキー（省略時は stat する）。
+    """
+    if key is None:
+        try:
+            key = _cache_key(path)
+        except OSError:
+            return None
+    if key not in _META_CACHE:
+        _META_CACHE[key] = _parse_layout_meta(path)
+    meta = _META_CACHE[key]
+    return dict(meta) if meta is not None else None
 
 
-def _read_layout_meta(path: str) -> dict[str, Any] | None:
-    """JSON レイアウトファイルからメタデータを読み取る。"""
+def _parse_layout_meta(path: str) -> dict[str, Any] | None:
     try:
-        with open(path, encoding='utf-8') as f:
-            data = json.load(f)
-    except (json.JSONDecodeError, OSError):
+        with open(path, 'rb') as f:
+            raw = f.read()
+        # orjson.JSONDecodeError は json.JSONDecodeError のサブクラス
+        data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
         return None
 
-    if data.get('format') not in ('meibo_layout_v1', 'meibo_layout_v2'):
+    if data.get('format') not in _ACCEPTED_FORMATS:
         return None
 
     objects = data.get('objects', [])
-    field_count = sum(1 for o in objects if o.get('type') == 'FIELD')
-    label_count = sum(1 for o in objects if o.get('type') == 'LABEL')
-    line_count = sum(1 for o in objects if o.get('type') == 'LINE')
+    type_counts = Counter(o.get('type') for o in objects)
 
     pw = data.get('page_width', 840)
     ph = data.get('page_height', 1188)
@@ -148,9 +285,9 @@ def _read_layout_meta(path: str) -> dict[str, Any] | None:
         'page_height': ph,
         'page_size_mm': f'{pw_mm:.0f}x{ph_mm:.0f}mm',
         'object_count': len(objects),
-        'field_count': field_count,
-        'label_count': label_count,
-        'line_count': line_count,
+        'field_count': type_counts['FIELD'],
+        'label_count': type_counts['LABEL'],
+        'line_count': type_counts['LINE'],
     }
 
 
@@ -176,10 +313,11 @@ def import_lay_file_multi(src_path: str, layout_dir: str) -> list[dict[str, str]
     layouts = parse_lay_multi(src_path)
     os.makedirs(layout_dir, exist_ok=True)
 
+    existing = _existing_names(layout_dir)
     results: list[dict[str, str]] = []
     for lay in layouts:
         stem = lay.title or Path(src_path).stem
-        dest_path = unique_path(layout_dir, stem)
+        dest_path = unique_path(layout_dir, stem, existing)
         save_layout(lay, dest_path)
         results.append({'title': lay.title, 'path': dest_path})
 
@@ -189,6 +327,8 @@ def import_lay_file_multi(src_path: str, layout_dir: str) -> list[dict[str, str]
 def import_json_file(src_path: str, layout_dir: str) -> str:
     """既存の .json レイアウトファイルをライブラリにコピーする。
 
+    ライブラリ内のファイル自体が指定された場合はコピーせずそのパスを返す。
+
     Returns:
         コピー先のファイルパス。
 
@@ -196,6 +336,12 @@ def import_json_file(src_path: str, layout_dir: str) -> str:
         ValueError: meibo_layout_v1 形式でない場合。
     """
     load_layout(src_path)  # バリデーション（ValueError on invalid format）
+    try:
+        in_library = os.path.samefile(os.path.dirname(os.path.abspath(src_path)), layout_dir)
+    except OSError:
+        in_library = False
+    if in_library:
+        return src_path
     stem = Path(src_path).stem
     dest_path = unique_path(layout_dir, stem)
     shutil.copy2(src_path, dest_path)
@@ -218,11 +364,11 @@ def rename_layout(path: str, new_name: str) -> str:
         FileExistsError: 同名ファイルが既に存在する場合。
     """
     new_path = os.path.join(os.path.dirname(path), f'{new_name}.json')
-    if os.path.exists(new_path) and os.path.abspath(new_path) != os.path.abspath(path):
+    same_file = os.path.abspath(new_path) == os.path.abspath(path)
+    if os.path.exists(new_path) and not same_file:
         raise FileExistsError(f'ファイルが既に存在します: {new_name}.json')
 
     lay = load_layout(path)
-    from core.lay_parser import LayFile
     updated = LayFile(
         title=new_name,
         version=lay.version,
@@ -233,7 +379,7 @@ def rename_layout(path: str, new_name: str) -> str:
         raw_tags=lay.raw_tags,
     )
     save_layout(updated, new_path)
-    if os.path.abspath(new_path) != os.path.abspath(path):
+    if not same_file:
         os.remove(path)
     return new_path
 
@@ -270,11 +416,31 @@ def ensure_default_layouts(layout_dir: str) -> int:
     return len(results)
 
 
-def unique_path(layout_dir: str, stem: str) -> str:
-    """名前衝突を回避したファイルパスを返す。"""
-    dest = os.path.join(layout_dir, f'{stem}.json')
+def unique_path(
+    layout_dir: str, stem: str, existing: set[str] | None = None,
+) -> str:
+    """名前衝突を回避したファイルパスを返す。
+
+    existing に layout_dir 内のファイル名（os.path.normcase 済み）の集合を
+    渡すと、ファイルの存在確認の代わりに集合で判定し、選んだ名前を追加する。
+    同じフォルダへ続けて保存する場合に使う（_existing_names 参照）。
+    """
+    def taken(name: str) -> bool:
+        if existing is None:
+            return os.path.exists(os.path.join(layout_dir, name))
+        return os.path.normcase(name) in existing
+
+    name = f'{stem}.json'
     counter = 1
-    while os.path.exists(dest):
-        dest = os.path.join(layout_dir, f'{stem}_{counter}.json')
+    while taken(name):
+        name = f'{stem}_{counter}.json'
         counter += 1
-    return dest
+    if existing is not None:
+        existing.add(os.path.normcase(name))
+    return os.path.join(layout_dir, name)
+
+
+def _existing_names(layout_dir: str) -> set[str]:
+    """unique_path の existing 用に layout_dir 内のファイル名集合を返す。"""
+    with os.scandir(layout_dir) as it:
+        return {os.path.normcase(entry.name) for entry in it}
@@ -4,6 +4,8 @@ SPEC.md 第2章 §2.2〜§2.3 参照。
 全角スペース（U+3000）は normalize_header() で統一する。
 """
 
+import functools
+
 # C4th 確定ヘッダー → 内部論理名（完全一致マップ）
 EXACT_MAP: dict[str, str] = {
     # ── C4th 基本情報 ──
@@ -105,9 +107,21 @@ COLUMN_ALIASES: dict[str, list[str]] = {
     '組': ['組', '学級', 'クラス'],
 }
 
+# エイリアス → 内部論理名（COLUMN_ALIASES の逆引き。エイリアスは論理名間で重複しない）
+_ALIAS_TO_LOGICAL: dict[str, str] = {
+    alias: logical
+    for logical, aliases in COLUMN_ALIASES.items()
+    for alias in aliases
+}
+
 
+@functools.lru_cache(maxsize=1024, typed=True)
 def normalize_header(s: str) -> str:
-    """ヘッダー名を正規化する（前後空白除去・全角スペース統一）。"""
+    """ヘッダー名を正規化する（前後空白除去・全角スペース統一）。
+
+    同じヘッダーがファイルごとに繰り返し現れるため結果をキャッシュする。
+    typed=True で 1 と 1.0 等の数値ヘッダーを区別する。
+    """
     if not isinstance(s, str):
         return str(s)
     s = s.strip()
@@ -116,6 +130,10 @@ def normalize_header(s: str) -> str:
     return s
 
 
+# マッピング後の内部論理名
+_LOGICAL_NAMES = frozenset(EXACT_MAP.values()) | frozenset(COLUMN_ALIASES)
+
+
 def map_columns(df):
     """
     DataFrame のカラム名を内部論理名にマッピングする。
@@ -124,6 +142,9 @@ def map_columns(df):
         df_mapped: リネーム済み DataFrame
         unmapped:  マッピングできなかった元のカラム名リスト
     """
+    # マッピング済み（全列が内部論理名）の DataFrame はそのまま返す
+    if _LOGICAL_NAMES.issuperset(df.columns):
+        return df.copy(deep=False), []
 
     renamed: dict[str, str] = {}
     unmapped: list[str] = []
@@ -134,13 +155,10 @@ def map_columns(df):
             renamed[col] = EXACT_MAP[norm]
         else:
             # エイリアス検索
-            found = False
-            for logical, aliases in COLUMN_ALIASES.items():
-                if norm in aliases or col in aliases:
-                    renamed[col] = logical
-                    found = True
-                    break
-            if not found:
+            logical = _ALIAS_TO_LOGICAL.get(norm) or _ALIAS_TO_LOGICAL.get(col)
+            if logical is not None:
+                renamed[col] = logical
+            else:
                 unmapped.append(col)
 
     df_mapped = df.rename(columns=renamed)
@@ -166,11 +184,24 @@ def ensure_fallback_columns(df) -> None:
     例: '正式氏名' がなく '氏名' がある場合、'氏名' の値を '正式氏名' にコピー。
     逆方向（'氏名' がなく '正式氏名' がある場合）も補完する。
     """
+    # 補完した列も後続のフォールバック元になる（氏名 → 正式氏名 → 公簿名）ため、
+    # 列名の集合を 1 度だけ作って補完のたびに更新する
+    columns = set(df.columns)
     for formal, casual in _FALLBACK_COLUMNS:
-        if formal not in df.columns and casual in df.columns:
+        if formal not in columns and casual in columns:
             df[formal] = df[casual]
-        elif casual not in df.columns and formal in df.columns:
+            columns.add(formal)
+        elif casual not in columns and formal in columns:
             df[casual] = df[formal]
+            columns.add(casual)
+
+
+def _clean_value(v) -> str:
+    """セル値を表示用文字列にする（None・'nan' は空文字）。"""
+    if v is None:
+        return ''
+    s = str(v).strip()
+    return '' if s.lower() == 'nan' else s
 
 
 def resolve_name_fields(data_row: dict, use_formal: bool) -> dict[str, str]:
@@ -178,20 +209,22 @@ def resolve_name_fields(data_row: dict, use_formal: bool) -> dict[str, str]:
     use_formal_name フラグに基づき表示用氏名フィールドを選択する。
     正式氏名が空の場合は通常氏名にフォールバックする。
     """
-    def _val(key: str) -> str:
-        v = data_row.get(key, '')
-        return '' if (v is None or str(v).strip().lower() == 'nan') else str(v).strip()
+    get = data_row.get
+    name = _clean_value(get('氏名'))
+    kana = _clean_value(get('氏名かな'))
+    guardian = _clean_value(get('保護者名'))
+    guardian_kana = _clean_value(get('保護者名かな'))
 
     if use_formal:
         return {
-            '表示氏名': _val('正式氏名') or _val('氏名'),
-            '表示氏名かな': _val('正式氏名かな') or _val('氏名かな'),
-            '表示保護者名': _val('保護者正式名') or _val('保護者名'),
-            '表示保護者名かな': _val('保護者正式名かな') or _val('保護者名かな'),
+            '表示氏名': _clean_value(get('正式氏名')) or name,
+            '表示氏名かな': _clean_value(get('正式氏名かな')) or kana,
+            '表示保護者名': _clean_value(get('保護者正式名')) or guardian,
+            '表示保護者名かな': _clean_value(get('保護者正式名かな')) or guardian_kana,
         }
     return {
-        '表示氏名': _val('氏名'),
-        '表示氏名かな': _val('氏名かな'),
-        '表示保護者名': _val('保護者名'),
-        '表示保護者名かな': _val('保護者名かな'),
+        '表示氏名': name,
+        '表示氏名かな': kana,
+        '表示保護者名': guardian,
+        '表示保護者名かな': guardian_kana,
     }
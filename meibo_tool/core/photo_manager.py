@@ -7,11 +7,14 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import io
 import logging
 import os
 import re
 import shutil
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 from PIL import Image, ImageOps
@@ -26,6 +29,12 @@ _SUPPORTED_EXTENSIONS = frozenset({
 # 例: '1-1-01' or '01' or '1'
 _NUMBER_KEY_PATTERN = re.compile(r'^(\d+-\d+-\d+|\d+)$')
 
+# '{学年}-{組}-{番号}' 形式のファイル名
+_TRIPLE_NUMBER_RE = re.compile(r'^(\d+)-(\d+)-(\d+)$')
+
+# 全角数字 → 半角数字
+_FULLWIDTH_DIGITS = str.maketrans('０１２３４５６７８９', '0123456789')
+
 
 def scan_photos(photo_dir: str) -> dict[str, str]:
     """フォルダをスキャンして {マッチキー: 絶対パス} の辞書を返す。
@@ -43,17 +52,28 @@ def scan_photos(photo_dir: str) -> dict[str, str]:
     if not os.path.isdir(photo_dir):
         return result
 
-    for dirpath, _dirs, filenames in os.walk(photo_dir):
-        for fname in filenames:
-            ext = os.path.splitext(fname)[1].lower()
+    # os.walk と同じ順（各フォルダのファイル → サブフォルダを深さ優先）で
+    # 走査する。DirEntry の種別キャッシュで余分な stat を避ける
+    stack = [photo_dir]
+    while stack:
+        subdirs: list[str] = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir():
+                # os.walk 既定と同様、シンボリックリンク先のフォルダには入らない
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+                continue
+            stem, ext = _split_photo_name(entry.name)
             if ext not in _SUPPORTED_EXTENSIONS:
                 continue
 
-            abs_path = os.path.join(dirpath, fname)
-            stem = os.path.splitext(fname)[0]
-
-            keys = _generate_match_keys(stem)
-            for key in keys:
+            abs_path = entry.path
+            for key in _generate_match_keys(stem):
                 if key in result:
                     logger.warning(
                         '写真キー重複: %s → 既存=%s, 新規=%s (スキップ)',
@@ -61,10 +81,17 @@ def scan_photos(photo_dir: str) -> dict[str, str]:
                     )
                     continue
                 result[key] = abs_path
+        stack.extend(reversed(subdirs))
 
     return result
 
 
+def _split_photo_name(name: str) -> tuple[str, str]:
+    """ファイル名を (拡張子なし, 小文字の拡張子) に分ける。"""
+    stem, ext = os.path.splitext(name)
+    return stem, ext.lower()
+
+
 def _generate_match_keys(stem: str) -> list[str]:
     """ファイル名（拡張子なし）からマッチキーのリストを生成する。
 
@@ -82,7 +109,7 @@ def _generate_match_keys(stem: str) -> list[str]:
     keys.append(stem_stripped)
 
     # 番号キーの場合、ゼロ埋めなし版も追加
-    m = re.match(r'^(\d+)-(\d+)-(\d+)$', stem_stripped)
+    m = _TRIPLE_NUMBER_RE.match(stem_stripped)
     if m:
         grade, cls, num = m.groups()
         no_pad = f'{int(grade)}-{int(cls)}-{int(num)}'
@@ -129,32 +156,51 @@ def match_photo_to_student(
     if not photo_map:
         return None
 
+    for key in _iter_candidate_keys(data_row):
+        path = photo_map.get(key)
+        if path is not None:
+            return path
+    return None
+
+
+def _iter_candidate_keys(data_row: dict) -> Iterator[str]:
+    """match_photo_to_student のマッチ候補キーを優先順に返す。
+
+    先の候補で見つかれば後続のキー（氏名の正規化等）は作らない。
+    """
     grade = _normalize_field(data_row.get('学年', ''))
     cls = _normalize_field(data_row.get('組', ''))
     num = _normalize_field(data_row.get('出席番号', ''))
 
+    n = _to_int(num)
     # 番号ベースのマッチング
-    if grade and cls and num:
-        candidates = _build_number_candidates(grade, cls, num)
-        for key in candidates:
-            if key in photo_map:
-                return photo_map[key]
+    if grade and cls and n is not None:
+        g = _to_int(grade)
+        c = _to_int(cls)
+        if g is not None and c is not None:
+            yield f'{g}-{c}-{n:02d}'  # ゼロ埋め2桁
+            yield f'{g}-{c}-{n}'  # ゼロ埋めなし
 
     # 出席番号のみのマッチング（単学級向け）
-    if num:
-        for key in _build_num_only_candidates(num):
-            if key in photo_map:
-                return photo_map[key]
+    if n is not None:
+        yield f'{n:02d}'
+        yield str(n)
 
     # 氏名ベースのマッチング
     for name_field in ('氏名', '正式氏名'):
         name = data_row.get(name_field, '')
         if name:
             name_key = _strip_spaces(str(name))
-            if name_key and name_key in photo_map:
-                return photo_map[name_key]
+            if name_key:
+                yield name_key
 
-    return None
+
+def _to_int(value: str) -> int | None:
+    """数字文字列を int にする（数値でなければ None）。"""
+    try:
+        return int(value)
+    except ValueError:
+        return None
 
 
 def _normalize_field(value: str | None) -> str:
@@ -165,7 +211,7 @@ def _normalize_field(value: str | None) -> str:
     if s.lower() == 'nan':
         return ''
     # 全角数字→半角数字
-    s = s.translate(str.maketrans('０１２３４５６７８９', '0123456789'))
+    s = s.translate(_FULLWIDTH_DIGITS)
     return s
 
 
@@ -174,58 +220,31 @@ def _strip_spaces(s: str) -> str:
     return s.replace(' ', '').replace('\u3000', '')
 
 
-def _build_number_candidates(
-    grade: str, cls: str, num: str,
-) -> list[str]:
-    """番号ベースのマッチ候補キーを生成する。"""
-    candidates: list[str] = []
-    try:
-        g = int(grade)
-        c = int(cls)
-        n = int(num)
-    except ValueError:
-        return candidates
-
-    # ゼロ埋め2桁
-    candidates.append(f'{g}-{c}-{n:02d}')
-    # ゼロ埋めなし
-    candidates.append(f'{g}-{c}-{n}')
-    return candidates
-
-
-def _build_num_only_candidates(num: str) -> list[str]:
-    """出席番号のみのマッチ候補キーを生成する。"""
-    candidates: list[str] = []
-    try:
-        n = int(num)
-    except ValueError:
-        return candidates
-    candidates.append(f'{n:02d}')
-    candidates.append(str(n))
-    return candidates
-
-
 def load_photo_bytes(
     photo_path: str,
     max_size: int = 600,
     target_rect: tuple[int, int] | None = None,
+    resample: Image.Resampling = Image.Resampling.LANCZOS,
+    fmt: str = 'PNG',
 ) -> bytes | None:
-    """画像ファイルを読込、処理して PNG bytes を返す。
+    """画像ファイルを読込、処理して PNG (または JPEG) bytes を返す。
 
     処理内容:
         1. EXIF Orientation タグに基づく自動回転
         2. RGBA/P → RGB 変換（透過画像対応）
         3. target_rect 指定時: アスペクト比に合わせてセンタークロップ
         4. max_size px にリサイズ（長辺基準）
-        5. PNG bytes に変換
+        5. PNG (fmt='JPEG' なら JPEG) bytes に変換
 
     Args:
         photo_path: 画像ファイルパス
         max_size: リサイズの最大長辺 px
         target_rect: (width, height) アスペクト比ターゲット
+        resample: リサイズフィルタ（小さなサムネイルなら BICUBIC で十分速い）
+        fmt: 出力形式。'PNG'（可逆）または 'JPEG'（写真向け、エンコードが速く小さい）
 
     Returns:
-        PNG bytes、エラー時は None
+        画像 bytes、エラー時は None
     """
     try:
         img = Image.open(photo_path)
@@ -233,6 +252,11 @@ def load_photo_bytes(
         logger.warning('写真読込エラー: %s', photo_path)
         return None
 
+    # JPEG はデコード時に 1/2〜1/8 へ縮小できる（max_size 以上は保たれる）。
+    # JPEG 以外では何もしない
+    with contextlib.suppress(Exception):
+        img.draft('RGB', (max_size, max_size))
+
     # EXIF 回転補正（EXIF 情報がない or 壊れている場合は無視）
     with contextlib.suppress(Exception):
         img = ImageOps.exif_transpose(img)
@@ -251,23 +275,82 @@ def load_photo_bytes(
         if tw > 0 and th > 0:
             img = _center_crop(img, tw, th)
 
-    # リサイズ（長辺基準）
-    w, h = img.size
-    if max(w, h) > max_size:
-        if w >= h:
-            new_w = max_size
-            new_h = max(1, int(h * max_size / w))
-        else:
-            new_h = max_size
-            new_w = max(1, int(w * max_size / h))
-        img = img.resize((new_w, new_h), Image.LANCZOS)
+    # リサイズ（長辺基準、アスペクト比維持・拡大はしない）
+    img.thumbnail((max_size, max_size), resample)
 
-    # PNG bytes に変換
+    # bytes に変換（RGB 変換済みなので JPEG もそのまま保存できる）
     buf = io.BytesIO()
-    img.save(buf, format='PNG')
+    if fmt.upper() == 'JPEG':
+        img.save(buf, format='JPEG', quality=85)
+    else:
+        img.save(buf, format='PNG')
     return buf.getvalue()
 
 
+def load_photo_bytes_cached(
+    photo_path: str,
+    max_size: int = 600,
+    target_rect: tuple[int, int] | None = None,
+    resample: Image.Resampling = Image.Resampling.LANCZOS,
+    fmt: str = 'PNG',
+) -> bytes | None:
+    """load_photo_bytes の結果をキャッシュして返す。
+
+    プレビュー再描画のたびに同じ写真をデコード・リサイズし直さないよう、
+    (パス, 更新日時, サイズ, 各オプション) ごとに結果を保持する。
+    写真を差し替えると更新日時が変わるため、古い画像は返さない。
+    """
+    try:
+        st = os.stat(photo_path)
+    except OSError:
+        return load_photo_bytes(photo_path, max_size, target_rect, resample, fmt)
+    return _load_photo_bytes_for_stat(
+        photo_path, st.st_mtime_ns, st.st_size, max_size, target_rect, resample, fmt,
+    )
+
+
+_BATCH_MAX_WORKERS = 8
+
+
+def load_photos_batch(
+    photo_paths: Iterable[str],
+    max_size: int = 600,
+    target_rect: tuple[int, int] | None = None,
+    resample: Image.Resampling = Image.Resampling.LANCZOS,
+    fmt: str = 'PNG',
+) -> list[bytes | None]:
+    """複数の写真を並列に読み込み、入力と同じ順で返す。
+
+    ファイル読込と Pillow のデコード・リサイズは GIL を解放するため、
+    スレッドで並列化できる。結果は load_photo_bytes_cached のキャッシュにも
+    載るので、直後の個別呼び出しはデコードし直さない。
+    """
+    paths = list(photo_paths)
+
+    def load(path: str) -> bytes | None:
+        return load_photo_bytes_cached(path, max_size, target_rect, resample, fmt)
+
+    workers = min(_BATCH_MAX_WORKERS, len(paths), os.cpu_count() or 1)
+    if workers <= 1:
+        return [load(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(load, paths))
+
+
+# 学年全員分（数百人）を JPEG で保持しても数十 MB に収まる
+@functools.lru_cache(maxsize=512)
+def _load_photo_bytes_for_stat(
+    photo_path: str,
+    mtime_ns: int,
+    size: int,
+    max_size: int,
+    target_rect: tuple[int, int] | None,
+    resample: Image.Resampling,
+    fmt: str,
+) -> bytes | None:
+    return load_photo_bytes(photo_path, max_size, target_rect, resample, fmt)
+
+
 def _center_crop(img: Image.Image, target_w: int, target_h: int) -> Image.Image:
     """アスペクト比に合わせてセンタークロップする。"""
     w, h = img.size
@@ -304,8 +387,7 @@ def get_match_status(
     matched = 0
     unmatched_names: list[str] = []
 
-    for _, row in df.iterrows():
-        data_row = row.to_dict()
+    for idx, data_row in zip(df.index, df.to_dict('records'), strict=True):
         if match_photo_to_student(data_row, photo_map) is not None:
             matched += 1
         else:
@@ -313,7 +395,7 @@ def get_match_status(
             if name and name.lower() != 'nan':
                 unmatched_names.append(name)
             else:
-                unmatched_names.append(f"(行 {_ + 1})")
+                unmatched_names.append(f"(行 {idx + 1})")
 
     return matched, total, unmatched_names
 
@@ -340,21 +422,26 @@ def import_photos_from_folder(
 
     os.makedirs(photo_dir, exist_ok=True)
 
-    for fname in os.listdir(src_dir):
-        ext = os.path.splitext(fname)[1].lower()
-        if ext not in _SUPPORTED_EXTENSIONS:
+    with os.scandir(src_dir) as it:
+        entries = list(it)
+    for entry in entries:
+        fname = entry.name
+        if _split_photo_name(fname)[1] not in _SUPPORTED_EXTENSIONS:
             continue
-
-        src_path = os.path.join(src_dir, fname)
-        if not os.path.isfile(src_path):
+        if not entry.is_file():
             continue
 
+        src_path = entry.path
         dst_path = os.path.join(photo_dir, fname)
         if os.path.exists(dst_path):
             skipped.append(fname)
             continue
 
-        shutil.copy2(src_path, dst_path)
+        # copy2 の copystat（権限・拡張属性）は不要。更新日時だけ引き継ぐ
+        shutil.copyfile(src_path, dst_path)
+        st = entry.stat()
+        with contextlib.suppress(OSError):
+            os.utime(dst_path, ns=(st.st_atime_ns, st.st_mtime_ns))
         copied += 1
 
     return copied, skipped
@@ -27,11 +27,20 @@ def is_special_needs_class(class_name: str) -> bool:
     return not bool(re.fullmatch(r'\d+', normalized))
 
 
+def _special_needs_mask(kumi: pd.Series) -> pd.Series:
+    """「組」列の各行が特別支援学級かどうかの bool Series を返す。
+
+    組の値の種類は数個しかないため、判定は値の種類ごとに 1 回だけ行う。
+    """
+    special = [v for v in kumi.unique() if is_special_needs_class(v)]
+    return kumi.isin(special)
+
+
 def detect_special_needs_students(df: pd.DataFrame) -> pd.DataFrame:
     """DataFrame から特別支援学級在籍の児童を抽出する。"""
     if '組' not in df.columns:
         return pd.DataFrame(columns=df.columns)
-    mask = df['組'].apply(is_special_needs_class)
+    mask = _special_needs_mask(df['組'])
     return df[mask].copy()
 
 
@@ -39,16 +48,15 @@ def detect_regular_students(df: pd.DataFrame) -> pd.DataFrame:
     """DataFrame から通常学級在籍の児童を抽出する。"""
     if '組' not in df.columns:
         return df.copy()
-    mask = df['組'].apply(lambda v: not is_special_needs_class(v))
-    return df[mask].copy()
+    mask = _special_needs_mask(df['組'])
+    return df[~mask].copy()
 
 
 def get_special_needs_classes(df: pd.DataFrame) -> list[str]:
     """DataFrame 内の特別支援学級名を返す（ソート済み）。"""
     if '組' not in df.columns:
         return []
-    all_classes = df['組'].unique()
-    return sorted([c for c in all_classes if is_special_needs_class(str(c))])
+    return sorted(v for v in df['組'].unique() if is_special_needs_class(v))
 
 
 def merge_special_needs_students(
@@ -7,18 +7,24 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import hashlib
+import json
 import logging
 import os
+import re
 import subprocess
 import sys
 import zipfile
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from core.config import save_config
 
@@ -26,9 +32,32 @@ logger = logging.getLogger(__name__)
 
 _API_BASE = 'https://api.github.com/repos'
 _REQUEST_TIMEOUT = 5  # seconds
-
-# 差分アップデート時にスキップするファイル（ユーザー編集可能）
-_SKIP_FILES: frozenset[str] = frozenset({'config.json'})
+_DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+_HASH_BUFFER_SIZE = 1 << 20  # 1 MiB
+_HASH_MAX_WORKERS = 8
+
+# 更新確認 → manifest → zip の一連の通信で TLS 接続を使い回す。
+# GitHub 側の一時的な 502/503/504 は 2 回まで再試行する
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    ),
+))
+
+# compute_local_manifest のハッシュキャッシュ（app_dir 直下、config.json と同階層）
+_MANIFEST_CACHE_FILE = '_manifest_cache.json'
+
+# 差分アップデート時にスキップするファイル（ユーザー編集可能・キャッシュ）。
+# 書き込み途中で中断されたキャッシュの一時ファイルも対象外にする
+_SKIP_FILES: frozenset[str] = frozenset({
+    'config.json', _MANIFEST_CACHE_FILE, _MANIFEST_CACHE_FILE + '.tmp',
+})
 
 
 # ── データクラス ─────────────────────────────────────────────────────────────
@@ -48,16 +77,64 @@ class UpdateInfo:
 
 # ── バージョン比較 ───────────────────────────────────────────────────────────
 
-def _parse_version(v: str) -> tuple[int, ...]:
-    """'1.2.3' や 'v1.2.3' → (1, 2, 3)。"""
-    return tuple(int(x) for x in v.lstrip('v').split('.'))
+# PEP 440 のプレリリース区分（別表記 → 順位）
+_PRE_RANKS: dict[str, int] = {
+    'a': 0, 'alpha': 0,
+    'b': 1, 'beta': 1,
+    'c': 2, 'rc': 2, 'pre': 2, 'preview': 2,
+}
+# 正式リリースはどのプレリリースよりも後
+_FINAL_RANK = 3
+
+_VERSION_RE = re.compile(
+    r'v?(?P<release>\d+(?:\.\d+)*)'
+    r'(?:[-_.]?(?P<pre>alpha|beta|preview|pre|rc|a|b|c)[-_.]?(?P<pre_n>\d*))?'
+    r'(?:[-_.]?(?:post|rev|r)[-_.]?(?P<post_n>\d*))?'
+    r'(?:[-_.]?dev[-_.]?(?P<dev_n>\d*))?'
+    r'(?:\+[0-9a-z.]*)?',
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_version(
+    v: str,
+) -> tuple[tuple[int, ...], tuple[int, int], int, tuple[int, int]]:
+    """バージョン文字列を PEP 440 の順序で比較できるキーに変換する。
+
+    '1.2.3' / 'v1.2.3' → ((1, 2, 3), 正式, post なし, dev なし)。
+    '1.3.0-rc1' のようなプレリリースは同じ番号の正式リリースより前、
+    '.post1' は後、'.dev1' はさらに前になる。'+build' は比較に使わない。
+    末尾の 0 は無視する（'1.3' と '1.3.0' は同じ）。
+
+    Raises:
+        ValueError: 解釈できない文字列
+    """
+    m = _VERSION_RE.fullmatch(v.strip())
+    if m is None:
+        msg = f'バージョン文字列を解釈できません: {v!r}'
+        raise ValueError(msg)
+    release = [int(x) for x in m['release'].split('.')]
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()
+    post_n, dev_n = m['post_n'], m['dev_n']
+    if m['pre']:
+        pre = (_PRE_RANKS[m['pre'].lower()], int(m['pre_n'] or 0))
+    elif dev_n is not None and post_n is None:
+        # '1.3.0.dev1' は 1.3.0 のどのプレリリースよりも前
+        pre = (-1, 0)
+    else:
+        pre = (_FINAL_RANK, 0)
+    post = int(post_n or 0) if post_n is not None else -1
+    dev = (0, int(dev_n or 0)) if dev_n is not None else (1, 0)
+    return (tuple(release), pre, post, dev)
 
 
 def is_newer(remote: str, local: str) -> bool:
     """remote が local より新しいバージョンか判定する。"""
     try:
         return _parse_version(remote) > _parse_version(local)
-    except (ValueError, AttributeError):
+    except (ValueError, AttributeError, TypeError):
         return False
 
 
@@ -80,13 +157,23 @@ def check_for_update(config: dict[str, Any]) -> UpdateInfo | None:
 
     current = update_cfg.get('current_app_version', '0.0.0')
 
+    headers = {'Accept': 'application/vnd.github.v3+json'}
+    # 前回「更新なし」と判定したリリースから変化がなければ 304 が返り、
+    # 本文の転送も API レート制限の消費もない。
+    # 判定に使ったバージョン・スキップ設定が変わっていれば判定し直す
+    last_etag = update_cfg.get('last_etag', '')
+    if (
+        last_etag
+        and update_cfg.get('last_etag_version') == current
+        and update_cfg.get('last_etag_skip', '') == update_cfg.get('skip_version', '')
+    ):
+        headers['If-None-Match'] = last_etag
+
     try:
         url = f'{_API_BASE}/{repo}/releases/latest'
-        resp = requests.get(
-            url,
-            headers={'Accept': 'application/vnd.github.v3+json'},
-            timeout=_REQUEST_TIMEOUT,
-        )
+        resp = _session.get(url, headers=headers, timeout=_REQUEST_TIMEOUT)
+        if resp.status_code == 304:
+            return None
         resp.raise_for_status()
     except requests.RequestException as exc:
         logger.debug('GitHub API リクエスト失敗: %s', exc)
@@ -94,8 +181,10 @@ def check_for_update(config: dict[str, Any]) -> UpdateInfo | None:
 
     data = resp.json()
     tag = data.get('tag_name', '')
+    etag = resp.headers.get('ETag', '')
 
     if not is_newer(tag, current):
+        _remember_etag(config, etag)
         return None
 
     # スキップ設定
@@ -118,8 +207,11 @@ def check_for_update(config: dict[str, Any]) -> UpdateInfo | None:
         logger.warning('Release %s に zip アセットが見つかりません', tag)
         return None
 
-    # last_check_time 更新
+    # last_check_time 更新（更新を案内するリリースは次回も必ず本文を取得する）
     update_cfg['last_check_time'] = datetime.now().isoformat(timespec='seconds')
+    update_cfg['last_etag'] = ''
+    update_cfg['last_etag_version'] = ''
+    update_cfg['last_etag_skip'] = ''
     config['update'] = update_cfg
     with contextlib.suppress(OSError):
         save_config(config)
@@ -139,6 +231,28 @@ def check_for_update(config: dict[str, Any]) -> UpdateInfo | None:
     )
 
 
+def _remember_etag(config: dict[str, Any], etag: str) -> None:
+    """「更新なし」と判定したレスポンスの ETag を config に保存する。
+
+    判定時の current_app_version と skip_version も併せて保存し、
+    どちらかが変わったら次回はこの ETag を使わない。
+    """
+    update_cfg = config.get('update', {})
+    if not isinstance(etag, str) or not etag:
+        return
+    context = {
+        'last_etag': etag,
+        'last_etag_version': update_cfg.get('current_app_version', '0.0.0'),
+        'last_etag_skip': update_cfg.get('skip_version', ''),
+    }
+    if all(update_cfg.get(k) == v for k, v in context.items()):
+        return
+    update_cfg.update(context)
+    config['update'] = update_cfg
+    with contextlib.suppress(OSError):
+        save_config(config)
+
+
 # ── ダウンロード ─────────────────────────────────────────────────────────────
 
 def download_release_asset(
@@ -156,18 +270,21 @@ def download_release_asset(
     Returns:
         保存先パス
     """
-    resp = requests.get(asset_url, stream=True, timeout=30)
+    resp = _session.get(asset_url, stream=True, timeout=30)
     resp.raise_for_status()
 
     total = int(resp.headers.get('content-length', 0))
+    # サイズ不明のときは進捗を通知しない
+    report = progress_cb if total > 0 else None
+    inv_total = 1.0 / total if total > 0 else 0.0
     downloaded = 0
 
     with open(dest_path, 'wb') as f:
-        for chunk in resp.iter_content(chunk_size=65536):
+        for chunk in resp.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
             f.write(chunk)
             downloaded += len(chunk)
-            if progress_cb and total > 0:
-                progress_cb(downloaded / total)
+            if report is not None:
+                report(downloaded * inv_total)
 
     return dest_path
 
@@ -176,7 +293,7 @@ def download_release_asset(
 
 def download_manifest(url: str) -> dict[str, Any]:
     """manifest.json をダウンロードして dict で返す。"""
-    resp = requests.get(url, timeout=_REQUEST_TIMEOUT)
+    resp = _session.get(url, timeout=_REQUEST_TIMEOUT)
     resp.raise_for_status()
     return resp.json()
 
@@ -185,29 +302,97 @@ def compute_local_manifest(app_dir: str) -> dict[str, dict[str, Any]]:
     """ローカルファイルの SHA-256 ハッシュマニフェストを計算する。
 
     config.json 等のユーザー編集ファイルはスキップする。
+    (size, mtime_ns) が前回と同じファイルは _manifest_cache.json の
+    ハッシュを再利用し、変化したファイルだけを再計算する。
 
     Returns:
         {"相対パス": {"sha256": "...", "size": N}, ...}
     """
-    result: dict[str, dict[str, Any]] = {}
+    cache_path = os.path.join(app_dir, _MANIFEST_CACHE_FILE)
+    cache = _load_manifest_cache(cache_path)
+
+    new_cache: dict[str, dict[str, Any]] = {}
+    misses: list[tuple[str, str, int]] = []
     for root, _dirs, files in os.walk(app_dir):
         for fname in files:
             full = os.path.join(root, fname)
             rel = os.path.relpath(full, app_dir).replace('\\', '/')
             if rel in _SKIP_FILES:
                 continue
-            sha = hashlib.sha256()
-            with open(full, 'rb') as f:
-                while True:
-                    chunk = f.read(65536)
-                    if not chunk:
-                        break
-                    sha.update(chunk)
-            result[rel] = {
-                'sha256': sha.hexdigest(),
-                'size': os.path.getsize(full),
-            }
-    return result
+            st = os.stat(full)
+            cached = cache.get(rel)
+            if (
+                cached is not None
+                and cached.get('size') == st.st_size
+                and cached.get('mtime_ns') == st.st_mtime_ns
+            ):
+                new_cache[rel] = cached
+            else:
+                new_cache[rel] = {}
+                misses.append((rel, full, st.st_mtime_ns))
+
+    # SHA-256 計算中は GIL が解放されるため、ファイル単位でスレッドに分ける
+    paths = [full for _, full, _ in misses]
+    workers = min(_HASH_MAX_WORKERS, len(misses), os.cpu_count() or 1)
+    if workers <= 1:
+        hashed = list(map(_hash_file, paths))
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            hashed = list(ex.map(_hash_file, paths))
+    for (rel, _full, mtime_ns), (digest, size) in zip(misses, hashed, strict=True):
+        new_cache[rel] = {'sha256': digest, 'size': size, 'mtime_ns': mtime_ns}
+
+    if new_cache != cache:
+        _save_manifest_cache(cache_path, new_cache)
+    return {
+        rel: {'sha256': entry['sha256'], 'size': entry['size']}
+        for rel, entry in new_cache.items()
+    }
+
+
+def _load_manifest_cache(path: str) -> dict[str, dict[str, Any]]:
+    """ハッシュキャッシュを読み込む。存在しない・壊れている場合は空 dict。"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {
+        rel: entry for rel, entry in data.items()
+        if isinstance(entry, dict) and isinstance(entry.get('sha256'), str)
+    }
+
+
+def _save_manifest_cache(path: str, cache: dict[str, dict[str, Any]]) -> None:
+    """ハッシュキャッシュを一時ファイル経由でアトミックに書き出す。
+
+    インストール先が書き込み不可でも更新確認自体は続行する。
+    """
+    tmp = path + '.tmp'
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        logger.debug('manifest キャッシュの保存に失敗: %s', path, exc_info=True)
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+
+
+def _hash_file(path: str) -> tuple[str, int]:
+    """ファイルの SHA-256 (hex) とサイズを返す。"""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'sha256').hexdigest(), size
+        sha = hashlib.sha256()
+        buf = bytearray(_HASH_BUFFER_SIZE)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            sha.update(view[:n])
+        return sha.hexdigest(), size
 
 
 def diff_manifests(
@@ -247,25 +432,20 @@ def extract_changed_files(
             if '/' in first:
                 top_prefix = first.split('/')[0] + '/'
 
+        # 展開対象だけを先に絞り込む（トップレベルフォルダを除去した相対パスで照合）
         changed_set = set(changed_files)
-        for info in zf.infolist():
-            if info.is_dir():
-                continue
-            # トップレベルフォルダを除去した相対パス
-            inner_path = info.filename
-            if top_prefix and inner_path.startswith(top_prefix):
-                inner_path = inner_path[len(top_prefix):]
-            if not inner_path:
-                continue
-            if inner_path in changed_set:
-                dest = os.path.join(staging_dir, inner_path.replace('/', os.sep))
-                os.makedirs(os.path.dirname(dest), exist_ok=True)
-                with zf.open(info) as src, open(dest, 'wb') as dst:
-                    while True:
-                        chunk = src.read(65536)
-                        if not chunk:
-                            break
-                        dst.write(chunk)
+        changed_set.discard('')
+        wanted = [
+            (info, inner_path)
+            for info in zf.infolist()
+            if not info.is_dir()
+            and (inner_path := info.filename.removeprefix(top_prefix)) in changed_set
+        ]
+        for info, inner_path in wanted:
+            # filename だけ差し替えれば ZipFile.extract がその位置へ展開する
+            # （ローカルヘッダの照合は orig_filename で行われる）
+            info.filename = inner_path
+            zf.extract(info, staging_dir)
 
 
 # ── バッチファイル生成（--onedir 対応） ──────────────────────────────────────
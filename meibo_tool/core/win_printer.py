@@ -16,7 +16,12 @@ from __future__ import annotations
 
 import contextlib
 import ctypes
+import itertools
+import os
 import struct
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
 from typing import TYPE_CHECKING
 
 from core.lay_renderer import render_layout_to_image
@@ -149,9 +154,45 @@ def _create_devmode(
         win32print.ClosePrinter(hprinter)
 
 
+# 検証済み DevMode のキャッシュ {(プリンター名, 用紙, 向き): DevMode}
+# OpenPrinter + DocumentProperties ×3 のドライバ往復をジョブごとに繰り返さない。
+# 作成失敗 (None) はキャッシュしない
+_DEVMODE_CACHE: dict[tuple[str, str, str], object] = {}
+
+
+def _get_devmode(
+    printer_name: str,
+    paper_size: str = 'A4',
+    orientation: str = 'portrait',
+) -> object | None:
+    """_create_devmode の結果をプリンター・用紙・向きごとに使い回す。"""
+    key = (printer_name, paper_size, orientation)
+    devmode = _DEVMODE_CACHE.get(key)
+    if devmode is None:
+        devmode = _create_devmode(printer_name, paper_size, orientation)
+        if devmode is not None:
+            _DEVMODE_CACHE[key] = devmode
+    return devmode
+
+
+def clear_devmode_cache() -> None:
+    """DevMode キャッシュを破棄する（プリンター設定の変更後に呼ぶ）。"""
+    _DEVMODE_CACHE.clear()
+
+
 # ── PIL Image → GDI DC 転送 ──────────────────────────────────────────────────
 
 
+def _pack_bgrx(img: object) -> tuple[int, int, bytes]:
+    """PIL Image を 32bpp DIB 用の (幅, 高さ, BGRX バイト列) にする。"""
+    # convert() は同じモードでも全画素をコピーするため、RGB ならそのまま使う
+    img_rgb = img if img.mode == 'RGB' else img.convert('RGB')
+    w, h = img_rgb.size
+    # raw エンコーダは画素を詰める際に並べ替えを同時に行うため、
+    # 入れ替え用の中間バッファは作られない
+    return w, h, img_rgb.tobytes('raw', 'BGRX')
+
+
 def _blit_pil_image(
     dc: object, img: object, dpi_x: int, dpi_y: int,
 ) -> None:
@@ -163,40 +204,31 @@ def _blit_pil_image(
         dpi_x: プリンターの水平 DPI
         dpi_y: プリンターの垂直 DPI
     """
-    img_rgb = img.convert('RGB')
-    w, h = img_rgb.size
+    w, h, bits = _pack_bgrx(img)
+    _blit_bits(dc, w, h, bits, dpi_x, dpi_y)
+
 
+def _blit_bits(
+    dc: object, w: int, h: int, bits: bytes, dpi_x: int, dpi_y: int,
+) -> None:
+    """BGRX ピクセル列を GDI DC のページ全体に StretchDIBits で描画する。"""
     # BITMAPINFOHEADER (40 bytes)
+    # 32bpp (BGRX) なら 1 行 = w*4 バイトで常に 4 バイト境界に揃うため、
+    # 行パディングの処理が要らない
     bih = struct.pack(
         '<IiiHHIIiiII',
         40,         # biSize
         w,          # biWidth
         -h,         # biHeight (負値=トップダウン)
         1,          # biPlanes
-        24,         # biBitCount
-        0,          # biCompression (BI_RGB)
-        0,          # biSizeImage
+        32,         # biBitCount
+        0,          # biCompression (BI_RGB、上位 1 バイトは無視される)
+        w * h * 4,  # biSizeImage
         round(dpi_x * 39.3701),  # biXPelsPerMeter
         round(dpi_y * 39.3701),  # biYPelsPerMeter
         0, 0,       # biClrUsed, biClrImportant
     )
 
-    # ピクセルデータ (RGB → BGR 変換 + 各行4バイト境界アライメント)
-    # PIL の tobytes('raw', 'BGR') で BGR 順に取得
-    stride = (w * 3 + 3) & ~3
-    padding = stride - w * 3
-
-    if padding == 0:
-        bits = img_rgb.tobytes('raw', 'BGR')
-    else:
-        # 行ごとにパディング追加
-        raw = img_rgb.tobytes('raw', 'BGR')
-        rows = []
-        for y_row in range(h):
-            row_data = raw[y_row * w * 3:(y_row + 1) * w * 3]
-            rows.append(row_data + b'\x00' * padding)
-        bits = b''.join(rows)
-
     hdc = dc.GetSafeHdc()
 
     # 印刷領域サイズ (プリンタードット)
@@ -216,6 +248,34 @@ def _blit_pil_image(
     )
 
 
+# ラスタライズ用子プロセスの共有状態（_init_render_worker がプール起動時に 1 回だけ設定）
+_worker_dpi: int = 300
+_worker_registry: dict[str, LayFile] | None = None
+
+
+def _init_render_worker(
+    dpi: int, layout_registry: dict[str, LayFile] | None,
+) -> None:
+    """プロセスプールの initializer。DPI とレジストリを子プロセスに 1 回だけ渡す。"""
+    global _worker_dpi, _worker_registry
+    _worker_dpi = dpi
+    _worker_registry = layout_registry
+
+
+def _render_page_bits(lay: LayFile) -> tuple[int, int, bytes]:
+    """1 ページをラスタライズして BGRX バイト列で返す。
+
+    ProcessPoolExecutor から呼べるようにモジュールレベルに置く。
+    DPI とレイアウトレジストリは _init_render_worker で設定済みのものを使い、
+    ページごとにはレイアウト本体だけを pickle する。
+    """
+    img = render_layout_to_image(
+        lay, dpi=_worker_dpi, for_print=True,
+        layout_registry=_worker_registry,
+    )
+    return _pack_bgrx(img)
+
+
 # ── 印刷ジョブ ───────────────────────────────────────────────────────────────
 
 
@@ -255,7 +315,7 @@ class PrintJob:
             paper_size: 用紙サイズ ('A3', 'A4', 'B4', 'B5' 等)
             orientation: 'portrait' or 'landscape'
         """
-        devmode = _create_devmode(
+        devmode = _get_devmode(
             self._printer_name, paper_size, orientation,
         )
 
@@ -304,6 +364,63 @@ class PrintJob:
 
         self._dc.EndPage()
 
+    def print_pages(
+        self, lays: Sequence[LayFile],
+        layout_registry: dict[str, LayFile] | None = None,
+        progress_cb: Callable[[int, int], None] | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        """複数ページを印刷する。
+
+        ラスタライズ (CPU) をプロセスプールで先行させ、このスレッドは
+        StartPage → StretchDIBits → EndPage だけを順に行う。
+        GDI の DC は 1 スレッドからしか触らない。
+        先行するページ数はワーカー数までに抑える（A4 300dpi で 1 枚約 35MB）。
+        ページ数がワーカー数の 2 倍未満ならプール起動のコストに見合わないため
+        print_page で順に印刷する。
+
+        Args:
+            lays: 印刷するレイアウト（ページ順）
+            layout_registry: MEIBO ref_name 解決用レジストリ
+            progress_cb: 1 ページ転送するごとに (完了ページ数, 総ページ数) で呼ぶ
+            max_workers: ラスタライズのワーカー数上限（None で CPU 数、最大 4）
+        """
+        if not self._started or self._dc is None:
+            msg = 'start() を先に呼び出してください。'
+            raise RuntimeError(msg)
+
+        total = len(lays)
+        workers = min(total, max_workers or min(4, os.cpu_count() or 1))
+        if workers <= 1 or total < 2 * workers:
+            for i, lay in enumerate(lays):
+                self.print_page(lay, layout_registry=layout_registry)
+                if progress_cb is not None:
+                    progress_cb(i + 1, total)
+            return
+
+        dpi = min(self._dpi_x, self._dpi_y)
+        pending: deque[Future[tuple[int, int, bytes]]] = deque()
+        # レジストリは initializer で子プロセスごとに 1 回だけ送る
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_render_worker,
+            initargs=(dpi, layout_registry),
+        ) as ex:
+            remaining = iter(lays)
+            for lay in itertools.islice(remaining, workers):
+                pending.append(ex.submit(_render_page_bits, lay))
+            done = 0
+            while pending:
+                w, h, bits = pending.popleft().result()
+                # 転送中に次のページのラスタライズを進めておく
+                for lay in itertools.islice(remaining, 1):
+                    pending.append(ex.submit(_render_page_bits, lay))
+                self._dc.StartPage()
+                _blit_bits(self._dc, w, h, bits, self._dpi_x, self._dpi_y)
+                self._dc.EndPage()
+                done += 1
+                if progress_cb is not None:
+                    progress_cb(done, total)
+
     def end(self) -> None:
         """印刷ジョブを終了する。"""
         if self._dc is not None:
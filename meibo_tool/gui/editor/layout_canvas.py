@@ -21,6 +21,7 @@ from core.lay_parser import (
     Rect,
 )
 from core.lay_renderer import (
+    PILBackend,
     canvas_to_model,
     model_to_canvas,
     render_layout_to_image,
@@ -79,6 +80,8 @@ class LayoutCanvas(ctk.CTkFrame):
         self._selected_idx: int = -1
         self._layout_registry: dict[str, LayFile] = {}
         self._photo_image: ImageTk.PhotoImage | None = None  # GC 防止
+        # 同じズーム・ページサイズの再描画では画像とキャッシュを使い回す
+        self._backend: PILBackend | None = None
 
         # ドラッグ状態
         self._dragging = False
@@ -147,10 +150,15 @@ class LayoutCanvas(ctk.CTkFrame):
         # PIL でレンダリング → PhotoImage として Canvas に配置
         unit_mm = self._lay.paper.unit_mm if self._lay.paper else 0.25
         dpi = max(1, int(self._scale * 25.4 / unit_mm))
+        if self._backend is None or not self._backend.matches(self._lay, dpi):
+            self._backend = PILBackend.for_layout(
+                self._lay, dpi, high_quality=False,
+            )
         img = render_layout_to_image(
             self._lay, dpi=dpi,
             layout_registry=self._layout_registry,
             editor_mode=True,
+            backend=self._backend,
         )
         self._photo_image = ImageTk.PhotoImage(img)
         self._canvas.create_image(
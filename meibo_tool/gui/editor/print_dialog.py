@@ -134,10 +134,13 @@ class PrintDialog(ctk.CTkToplevel):
         try:
             with PrintJob(printer_name) as job:
                 job.start(f'名簿印刷 ({total}ページ)')
-                for i, lay in enumerate(self._layouts):
-                    job.print_page(lay, layout_registry=self._registry)
-                    progress = (i + 1) / total
-                    self.after(0, self._update_progress, progress, i + 1, total)
+                job.print_pages(
+                    self._layouts,
+                    layout_registry=self._registry,
+                    progress_cb=lambda done, n: self.after(
+                        0, self._update_progress, done / n, done, n,
+                    ),
+                )
 
             self.after(0, self._on_print_done, None)
 
@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING
 import customtkinter as ctk
 from PIL import Image as PILImage
 
-from core.lay_renderer import render_layout_to_image
+from core.lay_renderer import render_layouts_to_images
 
 if TYPE_CHECKING:
     from core.lay_parser import LayFile
@@ -89,11 +89,9 @@ class PrintPreviewDialog(ctk.CTkToplevel):
 
     def _render_all_pages(self) -> None:
         """全ページを PIL 画像にレンダリングする。"""
-        for lay in self._layouts:
-            img = render_layout_to_image(
-                lay, dpi=150, layout_registry=self._registry,
-            )
-            self._preview_images.append(img)
+        self._preview_images.extend(render_layouts_to_images(
+            self._layouts, dpi=150, layout_registry=self._registry,
+        ))
 
     def _show_page(self, idx: int) -> None:
         """指定ページを表示する。"""
@@ -108,7 +106,7 @@ class PrintPreviewDialog(ctk.CTkToplevel):
         ratio = self._MAX_DISPLAY_WIDTH / img.width
         display_w = int(img.width * ratio)
         display_h = int(img.height * ratio)
-        display_img = img.resize((display_w, display_h), PILImage.LANCZOS)
+        display_img = img.resize((display_w, display_h), PILImage.Resampling.LANCZOS)
 
         self._tk_image = ctk.CTkImage(
             light_image=display_img, size=(display_w, display_h),
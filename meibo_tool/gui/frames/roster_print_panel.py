@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import logging
 import math
 import os
@@ -30,6 +31,7 @@ from core.lay_renderer import (
     get_page_arrangement,
     has_meibo,
     render_layout_to_image,
+    render_tiled_layout_to_image,
     tile_layouts,
 )
 from core.lay_serializer import load_layout
@@ -421,6 +423,7 @@ class RosterPrintPanel(ctk.CTkFrame):
         )
 
         df = self._filtered_df if self._filtered_df is not None else self._df
+        render: Callable[[], PILImage.Image] | None = None
         if df is not None and not df.empty:
             opts = self._get_options()
             opts['total_count'] = len(df)
@@ -463,31 +466,37 @@ class RosterPrintPanel(ctk.CTkFrame):
                     preview_lay = self._selected_lay
         else:
             # データなし: ラベルレイアウトはタイル配置して用紙全体を表示
+            # （全セル同一内容なので 1 枚だけ描画して貼り付ける）
+            preview_lay = self._selected_lay
             if (per_page > 1 or scale < 1.0):
-                templates = [self._selected_lay] * per_page
-                pages = tile_layouts(
-                    templates, cols, rows, scale=scale,
+                render = functools.partial(
+                    render_tiled_layout_to_image,
+                    self._selected_lay, cols, rows, dpi=150, scale=scale,
                     paper=self._selected_lay.paper,
+                    layout_registry=self._registry,
                 )
-                preview_lay = pages[0] if pages else self._selected_lay
-            else:
-                preview_lay = self._selected_lay
+
+        if render is None:
+            render = functools.partial(
+                render_layout_to_image,
+                preview_lay, dpi=150, layout_registry=self._registry,
+            )
 
         # バックグラウンドでレンダリング（世代カウンターでキャンセル管理）
         self._render_generation += 1
         gen = self._render_generation
         threading.Thread(
             target=self._render_worker,
-            args=(preview_lay, gen),
+            args=(render, gen),
             daemon=True,
         ).start()
 
-    def _render_worker(self, lay: LayFile, generation: int) -> None:
-        """バックグラウンドでレイアウトをレンダリングする。"""
+    def _render_worker(
+        self, render: Callable[[], PILImage.Image], generation: int,
+    ) -> None:
+        """バックグラウンドでプレビュー画像をレンダリングする。"""
         try:
-            img = render_layout_to_image(
-                lay, dpi=150, layout_registry=self._registry,
-            )
+            img = render()
             if generation == self._render_generation and self.winfo_exists():
                 self.after(0, lambda: self._show_preview_image(img))
         except Exception:
@@ -183,7 +183,7 @@ def _draw_images(
                 h = int(pil_img.height * scale)
 
             if w > 0 and h > 0:
-                pil_img = pil_img.resize((w, h), Image.LANCZOS)
+                pil_img = pil_img.resize((w, h), Image.Resampling.LANCZOS)
                 # RGBA → RGB 合成
                 if pil_img.mode == 'RGBA':
                     bg = Image.new('RGB', pil_img.size, _BG_COLOR)
@@ -1,6 +1,7 @@
 """名簿帳票ツール — エントリーポイント"""
 
 import logging
+import multiprocessing
 import os
 import sys
 
@@ -24,4 +25,7 @@ def main():
 
 
 if __name__ == '__main__':
+    # frozen exe でプロセスプール（fill_meibo_layout の parallel、
+    # PrintJob.print_pages のラスタライズ）の子プロセスが GUI を再起動しないようにする
+    multiprocessing.freeze_support()
     main()
@@ -103,6 +103,9 @@ def default_config() -> dict:
             'current_app_version': '1.0.0',
             'last_check_time': '',
             'skip_version': '',
+            'last_etag': '',
+            'last_etag_version': '',
+            'last_etag_skip': '',
         },
         'data_source': {
             'mode': 'manual',
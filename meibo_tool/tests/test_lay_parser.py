@@ -522,6 +522,13 @@ class TestLayoutObjectTableColumns:
         assert len(obj.table_columns) == 1
         assert obj.table_columns[0].header == '氏名'
 
+    def test_slots_reject_unknown_attribute(self):
+        """__slots__ によりインスタンス辞書を持たず、未定義属性は設定できない。"""
+        obj = LayoutObject(obj_type=ObjectType.LABEL)
+        assert not hasattr(obj, '__dict__')
+        with pytest.raises(AttributeError):
+            obj.unknown_attr = 1
+
 
 # ── new_image ────────────────────────────────────────────────────────────────
 
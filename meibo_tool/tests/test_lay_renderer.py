@@ -25,6 +25,7 @@ from core.lay_parser import (
 )
 from core.lay_renderer import (
     _contains_gaiji,
+    _meibo_cell_offsets,
     _meibo_page_capacity,
     _normalize_text,
     _should_render_vertical_text,
@@ -193,6 +194,16 @@ class TestFillLayout:
 
         assert result.objects[0].text == ''
 
+    def test_unchanged_lists_shared_with_original(self) -> None:
+        """差し替えない raw_tags はコピーせず元オブジェクトと共有する。"""
+        obj = new_field(10, 20, 200, 50, field_id=108)
+        lay = _make_layout(obj)
+        result = fill_layout(lay, {'氏名': 'テスト'})
+
+        assert result.objects[0].raw_tags is obj.raw_tags
+        assert result.raw_tags is lay.raw_tags
+        assert result.objects is not lay.objects
+
 
 class TestFillLayoutSpecialKeys:
     """fill_layout() 特殊キーのテスト。"""
@@ -436,6 +447,11 @@ class TestContainsGaiji:
         text = '邊\U000E0100'
         assert _contains_gaiji(text) is True
 
+    def test_just_below_extension_b(self) -> None:
+        """拡張B 直前 (U+1FFFF) や絵文字は外字ではない。"""
+        assert _contains_gaiji('\U0001FFFF') is False
+        assert _contains_gaiji('\U0001F600') is False
+
 
 class TestFillLayoutFontSelection:
     """fill_layout のフォント選択テスト: 外字なし→元フォント、外字あり→IPAmj明朝。"""
@@ -493,6 +509,34 @@ class TestFillLayoutFontSelection:
         assert result.objects[0].font.name == 'IPAmj明朝'
         assert result.objects[0].font.vertical is True
 
+    def test_gaiji_fonts_shared_between_fields(self) -> None:
+        """同じ元フォントの外字フィールドは同じ FontInfo を共有する。"""
+        objs = [
+            LayoutObject(
+                obj_type=ObjectType.FIELD,
+                rect=Rect(10, 20 + i * 40, 200, 50 + i * 40),
+                field_id=108,
+                font=FontInfo('ＭＳ ゴシック', 12.0),
+            )
+            for i in range(2)
+        ]
+        lay = LayFile(objects=objs)
+        result = fill_layout(lay, {'氏名': '葛\U000E0100城太郎'})
+        assert result.objects[0].font is result.objects[1].font
+
+    def test_gaiji_in_suffix_overrides_to_ipamj(self) -> None:
+        """差込値に外字がなくても suffix に外字があれば IPAmj明朝 になる。"""
+        obj = LayoutObject(
+            obj_type=ObjectType.FIELD,
+            rect=Rect(10, 20, 200, 50),
+            field_id=108,
+            suffix='\U00020000',
+            font=FontInfo('ＭＳ ゴシック', 12.0),
+        )
+        result = fill_layout(_make_layout(obj), {'氏名': '山田太郎'})
+        assert result.objects[0].text == '山田太郎\U00020000'
+        assert result.objects[0].font.name == 'IPAmj明朝'
+
     def test_label_always_keeps_original_font(self) -> None:
         """LABEL（静的テキスト）は外字有無にかかわらず元フォントのまま。"""
         obj = new_label(10, 20, 200, 50, text='見出し')
@@ -634,6 +678,116 @@ class TestTableRendering:
         renderer = LayRenderer(lay, backend)
         renderer.render_all()  # should not raise
 
+    def test_editor_mode_data_rows_filled(self) -> None:
+        """エディターモードではデータ行全体がピンク背景で塗られる。"""
+        pytest.importorskip('PIL')
+        from core.lay_renderer import render_layout_to_image
+
+        lay = _make_layout(LayoutObject(
+            obj_type=ObjectType.TABLE,
+            rect=Rect(0, 0, 400, 400),
+            table_columns=[TableColumn(field_id=108, width=10, h_align=0)],
+            table_row_count=3,
+        ))
+        img = render_layout_to_image(lay, dpi=254, editor_mode=True)
+        # 2.5 px/unit・各行 100 unit。行境界・テキストから離れた右端付近を確認
+        for row in range(3):
+            y = int((150 + row * 100) * 2.5)
+            assert img.getpixel((975, y)) == (255, 224, 224)
+        # ヘッダー行はピンクではない
+        assert img.getpixel((975, 125)) != (255, 224, 224)
+
+    @pytest.mark.parametrize('row_count', [3, 7, 11])
+    def test_all_explicit_rows_drawn(self, row_count: int) -> None:
+        """割り切れない行高でも明示的行数の全データ行を描画する。"""
+        pytest.importorskip('PIL')
+        from PIL import Image
+
+        from core.lay_renderer import LayRenderer, PILBackend
+
+        lay = _make_layout(LayoutObject(
+            obj_type=ObjectType.TABLE,
+            rect=Rect(0, 0, 400, 397),
+            table_columns=[TableColumn(field_id=108, width=10, h_align=0)],
+            table_row_count=row_count,
+        ))
+        backend = PILBackend(Image.new('RGB', (300, 300), 'white'), dpi=73)
+        drawn: list[int] = []
+        backend.draw_text_repeated = lambda x, ys, *a, **k: drawn.append(len(ys))
+        LayRenderer(lay, backend).render_all()
+        assert drawn == [row_count]
+
+    def test_offscreen_objects_not_drawn(self) -> None:
+        """描画先画像の外にあるオブジェクトは描画メソッドを呼ばない。"""
+        pytest.importorskip('PIL')
+        from PIL import Image
+
+        from core.lay_renderer import LayRenderer, PILBackend
+
+        inside = new_label(10, 10, 100, 40, text='A')
+        outside = new_label(5000, 5000, 5100, 5040, text='B')
+        line_out = new_line(-500, -10, -100, -10)
+        lay = _make_layout(inside, outside, line_out)
+
+        img = Image.new('RGB', (200, 200), (255, 255, 255))
+        renderer = LayRenderer(lay, PILBackend(img, dpi=72))
+        drawn: list[str] = []
+        renderer._render_label = lambda obj, px: drawn.append(obj.text)
+        renderer._render_line = lambda obj, px: drawn.append('line')
+        renderer.render_all(skip_page_outline=True)
+        assert drawn == ['A']
+
+    def test_render_all_layer_order(self) -> None:
+        """render_all は TABLE → LABEL/FIELD → LINE の順に描画する。"""
+        pytest.importorskip('PIL')
+        from PIL import Image
+
+        from core.lay_renderer import LayRenderer, PILBackend
+
+        line = new_line(0, 0, 100, 0)
+        label1 = new_label(0, 0, 100, 20, text='A')
+        table = LayoutObject(
+            obj_type=ObjectType.TABLE,
+            rect=Rect(0, 0, 100, 100),
+            table_columns=[TableColumn(field_id=108, width=10)],
+        )
+        label2 = new_label(0, 20, 100, 40, text='B')
+        lay = _make_layout(line, label1, table, label2)
+
+        img = Image.new('RGB', (100, 100), (255, 255, 255))
+        renderer = LayRenderer(lay, PILBackend(img, dpi=72))
+        calls: list[int] = []
+        renderer.render_object = lambda obj, index=0, px=None: calls.append(index)
+        # LINE レイヤーは線幅ごとにまとめて最後に描画される
+        renderer._render_lines = lambda lines: calls.extend(i for i, _, _ in lines)
+        renderer.render_all()
+        assert calls == [2, 1, 3, 0]
+
+    def test_batched_lines_match_per_line_drawing(self) -> None:
+        """LINE をまとめて描いても 1 本ずつ描いた結果と同じ画像になる。"""
+        pytest.importorskip('PIL')
+        from PIL import Image
+
+        from core.lay_renderer import LayRenderer, PILBackend
+
+        lines = [
+            new_line(10, 10 + i * 7, 190, 15 + i * 5) for i in range(10)
+        ] + [new_line(20 + i * 15, 0, 25 + i * 15, 200) for i in range(10)]
+        for i, line in enumerate(lines):
+            line.style_1001 = (i % 3) or None  # 1px / 2px / 既定
+        lay = _make_layout(*lines)
+
+        batched = Image.new('RGB', (200, 200), (255, 255, 255))
+        LayRenderer(lay, PILBackend(batched, dpi=72)).render_all(
+            skip_page_outline=True,
+        )
+        expected = Image.new('RGB', (200, 200), (255, 255, 255))
+        renderer = LayRenderer(lay, PILBackend(expected, dpi=72))
+        for i, line in enumerate(lines):
+            renderer.render_object(line, index=i)
+
+        assert batched.tobytes() == expected.tobytes()
+
 
 # ── PaperLayout 配置テスト ────────────────────────────────────────────────
 
@@ -989,6 +1143,21 @@ class TestMeiboPageCapacity:
         assert _meibo_page_capacity(lay) == 40
 
 
+class TestMeiboCellOffsets:
+    """_meibo_cell_offsets() テスト。"""
+
+    def test_vertical(self) -> None:
+        meibo = _make_meibo_object(row_count=3, direction=0).meibo
+        assert _meibo_cell_offsets(meibo) == [(100, 200), (100, 250), (100, 300)]
+
+    def test_horizontal(self) -> None:
+        meibo = _make_meibo_object(row_count=3, direction=1).meibo
+        assert _meibo_cell_offsets(meibo) == [(100, 200), (400, 200), (700, 200)]
+
+    def test_zero_rows(self) -> None:
+        assert _meibo_cell_offsets(_make_meibo_object(row_count=0).meibo) == []
+
+
 # ── fill_meibo_layout テスト ──────────────────────────────────────────────────
 
 
@@ -1092,6 +1261,138 @@ class TestFillMeiboLayout:
         labels = [o for o in pages[0].objects if o.obj_type == ObjectType.LABEL]
         assert len(labels) >= 1
 
+    def test_unresolved_ref_name_warned_once(self, caplog) -> None:
+        """ref_name 未解決の警告はページ数によらず MEIBO ごとに 1 回。"""
+        lay = LayFile(objects=[_make_meibo_object(ref_name='missing', row_count=2)])
+        data_rows = [{'氏名': f'生徒{i}'} for i in range(6)]
+        with caplog.at_level('WARNING', logger='core.lay_renderer'):
+            pages = fill_meibo_layout(lay, data_rows, layout_registry={})
+        assert len(pages) == 3
+        assert sum('missing' in r.getMessage() for r in caplog.records) == 1
+
+    def test_empty_cells_keep_only_frame_objects(self) -> None:
+        """生徒のいないセルには罫線・ラベルのみ、参照先の順序どおり配置する。"""
+        parts = LayFile(objects=[
+            new_line(0, 0, 300, 0),
+            new_field(0, 0, 100, 50, field_id=108),
+            new_label(100, 0, 300, 50, text='様'),
+        ])
+        lay = LayFile(objects=[_make_meibo_object(ref_name='p', row_count=2)])
+        pages = fill_meibo_layout(
+            lay, [{'氏名': '太郎'}], layout_registry={'p': parts},
+        )
+        objs = pages[0].objects
+        assert [o.obj_type for o in objs] == [
+            ObjectType.LINE, ObjectType.LABEL, ObjectType.LABEL,
+            ObjectType.LINE, ObjectType.LABEL,
+        ]
+        assert objs[1].text == '太郎'
+        assert objs[3].line_start.y == 250
+
+    def test_static_cell_objects_shared_across_pages(self) -> None:
+        """セル内の罫線は全ページで同じオフセット済みオブジェクトを使う。"""
+        parts = LayFile(objects=[
+            new_line(0, 0, 300, 0),
+            new_field(0, 0, 100, 50, field_id=108),
+        ])
+        lay = LayFile(objects=[_make_meibo_object(ref_name='p', row_count=2)])
+        data_rows = [{'氏名': f'生徒{i}'} for i in range(3)]
+        pages = fill_meibo_layout(lay, data_rows, layout_registry={'p': parts})
+        assert len(pages) == 2
+        # 1 ページ目の 1 セル目と 2 ページ目の 1 セル目（生徒あり）
+        assert pages[0].objects[0] is pages[1].objects[0]
+        # 2 ページ目の 2 セル目（生徒なし）も罫線は同じもの
+        assert pages[0].objects[2] is pages[1].objects[2]
+        assert [o.text for o in pages[1].objects if o.obj_type == ObjectType.LABEL] == [
+            '生徒2',
+        ]
+
+    def test_parallel_matches_sequential(self) -> None:
+        """parallel=True でもページ順・内容は逐次処理と同じ。"""
+        lay = self._make_meibo_layout()
+        registry = {'test_parts': _make_parts_layout()}
+        data_rows = [
+            {'出席番号': str(i + 1), '氏名': f'生徒{i + 1}'}
+            for i in range(14)
+        ]
+        opts = {'fiscal_year': 2025}
+        sequential = fill_meibo_layout(lay, data_rows, opts, registry)
+        parallel = fill_meibo_layout(
+            lay, data_rows, opts, registry, parallel=True, max_workers=2,
+        )
+        assert len(parallel) == 3
+        assert parallel == sequential
+
+    def test_photos_prefetched_in_one_batch(self, tmp_path, monkeypatch) -> None:
+        """MEIBO セル内の写真はまとめて先読みされ、各セルが IMAGE になる。"""
+        from PIL import Image
+
+        import core.photo_manager
+
+        photo_map = {}
+        for i in range(3):
+            path = str(tmp_path / f'1-1-0{i + 1}.jpg')
+            Image.new('RGB', (60, 80), (i * 80, 0, 0)).save(path)
+            photo_map[f'1-1-0{i + 1}'] = path
+        parts = LayFile(
+            title='photo_parts', page_width=300, page_height=100,
+            objects=[new_field(0, 0, 60, 80, field_id=400)],
+        )
+        batches: list[list[str]] = []
+        real_batch = core.photo_manager.load_photos_batch
+
+        def recording_batch(paths, *args, **kwargs):
+            batches.append(list(paths))
+            return real_batch(paths, *args, **kwargs)
+
+        monkeypatch.setattr(core.photo_manager, 'load_photos_batch', recording_batch)
+        data_rows = [
+            {'学年': '1', '組': '1', '出席番号': str(i + 1)} for i in range(3)
+        ]
+        pages = fill_meibo_layout(
+            self._make_meibo_layout(), data_rows,
+            {'_photo_map': photo_map}, layout_registry={'test_parts': parts},
+        )
+
+        assert batches == [list(photo_map.values())]
+        images = [o for o in pages[0].objects if o.obj_type == ObjectType.IMAGE]
+        assert [o.image.original_path for o in images] == list(photo_map.values())
+
+    def test_parallel_photos_and_page_numbers_match_sequential(self, tmp_path) -> None:
+        """parallel=True でも写真・ページ番号を含め逐次処理と同じページになる。"""
+        from PIL import Image
+
+        photo_map = {}
+        for i in range(8):
+            path = str(tmp_path / f'1-1-0{i + 1}.jpg')
+            Image.new('RGB', (60, 80), (i * 30, 0, 0)).save(path)
+            photo_map[f'1-1-0{i + 1}'] = path
+        parts = LayFile(
+            title='photo_parts', page_width=300, page_height=100,
+            objects=[new_field(0, 0, 60, 80, field_id=400)],
+        )
+        lay = self._make_meibo_layout()
+        lay.objects.append(new_field(600, 50, 700, 100, field_id=138))  # ページ番号
+        registry = {'test_parts': parts}
+        data_rows = [
+            {'学年': '1', '組': '1', '出席番号': str(i + 1)} for i in range(8)
+        ]
+        opts = {'_photo_map': photo_map}
+
+        sequential = fill_meibo_layout(lay, data_rows, opts, registry)
+        parallel = fill_meibo_layout(
+            lay, data_rows, opts, registry, parallel=True, max_workers=2,
+        )
+
+        assert len(parallel) == 2
+        assert parallel == sequential
+        images = [
+            o.image.original_path
+            for page in parallel for o in page.objects if o.obj_type == ObjectType.IMAGE
+        ]
+        assert images == list(photo_map.values())
+        assert [page.objects[-1].text for page in parallel] == ['1', '2']
+
     def test_top_level_field_common_data(self) -> None:
         """年度等の共通フィールドが正しく埋まる。"""
         lay = self._make_meibo_layout()
@@ -1105,6 +1406,36 @@ class TestFillMeiboLayout:
         assert '2026' in label_texts
 
 
+class TestRenderMeibo:
+    """_render_meibo の描画テスト。"""
+
+    def test_matches_explicitly_offset_objects(self) -> None:
+        """MEIBO 描画結果は、参照先を手動でずらして並べた描画と一致する。"""
+        pytest.importorskip('PIL')
+        from core.lay_renderer import _offset_object, render_layout_to_image
+
+        parts = LayFile(
+            title='test_parts', page_width=300, page_height=50,
+            objects=[
+                new_label(0, 0, 100, 50, text='番号'),
+                new_line(0, 50, 300, 50),
+            ],
+        )
+        meibo_lay = _make_layout(_make_meibo_object(
+            ref_name='test_parts', row_count=4, direction=0,
+        ))
+        expanded = _make_layout(*[
+            _offset_object(o, 100, 200 + i * 50)
+            for i in range(4) for o in parts.objects
+        ])
+
+        img_meibo = render_layout_to_image(
+            meibo_lay, dpi=254, layout_registry={'test_parts': parts},
+        )
+        img_expanded = render_layout_to_image(expanded, dpi=254)
+        assert img_meibo.tobytes() == img_expanded.tobytes()
+
+
 # ── 写真フィールド差込テスト ────────────────────────────────────────────────
 
 
@@ -8,12 +8,14 @@
 
 from __future__ import annotations
 
+import base64
 import json
 import os
 
 import pytest
 
 from core.lay_parser import (
+    EmbeddedImage,
     FontInfo,
     LayFile,
     LayoutObject,
@@ -170,6 +172,23 @@ class TestRoundTrip:
             RawTag(path=[0x05E0], payload=b'\x02\x00\x00\x00', payload_len=4),
         ]
 
+    def test_object_key_order(self):
+        """JSON 出力のキー順は固定（差分が出ないように）。"""
+        obj = LayoutObject(
+            obj_type=ObjectType.FIELD,
+            rect=Rect(0, 0, 10, 10),
+            text='t', prefix='p', suffix='s',
+            field_id=108, h_align=1, v_align=2, table_row_count=3,
+            font=FontInfo('IPAmj明朝', 12.0),
+            style_1001=0, style_1002=1, style_1003=2,
+        )
+        d = layfile_to_dict(LayFile(objects=[obj]))['objects'][0]
+        assert list(d) == [
+            'type', 'rect', 'text', 'prefix', 'suffix',
+            'field_id', 'h_align', 'v_align', 'table_row_count', 'font',
+            'style_1001', 'style_1002', 'style_1003',
+        ]
+
     def test_page_dimensions_preserved(self):
         lay = LayFile(page_width=1188, page_height=840)
         restored = dict_to_layfile(layfile_to_dict(lay))
@@ -207,6 +226,27 @@ class TestFileSaveLoad:
         save_layout(LayFile(), path)
         assert os.path.isfile(path)
 
+    def test_stdlib_fallback_roundtrip(self, tmp_path, monkeypatch):
+        """orjson がない環境でも標準 json で保存・読込できる。"""
+        from core import lay_serializer
+
+        monkeypatch.setattr(lay_serializer, 'HAS_ORJSON', False)
+        path = str(tmp_path / 'test.json')
+        save_layout(_make_full_layout(), path)
+        restored = load_layout(path)
+        assert restored.title == 'テスト帳票'
+        assert len(restored.objects) == 4
+
+    def test_orjson_output_matches_stdlib(self, monkeypatch):
+        """orjson の出力は標準 json (ensure_ascii=False, indent=2) と同一。"""
+        pytest.importorskip('orjson')
+        from core import lay_serializer
+
+        data = layfile_to_dict(_make_full_layout())
+        fast = lay_serializer._encode_json(data)
+        monkeypatch.setattr(lay_serializer, 'HAS_ORJSON', False)
+        assert fast == lay_serializer._encode_json(data)
+
 
 class TestErrorHandling:
     """エラーハンドリングのテスト。"""
@@ -301,9 +341,9 @@ class TestAtomicSave:
         path = str(tmp_path / 'test.json')
         save_layout(LayFile(title='元データ'), path)
 
-        # json.dump がエラーを起こすオブジェクトを仕込む
+        # JSON エンコードがエラーを起こすように仕込む
         from unittest.mock import patch
-        with patch('core.lay_serializer.json.dump', side_effect=TypeError('bad')), \
+        with patch('core.lay_serializer._encode_json', side_effect=TypeError('bad')), \
              pytest.raises(TypeError):
             save_layout(LayFile(title='壊れる'), path)
 
@@ -316,7 +356,7 @@ class TestAtomicSave:
         path = str(tmp_path / 'test.json')
 
         from unittest.mock import patch
-        with patch('core.lay_serializer.json.dump', side_effect=OSError('disk full')), \
+        with patch('core.lay_serializer._encode_json', side_effect=OSError('disk full')), \
              pytest.raises(OSError):
             save_layout(LayFile(), path)
 
@@ -360,6 +400,20 @@ class TestDeserializationEdgeCases:
         assert lay.objects[0].font.size_pt == 10.0
         assert lay.objects[0].font.bold is False
 
+    def test_unknown_keys_ignored(self):
+        """未知のキーは無視され、既知のキーだけ復元される。"""
+        data = {
+            'format': 'meibo_layout_v1',
+            'objects': [{'type': 'FIELD', 'future_key': 1, 'field_id': 108,
+                         'meibo': {'ref_name': 'parts', 'row_count': 5}}],
+        }
+        obj = dict_to_layfile(data).objects[0]
+        assert obj.obj_type == ObjectType.FIELD
+        assert obj.field_id == 108
+        assert obj.meibo.ref_name == 'parts'
+        assert obj.meibo.row_count == 5
+        assert obj.meibo.cell_width == 0
+
     def test_load_nonexistent_file_raises(self, tmp_path):
         """存在しないファイルを読むと FileNotFoundError。"""
         with pytest.raises(FileNotFoundError):
@@ -595,3 +649,30 @@ class TestTableColumnRoundTrip:
         assert restored.tables[0].table_columns[1].h_align == 1
 
 
+
+
+# ── 埋め込み画像 テスト ──────────────────────────────────────────────────────
+
+
+class TestEmbeddedImageRoundTrip:
+    """EmbeddedImage.image_data の base64 ラウンドトリップテスト。"""
+
+    def test_image_data_preserved(self):
+        data = bytes(range(256)) * 3
+        obj = LayoutObject(
+            obj_type=ObjectType.IMAGE,
+            rect=Rect(0, 0, 100, 100),
+            image=EmbeddedImage(rect=(0, 0, 100, 100), image_data=data,
+                                original_path='logo.png'),
+        )
+        d = layfile_to_dict(LayFile(objects=[obj]))
+        assert d['objects'][0]['image']['image_data'] == base64.b64encode(data).decode('ascii')
+
+        restored = dict_to_layfile(d).objects[0].image
+        assert restored.image_data == data
+        assert restored.original_path == 'logo.png'
+
+    def test_empty_image_data(self):
+        obj = LayoutObject(obj_type=ObjectType.IMAGE, image=EmbeddedImage())
+        restored = dict_to_layfile(layfile_to_dict(LayFile(objects=[obj])))
+        assert restored.objects[0].image.image_data == b''
@@ -32,6 +32,7 @@ from core.layout_registry import (
     collect_part_layout_keys,
     delete_layout,
     import_json_file,
+    iter_layout_dir,
     rename_layout,
     scan_layout_dir,
 )
@@ -125,6 +126,61 @@ class TestScanLayoutDir:
         assert len(results) == 1
         assert results[0]['name'] == 'valid'
 
+    def test_scan_ignores_json_named_directory(self, tmp_path):
+        _make_layout_json(str(tmp_path / 'b.json'), title='B')
+        _make_layout_json(str(tmp_path / 'a.json'), title='A')
+        (tmp_path / 'folder.json').mkdir()
+        results = scan_layout_dir(str(tmp_path))
+        assert [r['file'] for r in results] == ['a.json', 'b.json']
+
+    def test_scan_many_files_in_name_order(self, tmp_path):
+        """未キャッシュの複数ファイルを並行して読んでも名前順・内容は同じ。"""
+        for i in range(6):
+            _make_layout_json(str(tmp_path / f'l{i}.json'), title=f'T{i}', n_fields=i)
+        (tmp_path / 'l9.json').write_text('{invalid json}')
+        results = scan_layout_dir(str(tmp_path))
+        assert [r['title'] for r in results] == [f'T{i}' for i in range(6)]
+        assert [r['field_count'] for r in results] == list(range(6))
+
+    def test_iter_matches_scan(self, tmp_path):
+        for i in range(3):
+            _make_layout_json(str(tmp_path / f'l{i}.json'), title=f'T{i}')
+        assert list(iter_layout_dir(str(tmp_path))) == scan_layout_dir(str(tmp_path))
+
+    def test_iter_reads_lazily(self, tmp_path, monkeypatch):
+        """先頭だけ取り出した場合、残りのファイルは解析しない。"""
+        import itertools
+
+        import core.layout_registry as registry_mod
+
+        for i in range(4):
+            _make_layout_json(str(tmp_path / f'l{i}.json'), title=f'T{i}')
+        parsed: list[str] = []
+        real = registry_mod._parse_layout_meta
+
+        def counting(path):
+            parsed.append(path)
+            return real(path)
+
+        monkeypatch.setattr(registry_mod, '_parse_layout_meta', counting)
+        first = list(itertools.islice(iter_layout_dir(str(tmp_path)), 1))
+        assert [m['title'] for m in first] == ['T0']
+        assert len(parsed) == 1
+
+    def test_iter_nonexistent_dir(self, tmp_path):
+        assert list(iter_layout_dir(str(tmp_path / 'no_such'))) == []
+
+    def test_scan_without_orjson(self, tmp_path, monkeypatch):
+        """orjson がない環境でも標準 json でメタデータを読める。"""
+        import core.layout_registry as registry_mod
+
+        monkeypatch.setattr(registry_mod, 'HAS_ORJSON', False)
+        _make_layout_json(str(tmp_path / 'a.json'), title='テストA', n_fields=3)
+        (tmp_path / 'broken.json').write_bytes(b'{"format": ')
+        results = scan_layout_dir(str(tmp_path))
+        assert [r['title'] for r in results] == ['テストA']
+        assert results[0]['field_count'] == 3
+
 
 # ── import テスト ─────────────────────────────────────────────────────────────
 
@@ -159,6 +215,16 @@ class TestImport:
         dest = import_json_file(src, lib_dir)
         assert 'layout_1.json' in dest
 
+    def test_import_json_from_library_not_duplicated(self, tmp_path):
+        """ライブラリ内のファイルを指定してもコピーを作らない。"""
+        lib_dir = str(tmp_path / 'lib')
+        os.makedirs(lib_dir)
+        src = os.path.join(lib_dir, 'layout.json')
+        _make_layout_json(src)
+        dest = import_json_file(src, lib_dir)
+        assert dest == src
+        assert os.listdir(lib_dir) == ['layout.json']
+
     def test_import_json_validates_format(self, tmp_path):
         src = str(tmp_path / 'bad.json')
         with open(src, 'w') as f:
@@ -242,6 +308,18 @@ class TestUniquePath:
         result = unique_path(str(tmp_path), 'test')
         assert result.endswith('test_2.json')
 
+    def test_existing_set_used_and_updated(self, tmp_path):
+        """existing を渡すと集合で判定し、選んだ名前を追加する。"""
+        from core.layout_registry import _existing_names, unique_path
+        (tmp_path / 'test.json').write_text('{}')
+        existing = _existing_names(str(tmp_path))
+        first = unique_path(str(tmp_path), 'test', existing)
+        second = unique_path(str(tmp_path), 'test', existing)
+        assert first.endswith('test_1.json')
+        assert second.endswith('test_2.json')
+        # ファイルは作らない（呼び出し側が保存する）
+        assert not os.path.exists(first)
+
     def test_import_json_nonexistent_raises(self, tmp_path):
         """存在しない JSON ファイルのインポートはエラー。"""
         with pytest.raises(FileNotFoundError):
@@ -404,6 +482,54 @@ class TestBuildLayoutRegistry:
         assert 'c' in registry
 
 
+class TestLoadCache:
+    """scan_layout_dir / build_layout_registry の読込キャッシュのテスト。"""
+
+    @staticmethod
+    def _bump_mtime(path: str) -> None:
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    def test_registry_reuses_unchanged_layout(self, tmp_path):
+        _make_layout_json(str(tmp_path / 'a.json'), title='A')
+        first = build_layout_registry(str(tmp_path))
+        second = build_layout_registry(str(tmp_path))
+        assert first['A'] is second['A']
+
+    def test_registry_reloads_changed_layout(self, tmp_path):
+        path = str(tmp_path / 'a.json')
+        _make_layout_json(path, title='A')
+        first = build_layout_registry(str(tmp_path))
+        _make_layout_json(path, title='A', n_fields=5)
+        self._bump_mtime(path)
+        second = build_layout_registry(str(tmp_path))
+        assert second['A'] is not first['A']
+        assert len(second['A'].objects) == 7
+
+    def test_scan_reflects_changed_file(self, tmp_path):
+        path = str(tmp_path / 'a.json')
+        _make_layout_json(path, title='A', n_fields=1)
+        assert scan_layout_dir(str(tmp_path))[0]['field_count'] == 1
+        _make_layout_json(path, title='A', n_fields=3)
+        self._bump_mtime(path)
+        assert scan_layout_dir(str(tmp_path))[0]['field_count'] == 3
+
+    def test_scan_results_are_independent_copies(self, tmp_path):
+        _make_layout_json(str(tmp_path / 'a.json'), title='A')
+        scan_layout_dir(str(tmp_path))[0]['title'] = '変更'
+        assert scan_layout_dir(str(tmp_path))[0]['title'] == 'A'
+
+    def test_deleted_file_evicted(self, tmp_path):
+        import core.layout_registry as registry_mod
+
+        path = str(tmp_path / 'a.json')
+        _make_layout_json(path, title='A')
+        scan_layout_dir(str(tmp_path))
+        os.remove(path)
+        assert scan_layout_dir(str(tmp_path)) == []
+        assert all(key[0] != path for key in registry_mod._META_CACHE)
+
+
 class TestCollectPartLayoutKeys:
     """collect_part_layout_keys() のテスト。"""
 
@@ -433,3 +559,12 @@ class TestCollectPartLayoutKeys:
 
         keys = collect_part_layout_keys(str(tmp_path))
         assert keys == set()
+
+    def test_overridden_title_key_belongs_to_later_layout(self, tmp_path):
+        """同じ title のレイアウトは後のファイルがキーを持つ。"""
+        _make_layout_json(str(tmp_path / 'a.json'), title='パーツ')
+        _make_layout_json(str(tmp_path / 'b.json'), title='パーツ')
+        _make_meibo_layout_json(str(tmp_path / 'parent.json'), title='親', ref_name='パーツ')
+
+        keys = collect_part_layout_keys(str(tmp_path))
+        assert keys == {'パーツ', 'b'}
@@ -2,7 +2,13 @@
 
 import pandas as pd
 
-from core.mapper import EXACT_MAP, map_columns, normalize_header
+from core.mapper import (
+    COLUMN_ALIASES,
+    EXACT_MAP,
+    ensure_fallback_columns,
+    map_columns,
+    normalize_header,
+)
 
 
 class TestNormalizeHeader:
@@ -19,6 +25,11 @@ class TestNormalizeHeader:
         result = normalize_header('保護者1　続柄')  # 全角スペース
         assert result == '保護者1\u3000続柄'
 
+    def test_numeric_headers_not_confused(self):
+        # キャッシュで 1 と 1.0 が同じ結果にならないこと
+        assert normalize_header(1) == '1'
+        assert normalize_header(1.0) == '1.0'
+
 
 class TestMapColumns:
     def test_exact_match_all(self):
@@ -42,3 +53,57 @@ class TestMapColumns:
         df_mapped, unmapped = map_columns(df)
         assert '未知のカラム' in unmapped
         assert '学年' in df_mapped.columns
+
+    def test_alias_columns(self):
+        """表記ゆれのカラムがエイリアスで論理名になること"""
+        df = pd.DataFrame(columns=[' 児童氏名 ', 'フリガナ', '席番', 'クラス'])
+        df_mapped, unmapped = map_columns(df)
+        assert list(df_mapped.columns) == ['氏名', '氏名かな', '出席番号', '組']
+        assert unmapped == []
+
+    def test_already_mapped_frame_unchanged(self):
+        """内部論理名だけの DataFrame は列名そのまま・未マッピングなしで返ること"""
+        df = pd.DataFrame({'氏名': ['山田'], '氏名かな': ['やまだ'], '保護者名': ['山田花子']})
+        df_mapped, unmapped = map_columns(df)
+        assert list(df_mapped.columns) == ['氏名', '氏名かな', '保護者名']
+        assert unmapped == []
+        df_mapped['追加'] = 1
+        assert '追加' not in df.columns
+
+    def test_logical_names_never_renamed(self):
+        """内部論理名が別の論理名へマッピングされないこと（上の省略の前提）"""
+        logical = {*EXACT_MAP.values(), *COLUMN_ALIASES}
+        for name in logical:
+            assert EXACT_MAP.get(name, name) == name
+            for target, aliases in COLUMN_ALIASES.items():
+                if name in aliases and name not in EXACT_MAP:
+                    assert target == name
+
+    def test_aliases_unique_across_logical_names(self):
+        """同じエイリアスが複数の論理名に登録されていないこと"""
+        aliases = [a for names in COLUMN_ALIASES.values() for a in names]
+        assert len(aliases) == len(set(aliases))
+
+
+class TestEnsureFallbackColumns:
+    def test_chained_fallback(self):
+        """補完した正式氏名から公簿名も補完されること"""
+        df = pd.DataFrame({'氏名': ['山田太郎'], '氏名かな': ['やまだたろう']})
+        ensure_fallback_columns(df)
+        assert df.loc[0, '正式氏名'] == '山田太郎'
+        assert df.loc[0, '公簿名'] == '山田太郎'
+        assert df.loc[0, '公簿名かな'] == 'やまだたろう'
+
+    def test_reverse_fallback(self):
+        """正式氏名しかない場合は氏名に補完されること"""
+        df = pd.DataFrame({'正式氏名': ['山田太郎'], '保護者正式名': ['山田花子']})
+        ensure_fallback_columns(df)
+        assert df.loc[0, '氏名'] == '山田太郎'
+        assert df.loc[0, '保護者名'] == '山田花子'
+
+    def test_existing_columns_untouched(self):
+        df = pd.DataFrame({'氏名': ['通称'], '正式氏名': ['正式']})
+        ensure_fallback_columns(df)
+        assert df.loc[0, '氏名'] == '通称'
+        assert df.loc[0, '正式氏名'] == '正式'
+        assert df.loc[0, '公簿名'] == '正式'
@@ -25,6 +25,8 @@ from core.photo_manager import (
     get_match_status,
     import_photos_from_folder,
     load_photo_bytes,
+    load_photo_bytes_cached,
+    load_photos_batch,
     match_photo_to_student,
     scan_photos,
 )
@@ -181,6 +183,22 @@ class TestScanPhotos:
         # キー '01' は存在するはず（先に見つかった方）
         assert '01' in result
 
+    def test_parent_folder_wins_over_subfolder(self, tmp_path: object) -> None:
+        """os.walk と同じく、親フォルダのファイルがサブフォルダより優先される。"""
+        d = str(tmp_path)
+        for sub in ('a', 'b'):
+            os.makedirs(os.path.join(d, sub))
+            _create_test_image(os.path.join(d, sub, '02.jpg'))
+        _create_test_image(os.path.join(d, '01.jpg'))
+        _create_test_image(os.path.join(d, 'a', '01.jpg'))
+
+        result = scan_photos(d)
+
+        assert result['01'] == os.path.join(d, '01.jpg')
+        assert result['02'] in {
+            os.path.join(d, 'a', '02.jpg'), os.path.join(d, 'b', '02.jpg'),
+        }
+
 
 # ── match_photo_to_student ──────────────────────────────────────────────────
 
@@ -223,6 +241,12 @@ class TestMatchPhotoToStudent:
         row = {'学年': '1', '組': '1', '出席番号': '1', '氏名': '山田太郎'}
         assert match_photo_to_student(row, photo_map) == '/photos/by_number.jpg'
 
+    def test_non_numeric_class_falls_back_to_number_only(self) -> None:
+        """組が数字でない（特別支援学級等）場合は出席番号のみで照合する。"""
+        row = {'学年': '1', '組': 'なかよし', '出席番号': '3', '氏名': '山田'}
+        photo_map = {'03': '/p/03.jpg', '山田': '/p/name.jpg'}
+        assert match_photo_to_student(row, photo_map) == '/p/03.jpg'
+
     def test_no_match_returns_none(self) -> None:
         photo_map = {'1-2-01': '/photos/1-2-01.jpg'}
         row = {'学年': '1', '組': '1', '出席番号': '1'}
@@ -328,6 +352,106 @@ class TestLoadPhotoBytes:
         img = Image.open(io.BytesIO(result))
         assert img.size == (50, 50)
 
+    def test_large_jpeg_draft_keeps_full_output_size(self, tmp_path: object) -> None:
+        """JPEG の縮小デコード後も max_size ちょうどまでリサイズされる。"""
+        path = os.path.join(str(tmp_path), 'huge.jpg')
+        _create_test_image(path, 4000, 3000)
+        result = load_photo_bytes(path, max_size=600, target_rect=(3, 4))
+        assert result is not None
+        img = Image.open(io.BytesIO(result))
+        # 縦長 3:4 にクロップ済み、長辺は max_size（短辺は丸めで ±1px）
+        assert img.size[1] == 600
+        assert abs(img.size[0] - 450) <= 1
+
+
+    def test_resample_filter_selectable(self, tmp_path: object) -> None:
+        """resample にフィルタを渡せる（サイズは LANCZOS と同じ）。"""
+        path = os.path.join(str(tmp_path), 'large.jpg')
+        _create_test_image(path, 1200, 900)
+        result = load_photo_bytes(
+            path, max_size=300, resample=Image.Resampling.BICUBIC,
+        )
+        assert result is not None
+        assert Image.open(io.BytesIO(result)).size == (300, 225)
+
+    def test_jpeg_output(self, tmp_path: object) -> None:
+        path = os.path.join(str(tmp_path), 'rgba.png')
+        _create_rgba_image(path)
+        result = load_photo_bytes(path, fmt='JPEG')
+        assert result is not None
+        assert result[:3] == b'\xff\xd8\xff'
+        img = Image.open(io.BytesIO(result))
+        assert img.format == 'JPEG'
+        assert img.size == (100, 100)
+
+
+class TestLoadPhotoBytesCached:
+    """load_photo_bytes_cached のテスト。"""
+
+    def test_same_file_decoded_once(self, tmp_path: object, monkeypatch) -> None:
+        import core.photo_manager as pm
+
+        path = os.path.join(str(tmp_path), 'a.jpg')
+        _create_test_image(path, 200, 300)
+        calls: list[str] = []
+        real = pm.load_photo_bytes
+
+        def counting(*args, **kwargs):
+            calls.append(args[0])
+            return real(*args, **kwargs)
+
+        monkeypatch.setattr(pm, 'load_photo_bytes', counting)
+        pm._load_photo_bytes_for_stat.cache_clear()
+        first = load_photo_bytes_cached(path, target_rect=(100, 150))
+        second = load_photo_bytes_cached(path, target_rect=(100, 150))
+        assert first is second
+        assert len(calls) == 1
+
+    def test_replaced_file_reloaded(self, tmp_path: object) -> None:
+        """写真を差し替えると新しい画像を返す。"""
+        path = os.path.join(str(tmp_path), 'a.png')
+        _create_test_image(path, 100, 100)
+        before = load_photo_bytes_cached(path)
+        _create_test_image(path, 80, 40)
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        after = load_photo_bytes_cached(path)
+        assert Image.open(io.BytesIO(before)).size == (100, 100)
+        assert Image.open(io.BytesIO(after)).size == (80, 40)
+
+    def test_format_is_part_of_key(self, tmp_path: object) -> None:
+        path = os.path.join(str(tmp_path), 'a.jpg')
+        _create_test_image(path, 200, 300)
+        png = load_photo_bytes_cached(path)
+        jpeg = load_photo_bytes_cached(path, fmt='JPEG')
+        assert png[:8] == b'\x89PNG\r\n\x1a\n'
+        assert jpeg[:3] == b'\xff\xd8\xff'
+
+    def test_nonexistent_returns_none(self) -> None:
+        assert load_photo_bytes_cached('/nonexistent/photo.jpg') is None
+
+
+class TestLoadPhotosBatch:
+    """load_photos_batch のテスト。"""
+
+    def test_preserves_input_order(self, tmp_path: object) -> None:
+        paths = []
+        for i in range(12):
+            path = os.path.join(str(tmp_path), f'{i}.png')
+            _create_test_image(path, 10 + i, 20)
+            paths.append(path)
+        paths.insert(5, '/nonexistent/photo.jpg')
+
+        results = load_photos_batch(paths)
+
+        assert len(results) == len(paths)
+        assert results[5] is None
+        sizes = [Image.open(io.BytesIO(r)).size for r in results if r is not None]
+        assert sizes == [(10 + i, 20) for i in range(12)]
+
+    def test_empty(self) -> None:
+        assert load_photos_batch([]) == []
+
 
 # ── _center_crop ─────────────────────────────────────────────────────────────
 
@@ -386,6 +510,19 @@ class TestGetMatchStatus:
         assert total == 2
         assert '田中花子' in unmatched
 
+    def test_unnamed_row_reported_by_index_label(self) -> None:
+        """氏名のない行は DataFrame の index ラベルで示す（絞り込み後も元の行番号）。"""
+        df = pd.DataFrame(
+            [
+                {'学年': 1, '組': 1, '出席番号': 1, '氏名': 'A'},
+                {'学年': 1, '組': 1, '出席番号': 2, '氏名': None},
+            ],
+            index=[100, 200],
+        )
+        matched, total, unmatched = get_match_status(df, {'1-1-01': '/p/01.jpg'})
+        assert (matched, total) == (1, 2)
+        assert unmatched == ['(行 201)']
+
     def test_empty_df(self) -> None:
         df = pd.DataFrame()
         matched, total, unmatched = get_match_status(df, {})
@@ -426,6 +563,21 @@ class TestImportPhotos:
         assert copied == 0
         assert skipped == ['01.jpg']
 
+    def test_preserves_mtime(self, tmp_path: object) -> None:
+        src = os.path.join(str(tmp_path), 'src')
+        dst = os.path.join(str(tmp_path), 'dst')
+        os.makedirs(src)
+        src_file = os.path.join(src, '01.jpg')
+        _create_test_image(src_file)
+        os.utime(src_file, ns=(1_600_000_000_000_000_000, 1_600_000_000_000_000_000))
+
+        import_photos_from_folder(src, dst)
+
+        dst_file = os.path.join(dst, '01.jpg')
+        with open(src_file, 'rb') as a, open(dst_file, 'rb') as b:
+            assert a.read() == b.read()
+        assert os.stat(dst_file).st_mtime_ns == 1_600_000_000_000_000_000
+
     def test_ignores_non_image(self, tmp_path: object) -> None:
         src = os.path.join(str(tmp_path), 'src')
         dst = os.path.join(str(tmp_path), 'dst')
@@ -9,7 +9,8 @@
 from __future__ import annotations
 
 import numpy as np
-from PIL import Image
+import pytest
+from PIL import Image, ImageDraw
 
 from core.lay_parser import (
     FontInfo,
@@ -21,7 +22,11 @@ from core.lay_parser import (
     new_label,
     new_line,
 )
-from core.lay_renderer import PILBackend, render_layout_to_image
+from core.lay_renderer import (
+    PILBackend,
+    render_layout_to_image,
+    render_layouts_to_images,
+)
 
 # ── PILBackend プリミティブテスト ─────────────────────────────────────────────
 
@@ -56,6 +61,25 @@ class TestPILBackendPrimitives:
         # 線の位置に黒ピクセル
         assert (arr[99:102, :, :] == 0).any()
 
+    def test_draw_lines_matches_draw_line(self):
+        segments = [(10.5, 0, 10.5, 90), (0, 20.25, 120, 20.25), (0, 50, 120, 50)]
+        expected = Image.new('RGB', (120, 90), (255, 255, 255))
+        single = PILBackend(expected, dpi=150)
+        for seg in segments:
+            single.draw_line(*seg, color='#808080')
+        actual = Image.new('RGB', (120, 90), (255, 255, 255))
+        PILBackend(actual, dpi=150).draw_lines(segments, color='#808080')
+        assert actual.tobytes() == expected.tobytes()
+
+    def test_scale_property(self):
+        backend = PILBackend(Image.new('RGB', (10, 10)), dpi=254, unit_mm=0.1)
+        assert backend.scale == pytest.approx(1.0)
+
+    def test_rect_to_px(self):
+        backend = PILBackend(Image.new('RGB', (10, 10)), dpi=254, unit_mm=0.1)
+        px = backend.rect_to_px(10, 20, 30, 40)
+        assert px == pytest.approx((10.0, 20.0, 30.0, 40.0))
+
     def test_draw_text(self):
         img = Image.new('RGB', (300, 100), (255, 255, 255))
         backend = PILBackend(img, dpi=150)
@@ -68,6 +92,19 @@ class TestPILBackendPrimitives:
         # テキスト描画により白でないピクセルが存在する
         assert (arr != 255).any()
 
+    def test_draw_text_repeated_matches_draw_text(self):
+        """draw_text_repeated は行ごとの draw_text と同じ結果になる。"""
+        ys = [0.0, 25.0, 50.0, 75.0]
+        expected = Image.new('RGB', (200, 100), (255, 255, 255))
+        b1 = PILBackend(expected, dpi=150)
+        for y in ys:
+            b1.draw_text(10, y, 150, 25, 'abc', '', 8.0, h_align=1, v_align=1)
+
+        actual = Image.new('RGB', (200, 100), (255, 255, 255))
+        b2 = PILBackend(actual, dpi=150)
+        b2.draw_text_repeated(10, ys, 150, 25, 'abc', '', 8.0, h_align=1, v_align=1)
+        assert (np.array(expected) == np.array(actual)).all()
+
     def test_draw_text_empty_string(self):
         """空文字列は何も描画しない。"""
         img = Image.new('RGB', (200, 100), (255, 255, 255))
@@ -121,6 +158,70 @@ class TestRenderLayoutToImage:
         assert img_high.width > img_low.width
         assert img_high.height > img_low.height
 
+    @pytest.mark.parametrize('for_print', [True, False])
+    def test_high_quality_only_for_print(self, monkeypatch, for_print):
+        """印刷時のみ LANCZOS（high_quality）でリサイズする。"""
+        from core import lay_renderer
+
+        created: list[PILBackend] = []
+
+        class SpyBackend(PILBackend):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                created.append(self)
+
+        monkeypatch.setattr(lay_renderer, 'PILBackend', SpyBackend)
+        render_layout_to_image(LayFile(page_width=40, page_height=40), for_print=for_print)
+        assert created[0]._high_quality is for_print
+
+    def test_reused_backend_matches_fresh_render(self):
+        """再利用バックエンドへの描画は前回の内容を残さず、新規描画と一致する。"""
+        first = LayFile(page_width=200, page_height=200,
+                        objects=[new_line(0, 0, 200, 200)])
+        second = LayFile(page_width=200, page_height=200,
+                         objects=[new_label(10, 10, 150, 60, text='テスト')])
+        backend = PILBackend.for_layout(first, dpi=100, high_quality=False)
+        assert backend.matches(second, 100)
+        assert not backend.matches(second, 120)
+        render_layout_to_image(first, dpi=100, backend=backend)
+        img = render_layout_to_image(second, dpi=100, backend=backend)
+        assert img is backend.image
+        assert img.tobytes() == render_layout_to_image(second, dpi=100).tobytes()
+
+    def test_render_layouts_to_images_keeps_order(self):
+        """並列描画の結果はページ順で、1 ページずつの描画と一致する。"""
+        pages = [
+            LayFile(page_width=200, page_height=100 + i * 10,
+                    objects=[new_label(10, 10, 150, 60, text=f'P{i}')])
+            for i in range(5)
+        ]
+        images = render_layouts_to_images(pages, dpi=72, max_workers=3)
+        assert [img.tobytes() for img in images] == [
+            render_layout_to_image(p, dpi=72).tobytes() for p in pages
+        ]
+
+    def test_render_layouts_to_images_empty(self):
+        assert render_layouts_to_images([]) == []
+
+    def test_render_layouts_to_images_caps_default_workers(self, monkeypatch):
+        """max_workers 省略時は CPU が多くても 4 スレッドまで。"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from core import lay_renderer
+
+        seen: list[int] = []
+
+        class RecordingPool(ThreadPoolExecutor):
+            def __init__(self, max_workers):
+                seen.append(max_workers)
+                super().__init__(max_workers=max_workers)
+
+        monkeypatch.setattr(lay_renderer.os, 'cpu_count', lambda: 32)
+        monkeypatch.setattr(lay_renderer, 'ThreadPoolExecutor', RecordingPool)
+        pages = [LayFile(page_width=100, page_height=100) for _ in range(8)]
+        assert len(render_layouts_to_images(pages, dpi=30)) == 8
+        assert seen == [4]
+
 
 # ── テキストモードテスト ──────────────────────────────────────────────────────
 
@@ -253,6 +354,19 @@ class TestPILTextModes:
         # 1行縮小ではなく、複数行として描画されていること
         assert seg_count >= 2
 
+    def test_whitespace_only_text_skips_font_loading(self, monkeypatch):
+        """空白のみの縦書き・複数行テキストはフォントを読み込まない。"""
+        img = Image.new('RGB', (100, 200), (255, 255, 255))
+        backend = PILBackend(img, dpi=150)
+
+        def fail(*_args, **_kwargs):
+            raise AssertionError('font should not be loaded')
+
+        monkeypatch.setattr(backend, '_load_font', fail)
+        backend.draw_text(0, 0, 20, 200, '\u3000 \u3000', '', 10.0, vertical=True)
+        backend.draw_text(0, 0, 100, 200, ' \n\u3000', '', 10.0)
+        assert (np.array(img) == 255).all()
+
     def test_multiline_v_align_changes_vertical_position(self):
         """複数行テキストで v_align により描画開始位置が変わる。"""
         rect = Rect(20, 20, 220, 260)
@@ -413,3 +527,239 @@ class TestEdgeCases:
         ])
         img = render_layout_to_image(lay, dpi=100)
         assert isinstance(img, Image.Image)
+
+
+# ── フォントキャッシュテスト ──────────────────────────────────────────────────
+
+
+class TestFontCache:
+    """_load_font のキャッシュ動作テスト。"""
+
+    def test_same_size_returns_same_font(self):
+        img = Image.new('RGB', (10, 10), (255, 255, 255))
+        backend = PILBackend(img, dpi=150)
+        assert backend._load_font(10.0, 'ＭＳ 明朝') is backend._load_font(10.0, 'ＭＳ 明朝')
+
+    def test_shared_across_backends(self):
+        """別インスタンスの PILBackend でもフォントを使い回す。"""
+        a = PILBackend(Image.new('RGB', (10, 10)), dpi=150)
+        b = PILBackend(Image.new('RGB', (10, 10)), dpi=150)
+        assert a._load_font(12.0) is b._load_font(12.0)
+
+    def test_unknown_font_name_falls_back(self):
+        backend = PILBackend(Image.new('RGB', (10, 10)), dpi=150)
+        font = backend._load_font(10.0, '存在しないフォント')
+        assert font is backend._load_font(10.0, '')
+
+    def test_resolve_font_path_prefers_named_font(self, monkeypatch):
+        from core import lay_renderer
+
+        monkeypatch.setattr(lay_renderer, '_RESOLVED_FONT_MAP', {'A': '/fonts/a.ttf'})
+        monkeypatch.setattr(lay_renderer, '_RESOLVED_FALLBACKS', ['/fonts/fb.ttf'])
+        assert lay_renderer._resolve_font_path('A') == '/fonts/a.ttf'
+        assert lay_renderer._resolve_font_path('B') == '/fonts/fb.ttf'
+        assert lay_renderer._resolve_font_path('') == '/fonts/fb.ttf'
+
+    def test_resolve_font_path_none_without_fonts(self, monkeypatch):
+        from core import lay_renderer
+
+        monkeypatch.setattr(lay_renderer, '_RESOLVED_FONT_MAP', {})
+        monkeypatch.setattr(lay_renderer, '_RESOLVED_FALLBACKS', [])
+        assert lay_renderer._resolve_font_path('A') is None
+
+    def test_unreadable_font_falls_through_to_next_candidate(self, monkeypatch):
+        """先頭候補が開けなくても、残りの候補を試してから組込みフォントにする。"""
+        from core import lay_renderer
+
+        monkeypatch.setattr(lay_renderer, '_RESOLVED_FONT_MAP', {'A': '/fonts/broken.ttf'})
+        monkeypatch.setattr(
+            lay_renderer, '_RESOLVED_FALLBACKS', ['/fonts/fb1.ttf', '/fonts/fb2.ttf'],
+        )
+        tried: list[str] = []
+        sentinel = object()
+
+        def fake_truetype(path, size_px):
+            tried.append(path)
+            if path == '/fonts/fb2.ttf':
+                return sentinel
+            raise OSError('cannot open resource')
+
+        monkeypatch.setattr(lay_renderer, '_truetype_cached', fake_truetype)
+        assert lay_renderer._load_font_cached('A', 12) is sentinel
+        assert tried == ['/fonts/broken.ttf', '/fonts/fb1.ttf', '/fonts/fb2.ttf']
+
+    def test_all_candidates_failing_uses_default_font(self, monkeypatch):
+        from core import lay_renderer
+
+        monkeypatch.setattr(lay_renderer, '_RESOLVED_FONT_MAP', {'A': '/fonts/a.ttc'})
+        monkeypatch.setattr(lay_renderer, '_RESOLVED_FALLBACKS', ['/fonts/fb.ttf'])
+
+        def failing(path, size_px):
+            raise IndexError('bad ttc index')
+
+        monkeypatch.setattr(lay_renderer, '_truetype_cached', failing)
+        assert lay_renderer._load_font_cached('A', 12) is lay_renderer._default_font()
+
+
+class TestBlitText:
+    """_blit_text（グリフマスクキャッシュ）のテスト。"""
+
+    @pytest.mark.parametrize(
+        'xy', [(3.0, 4.0), (3.25, 4.5), (-2.0, 5.0), (-2.25, 5.5), (7.9, 0.03)],
+    )
+    def test_matches_imagedraw_text(self, xy):
+        font = PILBackend(Image.new('RGB', (1, 1)))._load_font(12.0)
+        expected = Image.new('RGB', (80, 40), (255, 255, 255))
+        ImageDraw.Draw(expected).text(xy, 'Ag○', fill='#204060', font=font)
+        actual = Image.new('RGB', (80, 40), (255, 255, 255))
+        PILBackend(actual)._blit_text(xy[0], xy[1], 'Ag○', font, '#204060')
+        assert actual.tobytes() == expected.tobytes()
+
+    def test_mask_shared_between_colors(self):
+        from core import lay_renderer
+
+        backend = PILBackend(Image.new('RGB', (80, 40), (255, 255, 255)))
+        font = backend._load_font(12.0)
+        lay_renderer._clear_glyph_masks()
+        backend._blit_text(3, 4, '○○○', font, '#000000')
+        backend._blit_text(3, 20, '○○○', font, '#FF0000')
+        assert len(lay_renderer._glyph_masks) == 1
+
+    def test_cache_bounded_by_bytes(self, monkeypatch):
+        """マスクキャッシュは上限バイト数を超えたら古いものから捨てる。"""
+        from core import lay_renderer
+
+        backend = PILBackend(Image.new('RGB', (400, 40), (255, 255, 255)))
+        font = backend._load_font(12.0)
+        lay_renderer._clear_glyph_masks()
+        monkeypatch.setattr(lay_renderer, '_GLYPH_CACHE_MAX_BYTES', 4000)
+        for i in range(20):
+            backend._blit_text(3, 4, f'行{i:02d} ' * 3, font, '#000000')
+        assert 0 < len(lay_renderer._glyph_masks) < 20
+        assert lay_renderer._glyph_mask_bytes <= 4000
+        assert lay_renderer._glyph_mask_bytes == sum(
+            m.width * m.height for m, _ in lay_renderer._glyph_masks.values()
+        )
+        lay_renderer._clear_glyph_masks()
+
+
+class TestWrapLine:
+    """_wrap_line の折り返しテスト。"""
+
+    def _backend(self) -> PILBackend:
+        return PILBackend(Image.new('RGB', (10, 10)), dpi=150)
+
+    def test_short_line_not_wrapped(self):
+        backend = self._backend()
+        font = backend._load_font(10.0)
+        assert backend._wrap_line('abc', font, 1000.0) == ['abc']
+
+    def test_long_line_wrapped_within_width(self):
+        backend = self._backend()
+        font = backend._load_font(10.0)
+        text = 'abcdefghij' * 5
+        lines = backend._wrap_line(text, font, 80.0)
+        assert len(lines) > 1
+        assert ''.join(lines) == text
+        for line in lines[:-1]:
+            assert font.getlength(line) <= 80.0
+
+    def test_narrow_width_one_char_per_line(self):
+        """1 文字も入らない幅では 1 文字ずつ折り返す。"""
+        backend = self._backend()
+        font = backend._load_font(10.0)
+        assert backend._wrap_line('abcd', font, 1.0) == ['a', 'b', 'c', 'd']
+
+    def test_empty_line(self):
+        backend = self._backend()
+        font = backend._load_font(10.0)
+        assert backend._wrap_line('', font, 80.0) == ['']
+
+    def test_measure_matches_textbbox(self):
+        img = Image.new('RGB', (10, 10))
+        backend = PILBackend(img, dpi=150)
+        font = backend._load_font(10.0)
+        bbox = ImageDraw.Draw(img).textbbox((0, 0), 'Hello', font=font)
+        assert backend._measure(font, 'Hello') == (bbox[2] - bbox[0], bbox[3] - bbox[1])
+
+
+# ── 画像描画テスト ────────────────────────────────────────────────────────────
+
+
+def _png_bytes(size: tuple[int, int], color: tuple[int, int, int]) -> bytes:
+    from io import BytesIO
+
+    buf = BytesIO()
+    Image.new('RGB', size, color).save(buf, format='PNG')
+    return buf.getvalue()
+
+
+class TestDrawImage:
+    """PILBackend.draw_image のテスト。"""
+
+    def test_same_size_pasted_as_is(self):
+        img = Image.new('RGB', (50, 50), (255, 255, 255))
+        backend = PILBackend(img, dpi=150)
+        backend.draw_image(10, 10, 30, 30, _png_bytes((20, 20), (255, 0, 0)))
+        assert img.getpixel((15, 15)) == (255, 0, 0)
+        assert img.getpixel((35, 35)) == (255, 255, 255)
+
+    def test_resized_to_target_rect(self):
+        img = Image.new('RGB', (50, 50), (255, 255, 255))
+        backend = PILBackend(img, dpi=150)
+        backend.draw_image(0, 0, 40, 40, _png_bytes((10, 10), (0, 0, 255)))
+        assert img.getpixel((35, 35)) == (0, 0, 255)
+
+    def test_low_quality_resize(self):
+        img = Image.new('RGB', (50, 50), (255, 255, 255))
+        backend = PILBackend(img, dpi=150, high_quality=False)
+        backend.draw_image(0, 0, 40, 40, _png_bytes((10, 10), (0, 0, 255)))
+        assert img.getpixel((20, 20)) == (0, 0, 255)
+
+    def test_corrupt_data_ignored(self):
+        img = Image.new('RGB', (50, 50), (255, 255, 255))
+        backend = PILBackend(img, dpi=150)
+        backend.draw_image(0, 0, 40, 40, b'not an image')
+        assert (np.array(img) == 255).all()
+
+    def test_repeated_image_decoded_once(self, monkeypatch):
+        """同じ画像・サイズの繰り返し描画はデコード結果を再利用する。"""
+        from core import lay_renderer
+
+        lay_renderer._decode_image.cache_clear()
+        img = Image.new('RGB', (100, 50), (255, 255, 255))
+        backend = PILBackend(img, dpi=150)
+        data = _png_bytes((10, 10), (0, 255, 0))
+
+        opened: list[int] = []
+        real_open = Image.open
+
+        def counting_open(fp, *args, **kwargs):
+            opened.append(1)
+            return real_open(fp, *args, **kwargs)
+
+        monkeypatch.setattr(Image, 'open', counting_open)
+        for i in range(5):
+            backend.draw_image(i * 20, 0, i * 20 + 15, 15, data)
+        assert len(opened) == 1
+        assert img.getpixel((85, 5)) == (0, 255, 0)
+
+    def test_decode_shared_across_sizes_and_backends(self, monkeypatch):
+        """サイズ違い・別バックエンドでも同じ画像のデコードは 1 回。"""
+        from core import lay_renderer
+
+        lay_renderer._decode_image.cache_clear()
+        data = _png_bytes((10, 10), (0, 0, 255))
+        opened: list[int] = []
+        real_open = Image.open
+
+        def counting_open(fp, *args, **kwargs):
+            opened.append(1)
+            return real_open(fp, *args, **kwargs)
+
+        monkeypatch.setattr(Image, 'open', counting_open)
+        for size in (10, 20, 30):
+            backend = PILBackend(Image.new('RGB', (40, 40)), dpi=150)
+            backend.draw_image(0, 0, size, size, data)
+            assert backend._img.getpixel((size - 1, size - 1)) == (0, 0, 255)
+        assert len(opened) == 1
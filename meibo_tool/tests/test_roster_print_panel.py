@@ -13,6 +13,8 @@ from core.lay_renderer import (
     A4_HEIGHT,
     A4_WIDTH,
     calculate_page_arrangement,
+    render_layout_to_image,
+    render_tiled_layout_to_image,
     tile_layouts,
 )
 
@@ -328,3 +330,31 @@ class TestTileLayouts:
         page = result[0]
         assert page.objects[0].rect is not None
         assert page.objects[0].rect.top == expected_margin_y + small.objects[0].rect.top
+
+
+class TestRenderTiledLayoutToImage:
+    """render_tiled_layout_to_image のテスト。"""
+
+    def test_matches_rendered_tile_page(self) -> None:
+        """1 枚描画 + 貼り付けの結果がタイル配置ページの描画と一致する。"""
+        small = _make_small_lay(280, 100)
+        pages = tile_layouts([small] * 6, cols=2, rows=3)
+        expected = render_layout_to_image(pages[0], dpi=508)
+        actual = render_tiled_layout_to_image(small, cols=2, rows=3, dpi=508)
+        assert actual.size == expected.size
+        assert actual.tobytes() == expected.tobytes()
+
+    def test_scaled_tiles_match_tile_layouts(self) -> None:
+        """縮小配置は tile_layouts で縮小したページの描画と一致する。"""
+        small = _make_small_lay(280, 100)
+        pages = tile_layouts([small] * 6, cols=2, rows=3, scale=0.5)
+        expected = render_layout_to_image(pages[0], dpi=150)
+        actual = render_tiled_layout_to_image(small, cols=2, rows=3, dpi=150, scale=0.5)
+        assert actual.tobytes() == expected.tobytes()
+
+    def test_scaled_tiles_fit_page(self) -> None:
+        """縮小配置でもページサイズの画像を返す。"""
+        lay = _make_lay()
+        img = render_tiled_layout_to_image(lay, cols=2, rows=1, dpi=72, scale=0.4)
+        page = render_layout_to_image(LayFile(page_width=A4_WIDTH, page_height=A4_HEIGHT), dpi=72)
+        assert img.size == page.size
@@ -104,6 +104,12 @@ class TestDetectStudents:
         assert len(detect_special_needs_students(df)) == 1
         assert detect_regular_students(df).empty
 
+    def test_missing_and_fullwidth_kumi_are_regular(self):
+        """空欄・全角数字の組は通常学級として扱う（is_special_needs_class と同じ）。"""
+        df = pd.DataFrame({'組': ['２', None, '', ' 3 ', 'なかよし'], '氏名': list('ABCDE')})
+        assert list(detect_special_needs_students(df)['氏名']) == ['E']
+        assert list(detect_regular_students(df)['氏名']) == ['A', 'B', 'C', 'D']
+
     def test_no_kumi_column(self):
         df = pd.DataFrame([{'学年': '1', '氏名': 'A'}])
         assert detect_special_needs_students(df).empty
@@ -123,6 +129,10 @@ class TestGetSpecialNeedsClasses:
         result = get_special_needs_classes(df)
         assert result == ['なかよし', 'ひまわり']
 
+    def test_missing_kumi_ignored(self):
+        df = pd.DataFrame({'組': ['なかよし', None, 'ひまわり', 'なかよし']})
+        assert get_special_needs_classes(df) == ['なかよし', 'ひまわり']
+
     def test_no_special(self):
         df = pd.DataFrame([{'組': '1'}, {'組': '2'}])
         assert get_special_needs_classes(df) == []
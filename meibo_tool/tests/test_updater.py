@@ -6,11 +6,14 @@ import hashlib
 import zipfile
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from core.updater import (
     _parse_version,
     check_for_update,
     compute_local_manifest,
     diff_manifests,
+    download_release_asset,
     extract_changed_files,
     is_newer,
 )
@@ -20,13 +23,26 @@ from core.updater import (
 
 class TestParseVersion:
     def test_simple(self):
-        assert _parse_version('1.2.3') == (1, 2, 3)
+        assert _parse_version('1.2.3')[0] == (1, 2, 3)
 
     def test_with_v_prefix(self):
-        assert _parse_version('v1.2.3') == (1, 2, 3)
+        assert _parse_version('v1.2.3') == _parse_version('1.2.3')
 
     def test_two_parts(self):
-        assert _parse_version('1.0') == (1, 0)
+        assert _parse_version('1.0')[0] == (1,)
+
+    def test_trailing_zeros_equal(self):
+        assert _parse_version('1.3') == _parse_version('1.3.0')
+
+    def test_build_metadata_ignored(self):
+        assert _parse_version('1.2.3+build.5') == _parse_version('1.2.3')
+
+    def test_prerelease_sorts_before_final(self):
+        assert _parse_version('v1.2.3-rc1') < _parse_version('1.2.3')
+
+    def test_invalid_raises(self):
+        with pytest.raises(ValueError):
+            _parse_version('1.2.x')
 
 
 class TestIsNewer:
@@ -48,6 +64,21 @@ class TestIsNewer:
     def test_with_v_prefix(self):
         assert is_newer('v1.1.0', '1.0.0') is True
 
+    def test_prerelease_tag(self):
+        assert is_newer('v1.1.0-rc1', '1.0.0') is True
+        assert is_newer('1.0.0-rc1', '1.0.0') is False
+
+    def test_final_newer_than_its_prerelease(self):
+        assert is_newer('1.3.0', '1.3.0-rc1') is True
+
+    def test_prerelease_order(self):
+        assert is_newer('1.3.0-rc2', '1.3.0-rc1') is True
+        assert is_newer('1.3.0rc1', '1.3.0b2') is True
+        assert is_newer('1.3.0a1', '1.3.0.dev1') is True
+
+    def test_post_release_newer_than_final(self):
+        assert is_newer('1.3.0.post1', '1.3.0') is True
+
     def test_invalid_remote(self):
         assert is_newer('invalid', '1.0.0') is False
 
@@ -105,7 +136,7 @@ def _mock_release_response(
 
 class TestCheckForUpdate:
     @patch('core.updater.save_config')
-    @patch('core.updater.requests.get')
+    @patch('core.updater._session.get')
     def test_new_version_available(self, mock_get, mock_save):
         mock_get.return_value = _mock_release_response('v1.1.0')
         config = _make_config()
@@ -118,7 +149,7 @@ class TestCheckForUpdate:
         assert result.release_notes == 'release notes'
         assert result.asset_url.endswith('app.zip')
 
-    @patch('core.updater.requests.get')
+    @patch('core.updater._session.get')
     def test_same_version_returns_none(self, mock_get):
         mock_get.return_value = _mock_release_response('v1.0.0')
         config = _make_config()
@@ -126,7 +157,7 @@ class TestCheckForUpdate:
         result = check_for_update(config)
         assert result is None
 
-    @patch('core.updater.requests.get')
+    @patch('core.updater._session.get')
     def test_older_version_returns_none(self, mock_get):
         mock_get.return_value = _mock_release_response('v0.9.0')
         config = _make_config()
@@ -134,7 +165,7 @@ class TestCheckForUpdate:
         result = check_for_update(config)
         assert result is None
 
-    @patch('core.updater.requests.get')
+    @patch('core.updater._session.get')
     def test_skip_version(self, mock_get):
         mock_get.return_value = _mock_release_response('v1.1.0')
         config = _make_config(skip_version='v1.1.0')
@@ -152,7 +183,7 @@ class TestCheckForUpdate:
         result = check_for_update(config)
         assert result is None
 
-    @patch('core.updater.requests.get')
+    @patch('core.updater._session.get')
     def test_network_error_returns_none(self, mock_get):
         import requests as req
         mock_get.side_effect = req.ConnectionError('offline')
@@ -161,7 +192,7 @@ class TestCheckForUpdate:
         result = check_for_update(config)
         assert result is None
 
-    @patch('core.updater.requests.get')
+    @patch('core.updater._session.get')
     def test_no_zip_asset_returns_none(self, mock_get):
         resp = MagicMock()
         resp.raise_for_status.return_value = None
@@ -180,7 +211,7 @@ class TestCheckForUpdate:
         assert result is None
 
     @patch('core.updater.save_config')
-    @patch('core.updater.requests.get')
+    @patch('core.updater._session.get')
     def test_updates_last_check_time(self, mock_get, mock_save):
         mock_get.return_value = _mock_release_response('v1.1.0')
         config = _make_config()
@@ -190,7 +221,7 @@ class TestCheckForUpdate:
         assert config['update']['last_check_time'] != ''
 
     @patch('core.updater.save_config')
-    @patch('core.updater.requests.get')
+    @patch('core.updater._session.get')
     def test_manifest_url_included(self, mock_get, mock_save):
         mock_get.return_value = _mock_release_response('v1.1.0', include_manifest=True)
         config = _make_config()
@@ -201,7 +232,7 @@ class TestCheckForUpdate:
         assert 'manifest.json' in result.manifest_url
 
     @patch('core.updater.save_config')
-    @patch('core.updater.requests.get')
+    @patch('core.updater._session.get')
     def test_manifest_url_none_when_missing(self, mock_get, mock_save):
         mock_get.return_value = _mock_release_response('v1.1.0', include_manifest=False)
         config = _make_config()
@@ -210,6 +241,124 @@ class TestCheckForUpdate:
         assert result is not None
         assert result.manifest_url is None
 
+    @patch('core.updater.save_config')
+    @patch('core.updater._session.get')
+    def test_stores_etag_when_no_update(self, mock_get, mock_save):
+        resp = _mock_release_response('v1.0.0')
+        resp.headers = {'ETag': '"abc"'}
+        mock_get.return_value = resp
+        config = _make_config()
+
+        assert check_for_update(config) is None
+        assert config['update']['last_etag'] == '"abc"'
+        assert config['update']['last_etag_version'] == '1.0.0'
+        assert config['update']['last_etag_skip'] == ''
+        mock_save.assert_called_once()
+
+    @patch('core.updater.save_config')
+    @patch('core.updater._session.get')
+    def test_skipped_release_does_not_store_etag(self, mock_get, mock_save):
+        resp = _mock_release_response('v1.1.0')
+        resp.headers = {'ETag': '"abc"'}
+        mock_get.return_value = resp
+        config = _make_config(skip_version='v1.1.0')
+
+        assert check_for_update(config) is None
+        assert 'last_etag' not in config['update']
+        mock_save.assert_not_called()
+
+    @patch('core.updater.save_config')
+    @patch('core.updater._session.get')
+    def test_etag_ignored_after_app_version_changes(self, mock_get, mock_save):
+        mock_get.return_value = _mock_release_response('v1.0.0')
+        config = _make_config(
+            current_app_version='1.0.1',
+            last_etag='"abc"', last_etag_version='1.0.0', last_etag_skip='',
+        )
+
+        check_for_update(config)
+        assert 'If-None-Match' not in mock_get.call_args.kwargs['headers']
+
+    @patch('core.updater.save_config')
+    @patch('core.updater._session.get')
+    def test_etag_ignored_after_skip_version_changes(self, mock_get, mock_save):
+        mock_get.return_value = _mock_release_response('v1.0.0')
+        config = _make_config(
+            skip_version='v1.1.0',
+            last_etag='"abc"', last_etag_version='1.0.0', last_etag_skip='',
+        )
+
+        check_for_update(config)
+        assert 'If-None-Match' not in mock_get.call_args.kwargs['headers']
+
+    @patch('core.updater._session.get')
+    def test_not_modified_returns_none(self, mock_get):
+        resp = MagicMock()
+        resp.status_code = 304
+        mock_get.return_value = resp
+        config = _make_config(
+            last_etag='"abc"', last_etag_version='1.0.0', last_etag_skip='',
+        )
+
+        assert check_for_update(config) is None
+        headers = mock_get.call_args.kwargs['headers']
+        assert headers['If-None-Match'] == '"abc"'
+        resp.json.assert_not_called()
+
+    @patch('core.updater.save_config')
+    @patch('core.updater._session.get')
+    def test_update_found_clears_etag(self, mock_get, mock_save):
+        resp = _mock_release_response('v1.1.0')
+        resp.headers = {'ETag': '"new"'}
+        mock_get.return_value = resp
+        config = _make_config(
+            last_etag='"old"', last_etag_version='1.0.0', last_etag_skip='',
+        )
+
+        assert check_for_update(config) is not None
+        assert config['update']['last_etag'] == ''
+        assert config['update']['last_etag_version'] == ''
+
+    def test_session_reuses_connections_with_retry(self):
+        from core.updater import _session
+
+        adapter = _session.get_adapter('https://api.github.com/repos')
+        assert adapter.max_retries.total == 2
+        assert 503 in adapter.max_retries.status_forcelist
+
+
+# ── download_release_asset テスト ────────────────────────────────────────────
+
+
+class TestDownloadReleaseAsset:
+    @patch('core.updater._session.get')
+    def test_writes_file_and_reports_progress(self, mock_get, tmp_path):
+        resp = MagicMock()
+        resp.headers = {'content-length': '8'}
+        resp.iter_content.return_value = [b'abcd', b'efgh']
+        mock_get.return_value = resp
+        progress: list[float] = []
+        dest = tmp_path / 'app.zip'
+
+        download_release_asset('https://example.com/app.zip', str(dest), progress.append)
+
+        assert dest.read_bytes() == b'abcdefgh'
+        assert progress == [0.5, 1.0]
+
+    @patch('core.updater._session.get')
+    def test_unknown_size_skips_progress(self, mock_get, tmp_path):
+        resp = MagicMock()
+        resp.headers = {}
+        resp.iter_content.return_value = [b'abcd']
+        mock_get.return_value = resp
+        progress: list[float] = []
+        dest = tmp_path / 'app.zip'
+
+        download_release_asset('https://example.com/app.zip', str(dest), progress.append)
+
+        assert dest.read_bytes() == b'abcd'
+        assert progress == []
+
 
 # ── diff_manifests テスト ────────────────────────────────────────────────────
 
@@ -306,6 +455,74 @@ class TestComputeLocalManifest:
         result = compute_local_manifest(str(tmp_path))
         assert result == {}
 
+    def test_fallback_without_file_digest(self, tmp_path, monkeypatch):
+        """hashlib.file_digest がない Python 3.10 でも同じハッシュになる。"""
+        data = bytes(range(256)) * 5000  # バッファ (1 MiB) を跨ぐサイズ
+        (tmp_path / 'big.bin').write_bytes(data)
+        monkeypatch.delattr(hashlib, 'file_digest', raising=False)
+
+        result = compute_local_manifest(str(tmp_path))
+
+        assert result['big.bin'] == {
+            'sha256': hashlib.sha256(data).hexdigest(),
+            'size': len(data),
+        }
+
+    def test_many_files_keep_paths(self, tmp_path):
+        """並列ハッシュでも各パスに正しいハッシュが対応する。"""
+        sub = tmp_path / '_internal'
+        sub.mkdir()
+        expected = {}
+        for i in range(40):
+            data = f'file-{i}'.encode() * (i + 1)
+            (sub / f'f{i}.bin').write_bytes(data)
+            expected[f'_internal/f{i}.bin'] = {
+                'sha256': hashlib.sha256(data).hexdigest(),
+                'size': len(data),
+            }
+
+        assert compute_local_manifest(str(tmp_path)) == expected
+
+    def test_reuses_cached_hash_when_unchanged(self, tmp_path):
+        (tmp_path / 'app.exe').write_bytes(b'hello')
+        first = compute_local_manifest(str(tmp_path))
+        assert (tmp_path / '_manifest_cache.json').exists()
+
+        with patch('core.updater._hash_file', side_effect=AssertionError):
+            second = compute_local_manifest(str(tmp_path))
+
+        assert second == first
+        assert '_manifest_cache.json' not in second
+
+    def test_rehashes_modified_file(self, tmp_path):
+        target = tmp_path / 'app.exe'
+        target.write_bytes(b'hello')
+        compute_local_manifest(str(tmp_path))
+
+        target.write_bytes(b'hello, world')
+        result = compute_local_manifest(str(tmp_path))
+
+        assert result['app.exe'] == {
+            'sha256': hashlib.sha256(b'hello, world').hexdigest(),
+            'size': 12,
+        }
+
+    def test_leftover_cache_tmp_is_not_hashed(self, tmp_path):
+        (tmp_path / 'app.exe').write_bytes(b'hello')
+        (tmp_path / '_manifest_cache.json.tmp').write_text('{', encoding='utf-8')
+
+        result = compute_local_manifest(str(tmp_path))
+
+        assert list(result) == ['app.exe']
+
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        (tmp_path / 'app.exe').write_bytes(b'hello')
+        (tmp_path / '_manifest_cache.json').write_text('{broken', encoding='utf-8')
+
+        result = compute_local_manifest(str(tmp_path))
+
+        assert result['app.exe']['sha256'] == hashlib.sha256(b'hello').hexdigest()
+
 
 # ── extract_changed_files テスト ─────────────────────────────────────────────
 
@@ -359,3 +576,16 @@ class TestExtractChangedFiles:
         )
 
         assert (staging / '_internal' / 'sub' / 'deep.dll').read_bytes() == b'deep_data'
+
+    def test_large_deflated_member(self, tmp_path):
+        data = bytes(range(256)) * 1024  # 256 KiB
+        zip_path = tmp_path / 'release.zip'
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr('app/_internal/big.dll', data)
+
+        staging = tmp_path / 'staging'
+        staging.mkdir()
+
+        extract_changed_files(str(zip_path), str(staging), ['_internal/big.dll'])
+
+        assert (staging / '_internal' / 'big.dll').read_bytes() == data
@@ -6,6 +6,7 @@ PIL 画像ベース印刷エンジンのロジックをモックでテストす
 
 from __future__ import annotations
 
+import struct
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -241,6 +242,132 @@ class TestPrintJobMock:
             assert job._hdc is None
 
 
+class TestPrintPages:
+    """PrintJob.print_pages のテスト（ラスタライズのみ実行し GDI はモック）。"""
+
+    def _make_job(self, dpi: int = 30) -> object:
+        from core.win_printer import PrintJob
+
+        job = PrintJob.__new__(PrintJob)
+        job._printer_name = 'TestPrinter'
+        job._dc = MagicMock()
+        job._hdc = None
+        job._dpi_x = dpi
+        job._dpi_y = dpi
+        job._started = True
+        return job
+
+    def test_parallel_pages_blitted_in_order(self) -> None:
+        from core.lay_renderer import render_layout_to_image
+        from core.win_printer import _pack_bgrx
+
+        lays = [
+            _make_layout(new_label(10, 20, 200 + i * 100, 50, text=f'P{i}'))
+            for i in range(4)
+        ]
+        progress: list[tuple[int, int]] = []
+        job = self._make_job()
+
+        with patch('core.win_printer._blit_bits') as mock_blit:
+            job.print_pages(
+                lays, progress_cb=lambda done, n: progress.append((done, n)),
+                max_workers=2,
+            )
+
+        expected = [
+            _pack_bgrx(render_layout_to_image(lay, dpi=30, for_print=True))
+            for lay in lays
+        ]
+        blitted = [c.args[1:4] for c in mock_blit.call_args_list]
+        assert blitted == expected
+        assert job._dc.StartPage.call_count == 4
+        assert job._dc.EndPage.call_count == 4
+        assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+    def test_parallel_pages_use_registry(self) -> None:
+        from core.lay_parser import MeiboArea
+        from core.lay_renderer import render_layout_to_image
+        from core.win_printer import _pack_bgrx
+
+        ref = _make_layout(new_label(10, 10, 300, 40, text='REF'))
+        meibo = LayoutObject(
+            obj_type=ObjectType.MEIBO,
+            meibo=MeiboArea(
+                origin_x=100, origin_y=200, cell_width=300, cell_height=50,
+                row_count=2, ref_name='ref',
+            ),
+        )
+        lays = [_make_layout(meibo) for _ in range(4)]
+        registry = {'ref': ref}
+        job = self._make_job()
+
+        with patch('core.win_printer._blit_bits') as mock_blit:
+            job.print_pages(lays, layout_registry=registry, max_workers=2)
+
+        expected = _pack_bgrx(render_layout_to_image(
+            lays[0], dpi=30, for_print=True, layout_registry=registry,
+        ))
+        unresolved = _pack_bgrx(render_layout_to_image(lays[0], dpi=30, for_print=True))
+        assert expected != unresolved
+        assert [c.args[1:4] for c in mock_blit.call_args_list] == [expected] * 4
+
+    def test_small_job_uses_print_page(self) -> None:
+        lays = [_make_layout() for _ in range(3)]
+        job = self._make_job()
+
+        with patch.object(type(job), 'print_page') as mock_page:
+            job.print_pages(lays, max_workers=2)
+
+        assert mock_page.call_count == 3
+
+    def test_single_worker_uses_print_page(self) -> None:
+        lays = [_make_layout(), _make_layout()]
+        job = self._make_job()
+
+        with patch.object(type(job), 'print_page') as mock_page:
+            job.print_pages(lays, max_workers=1)
+
+        assert mock_page.call_count == 2
+
+    def test_not_started_raises(self) -> None:
+        job = self._make_job()
+        job._started = False
+        with pytest.raises(RuntimeError, match='start'):
+            job.print_pages([_make_layout()])
+
+
+# ── DevMode キャッシュ テスト ────────────────────────────────────────────────
+
+
+class TestDevmodeCache:
+    """_get_devmode のテスト。"""
+
+    def test_reuses_devmode_per_printer_paper_orientation(self) -> None:
+        from core.win_printer import _get_devmode, clear_devmode_cache
+
+        clear_devmode_cache()
+        with patch(
+            'core.win_printer._create_devmode',
+            side_effect=lambda *args: object(),
+        ) as mock_create:
+            first = _get_devmode('P', 'A4', 'portrait')
+            assert _get_devmode('P', 'A4', 'portrait') is first
+            assert _get_devmode('P', 'A4', 'landscape') is not first
+            assert mock_create.call_count == 2
+        clear_devmode_cache()
+
+    def test_failure_not_cached(self) -> None:
+        from core.win_printer import _get_devmode, clear_devmode_cache
+
+        clear_devmode_cache()
+        with patch(
+            'core.win_printer._create_devmode', return_value=None,
+        ) as mock_create:
+            assert _get_devmode('P') is None
+            assert _get_devmode('P') is None
+            assert mock_create.call_count == 2
+
+
 # ── _blit_pil_image テスト ──────────────────────────────────────────────────
 
 
@@ -280,8 +407,8 @@ class TestBlitPilImage:
             assert args[7] == 10     # wSrc
             assert args[8] == 10     # hSrc
 
-    def test_stride_padding(self) -> None:
-        """幅が 4 バイト境界でない場合パディングされる。"""
+    def test_32bpp_rows_need_no_padding(self) -> None:
+        """32bpp DIB なので幅によらず 1 行 = 幅 × 4 バイト。"""
         from core.win_printer import HAS_WIN32
         if not HAS_WIN32:
             pytest.skip('pywin32 未インストール')
@@ -290,7 +417,7 @@ class TestBlitPilImage:
 
         from core.win_printer import _blit_pil_image
 
-        # 幅 5px → stride = (5*3+3)&~3 = 16 (padding=1)
+        # 幅 5px → 24bpp ならパディングが要る幅
         img = Image.new('RGB', (5, 2), (255, 0, 0))
 
         mock_dc = MagicMock()
@@ -306,8 +433,58 @@ class TestBlitPilImage:
             mock_gdi32.StretchDIBits.assert_called_once()
             args = mock_gdi32.StretchDIBits.call_args[0]
             bits = args[9]
-            # stride=16, 2行 → 32バイト
-            assert len(bits) == 32
+            # 5px × 4バイト × 2行 → 40バイト
+            assert len(bits) == 40
+            bih = args[10]
+            assert struct.unpack_from('<H', bih, 14)[0] == 32  # biBitCount
+
+    def test_pixels_are_bgrx(self) -> None:
+        """各画素は B, G, R, 0 の順に並ぶ。"""
+        from core.win_printer import HAS_WIN32
+        if not HAS_WIN32:
+            pytest.skip('pywin32 未インストール')
+
+        from PIL import Image
+
+        from core.win_printer import _blit_pil_image
+
+        img = Image.new('RGB', (5, 2), (1, 2, 3))
+
+        mock_dc = MagicMock()
+        mock_dc.GetSafeHdc.return_value = 99999
+        mock_dc.GetDeviceCaps.return_value = 100
+
+        with patch('core.win_printer.ctypes') as mock_ctypes:
+            mock_gdi32 = MagicMock()
+            mock_ctypes.windll.gdi32 = mock_gdi32
+
+            _blit_pil_image(mock_dc, img, 300, 300)
+
+            bits = mock_gdi32.StretchDIBits.call_args[0][9]
+            assert bits == b'\x03\x02\x01\x00' * 10
+
+    def test_rgb_image_not_converted(self) -> None:
+        """RGB 画像は convert() で全画素コピーしない。"""
+        from core.win_printer import HAS_WIN32
+        if not HAS_WIN32:
+            pytest.skip('pywin32 未インストール')
+
+        from PIL import Image
+
+        from core.win_printer import _blit_pil_image
+
+        img = Image.new('RGB', (4, 2), (1, 2, 3))
+        mock_dc = MagicMock()
+        mock_dc.GetSafeHdc.return_value = 99999
+        mock_dc.GetDeviceCaps.return_value = 100
+
+        with (
+            patch('core.win_printer.ctypes'),
+            patch.object(Image.Image, 'convert') as mock_convert,
+        ):
+            _blit_pil_image(mock_dc, img, 300, 300)
+
+        mock_convert.assert_not_called()
 
 
 # ── fill + print 統合テスト ──────────────────────────────────────────────────